@@ -0,0 +1,293 @@
+"""
+Compressed Sparse Row (CSR) Graph — array-backed adjacency for large graphs.
+
+Reference: dsa.md § Graph Representation (adjacency list vs matrix)
+
+Key insight:
+  - A dict-of-lists adjacency {u: [(v, w), ...]} costs a list object per
+    node plus a tuple and two int objects per edge — roughly 100+ bytes
+    per edge on CPython.
+  - CSR packs the same graph into three flat typed buffers:
+        offsets[u] .. offsets[u+1]  = slice of u's out-edges
+        targets[i]                  = head of edge i
+        weights[i]                  = weight of edge i
+    That is 16 bytes per edge (8 for the target, 8 for the weight) plus
+    8 bytes per node, with no per-edge Python objects at all.
+  - Nodes are dense integer ids 0..n-1. A node with no out-edges simply
+    has offsets[u] == offsets[u+1].
+
+Consumers that accept a CSRGraph directly:
+  - shortest_paths.dijkstra / shortest_paths.network_delay_time
+  - mst.prim
+  - topological_sort.topological_sort_kahn
+
+Process pools: share() copies the buffers into multiprocessing RawArrays
+and attach() rebuilds a CSRGraph over them in a worker, so every worker
+reads one copy of the graph instead of unpickling its own.
+"""
+from array import array
+from multiprocessing.sharedctypes import RawArray
+
+from termcolor import colored
+
+
+def typed_view(buf) -> memoryview:
+    """
+    Flat typed memoryview of an array or RawArray. Indexing a RawArray goes
+    through ctypes; the view reads the same memory at array speed.
+    """
+    view = memoryview(buf)
+    return view.cast('B').cast(view.format[-1])
+
+
+def _shared_copy(buf):
+    """RawArray holding a copy of buf (same item type), copied in bulk."""
+    src = typed_view(buf)
+    raw = RawArray(src.format, len(src))
+    typed_view(raw)[:] = src
+    return raw
+
+
+class CSRGraph:
+    """
+    Directed graph in Compressed Sparse Row form.
+
+    T: O(V + E) build, O(1) to locate a node's edge slice
+    S: O(V + E) — three typed arrays, no per-edge objects
+
+    Real-world analogy: a road atlas index — one table of page offsets per
+    town, and one long table of roads sorted by origin town.
+
+    Attributes:
+        n:       number of nodes (ids 0..n-1)
+        offsets: array('q') of length n+1; u's edges are offsets[u]..offsets[u+1]-1
+        targets: array('q') of length E; edge heads
+        weights: array('q') or array('d') of length E, or None for an
+                 unweighted graph (e.g. a DAG for topological sort)
+
+    Example:
+        >>> g = CSRGraph.from_adjacency({0: [(1, 4), (2, 1)], 1: [(3, 1)], 2: [], 3: []})
+        >>> g.n, g.num_edges
+        (4, 3)
+        >>> list(g.neighbours(0))
+        [(1, 4), (2, 1)]
+    """
+
+    __slots__ = ("n", "offsets", "targets", "weights")
+
+    def __init__(self, n: int, offsets: array, targets: array, weights: array | None = None):
+        if len(offsets) != n + 1:
+            raise ValueError("offsets must have length n + 1")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights and targets must have the same length")
+        self.n = n
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    # -- construction -------------------------------------------------------
+    @classmethod
+    def from_edges(cls, n: int, edges, weighted: bool = True) -> "CSRGraph":
+        """
+        Build from an iterable of (u, v, w) — or (u, v) if weighted=False.
+
+        Counting sort by source: one pass to count out-degrees, a prefix sum
+        for offsets, then a second pass to scatter edges into place.
+
+        T: O(V + E)  S: O(V + E)
+        """
+        edges = edges if isinstance(edges, (list, tuple)) else list(edges)
+        degree = array('q', bytes(8 * (n + 1)))
+        float_weights = False
+        for e in edges:
+            degree[e[0] + 1] += 1
+            if weighted and isinstance(e[2], float):
+                float_weights = True
+
+        offsets = degree  # prefix sum in place: offsets[u+1] = sum(deg[0..u])
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+
+        m = offsets[n]
+        targets = array('q', bytes(8 * m))
+        weights = array('d' if float_weights else 'q', bytes(8 * m)) if weighted else None
+        cursor = array('q', offsets[:n])  # next free slot per source
+        for e in edges:
+            u = e[0]
+            i = cursor[u]
+            targets[i] = e[1]
+            if weighted:
+                weights[i] = e[2]
+            cursor[u] = i + 1
+        return cls(n, offsets, targets, weights)
+
+    @classmethod
+    def from_adjacency(cls, graph: dict, n: int | None = None) -> "CSRGraph":
+        """
+        Convert the repo's dict adjacency format to CSR.
+
+        Accepts both weighted {u: [(v, w), ...]} and unweighted {u: [v, ...]}
+        lists. Node ids must be non-negative ints; n defaults to
+        max(node id) + 1, so ids that are missing as keys get empty rows.
+
+        T: O(V + E)  S: O(V + E)
+        """
+        if n is None:
+            n = 0
+            for u, adj in graph.items():
+                n = max(n, u + 1)
+                for e in adj:
+                    n = max(n, (e[0] if isinstance(e, tuple) else e) + 1)
+
+        # An edgeless graph is ambiguous; an empty weight buffer keeps it usable by
+        # weighted algorithms and costs nothing
+        weighted = (any(isinstance(e, tuple) for adj in graph.values() for e in adj[:1])
+                    or not any(graph.values()))
+        if weighted:
+            edges = [(u, v, w) for u, adj in graph.items() for v, w in adj]
+        else:
+            edges = [(u, v) for u, adj in graph.items() for v in adj]
+        return cls.from_edges(n, edges, weighted=weighted)
+
+    def to_adjacency(self) -> dict:
+        """Inverse of from_adjacency — every node 0..n-1 appears as a key."""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        if weights is None:
+            return {u: list(targets[offsets[u]:offsets[u + 1]]) for u in range(self.n)}
+        return {
+            u: list(zip(targets[offsets[u]:offsets[u + 1]], weights[offsets[u]:offsets[u + 1]]))
+            for u in range(self.n)
+        }
+
+    def reversed(self) -> "CSRGraph":
+        """Return the transpose graph (every edge u→v becomes v→u). T: O(V + E)"""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        if weights is None:
+            edges = [(targets[i], u) for u in range(self.n)
+                     for i in range(offsets[u], offsets[u + 1])]
+            return CSRGraph.from_edges(self.n, edges, weighted=False)
+        edges = [(targets[i], u, weights[i]) for u in range(self.n)
+                 for i in range(offsets[u], offsets[u + 1])]
+        return CSRGraph.from_edges(self.n, edges)
+
+    # -- process pools ------------------------------------------------------
+    def share(self) -> tuple:
+        """
+        (n, offsets, targets, weights) with the buffers copied into shared
+        memory — pass it as a pool initializer's args and rebuild the graph
+        in each worker with CSRGraph.attach(*shared). T: O(V + E), one copy
+        """
+        weights = None if self.weights is None else _shared_copy(self.weights)
+        return self.n, _shared_copy(self.offsets), _shared_copy(self.targets), weights
+
+    @classmethod
+    def attach(cls, n: int, offsets, targets, weights=None) -> "CSRGraph":
+        """Worker side of share(): a read-only graph over the shared buffers, no copy."""
+        return cls(n, typed_view(offsets), typed_view(targets),
+                   None if weights is None else typed_view(weights))
+
+    # -- queries ------------------------------------------------------------
+    def __len__(self) -> int:
+        return self.n
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def degree(self, u: int) -> int:
+        """Out-degree of u. T: O(1)"""
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def neighbours(self, u: int):
+        """
+        Yield u's out-edges as (v, w), or just v for an unweighted graph.
+
+        Slicing an array copies the raw machine values in C, so iterating
+        a slice is cheaper than indexing the buffers once per edge.
+        """
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        if self.weights is None:
+            return iter(self.targets[lo:hi])
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    def require_weights(self, caller: str) -> None:
+        """Raise ValueError unless the graph is weighted — guard for weighted algorithms."""
+        if self.weights is None:
+            raise ValueError(f"{caller} needs a weighted CSRGraph, got weights=None "
+                             f"(build it with (u, v, w) edges and weighted=True)")
+
+    def nbytes(self) -> int:
+        """Bytes held by the three buffers (excluding the small object headers)."""
+        total = self.offsets.itemsize * len(self.offsets)
+        total += self.targets.itemsize * len(self.targets)
+        if self.weights is not None:
+            total += self.weights.itemsize * len(self.weights)
+        return total
+
+    def __repr__(self) -> str:
+        return f"CSRGraph(n={self.n}, edges={self.num_edges})"
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    import random
+    import tracemalloc
+
+    # Round-trip through the dict format
+    g = {0: [(1, 4), (2, 1)], 1: [(3, 1)], 2: [(1, 2), (3, 5)], 3: []}
+    csr = CSRGraph.from_adjacency(g)
+    assert csr.n == 4 and csr.num_edges == 5
+    assert list(csr.offsets) == [0, 2, 3, 5, 5]
+    assert csr.to_adjacency() == g
+    assert list(csr.neighbours(2)) == [(1, 2), (3, 5)]
+    assert csr.degree(3) == 0
+    assert csr.reversed().to_adjacency() == {0: [], 1: [(0, 4), (2, 2)], 2: [(0, 1)],
+                                             3: [(1, 1), (2, 5)]}
+    print(colored("✓ CSRGraph.from_adjacency round-trip", "green"))
+
+    # share() / attach(): shared-memory buffers read back as the same graph
+    shared = CSRGraph.attach(*csr.share())
+    assert shared.to_adjacency() == g and shared.nbytes() == csr.nbytes()
+    fshared = CSRGraph.attach(*CSRGraph.from_edges(2, [(0, 1, 0.5)]).share())
+    assert list(fshared.neighbours(0)) == [(1, 0.5)]
+    unweighted = CSRGraph.from_edges(2, [(0, 1)], weighted=False)
+    assert CSRGraph.attach(*unweighted.share()).weights is None
+    print(colored("✓ CSRGraph share / attach", "green"))
+
+    # Unweighted DAG and sparse labels (missing keys get empty rows)
+    dag = CSRGraph.from_adjacency({0: [1, 2], 1: [3], 2: [3]})
+    assert dag.weights is None and dag.n == 4
+    assert list(dag.neighbours(0)) == [1, 2]
+    try:
+        dag.require_weights("dijkstra")
+        assert False, "Should have raised"
+    except ValueError:
+        pass
+    print(colored("✓ CSRGraph unweighted", "green"))
+
+    # Float weights switch the weight buffer to doubles
+    fg = CSRGraph.from_edges(2, [(0, 1, 0.5)])
+    assert fg.weights.typecode == 'd'
+    print(colored("✓ CSRGraph float weights", "green"))
+
+    # Memory: CSR vs dict-of-lists on a random sparse graph (measured allocations)
+    random.seed(0)
+    n, m = 20_000, 200_000
+    tracemalloc.start()
+    adj: dict[int, list[tuple[int, int]]] = {u: [] for u in range(n)}
+    for _ in range(m):
+        adj[random.randrange(n)].append((random.randrange(n), random.randint(1, 100)))
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    big = CSRGraph.from_adjacency(adj)
+    csr_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert big.num_edges == m and big.nbytes() <= csr_bytes
+    ratio = dict_bytes / csr_bytes
+    assert ratio >= 5
+    print(colored(f"✓ CSRGraph memory: {ratio:.1f}x smaller than dict adjacency", "green"))
+
+    print(colored("\nAll tests passed.", "cyan"))
@@ -18,37 +18,33 @@ Patterns covered:
   2. Prim's Algorithm             — vertex-based, min-heap
   3. Min Cost to Connect All Points — LeetCode 1584 (Prim's on implicit graph)
   4. Optimize Water Distribution  — LeetCode 1168 (virtual node + Kruskal's)
+  5. Manhattan MST                — O(n log n) octant sweep with a Fenwick tree
+  6. Dense Prim                   — O(n²) array Prim, NumPy-vectorized updates
+  7. External-Memory Kruskal      — on-disk edges, chunked merge sort, streaming MST
+  8. Borůvka's Algorithm          — O(log V) rounds, cheapest-edge scan across processes
+  9. WaterSupplyPlanner           — LeetCode 1168 kept up to date under cost changes
 """
 
 import heapq
+import os
+import struct
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.sharedctypes import RawArray
 
 from termcolor import colored
 
+from csr_graph import CSRGraph, typed_view
+from priority_queues import IndexedMinHeap
+from union_find import UnionFind  # shared array-backed Union-Find
 
-# ---------------------------------------------------------------------------
-# Union-Find (needed by Kruskal's — see also union_find.py)
-# ---------------------------------------------------------------------------
-class _UF:
-    """Minimal Union-Find with path compression and union by rank."""
-    def __init__(self, n: int):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-
-    def find(self, x: int) -> int:
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, x: int, y: int) -> bool:
-        rx, ry = self.find(x), self.find(y)
-        if rx == ry:
-            return False
-        if self.rank[rx] < self.rank[ry]:
-            rx, ry = ry, rx
-        self.parent[ry] = rx
-        if self.rank[rx] == self.rank[ry]:
-            self.rank[rx] += 1
-        return True
+try:
+    import numpy as np
+except ImportError:  # optional — min_cost_connect_points_dense falls back to lists
+    np = None
+
+INF = float('inf')
 
 
 # ---------------------------------------------------------------------------
@@ -86,7 +82,7 @@ def kruskal(n: int, edges: list[tuple[int, int, int]]) -> tuple[list, int]:
         >>> cost
         6
     """
-    uf = _UF(n)
+    uf = UnionFind(n)
     mst_edges = []
     total_weight = 0
 
@@ -103,7 +99,9 @@ def kruskal(n: int, edges: list[tuple[int, int, int]]) -> tuple[list, int]:
 # ---------------------------------------------------------------------------
 # 2. Prim's Algorithm
 # ---------------------------------------------------------------------------
-def prim(graph: dict[int, list[tuple[int, int]]], start: int = 0) -> tuple[list, int]:
+def prim(
+    graph: dict[int, list[tuple[int, int]]] | CSRGraph, start: int = 0, queue: str = "heapq"
+) -> tuple[list, int]:
     """
     Prim's MST Algorithm using a min-heap.
 
@@ -120,8 +118,12 @@ def prim(graph: dict[int, list[tuple[int, int]]], start: int = 0) -> tuple[list,
     always build the cheapest road that reaches a new city.
 
     Args:
-        graph: adjacency list {vertex: [(neighbour, weight), ...]}
+        graph: adjacency list {vertex: [(neighbour, weight), ...]}, or a
+               CSRGraph holding both directions of every undirected edge
         start: seed vertex (default 0)
+        queue: "heapq" (lazy deletion, default) or "indexed" (IndexedMinHeap
+               keyed by vertex — decrease_key keeps one entry per vertex).
+               Prim's keys are not monotone, so a radix heap does not apply.
 
     Returns:
         (mst_edges, total_weight) where mst_edges is list of (u, v, weight)
@@ -133,6 +135,15 @@ def prim(graph: dict[int, list[tuple[int, int]]], start: int = 0) -> tuple[list,
         >>> cost
         6
     """
+    if isinstance(graph, CSRGraph):
+        graph.require_weights("prim")
+    if queue == "indexed":
+        return _prim_indexed(graph, start)
+    if queue != "heapq":
+        raise ValueError(f"unknown queue {queue!r}")
+    if isinstance(graph, CSRGraph):
+        return _prim_csr(graph, start)
+
     visited: set[int] = set()
     mst_edges: list[tuple[int, int, int]] = []
     total_weight = 0
@@ -153,6 +164,56 @@ def prim(graph: dict[int, list[tuple[int, int]]], start: int = 0) -> tuple[list,
     return mst_edges, total_weight
 
 
+def _prim_csr(graph: CSRGraph, start: int) -> tuple[list, int]:
+    """Prim over CSR buffers: bytearray visited flags, one edge slice per vertex."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    heappop, heappush = heapq.heappop, heapq.heappush
+    visited = bytearray(graph.n)
+    n_visited = 0
+    mst_edges: list[tuple[int, int, int]] = []
+    total_weight = 0
+    heap = [(0, start, -1)]
+
+    while heap and n_visited < graph.n:
+        weight, u, parent = heappop(heap)
+        if visited[u]:
+            continue
+        visited[u] = 1
+        n_visited += 1
+        if parent != -1:
+            mst_edges.append((parent, u, weight))
+            total_weight += weight
+        lo, hi = offsets[u], offsets[u + 1]
+        for v, w in zip(targets[lo:hi], weights[lo:hi]):
+            if not visited[v]:
+                heappush(heap, (w, v, u))
+
+    return mst_edges, total_weight
+
+
+def _prim_indexed(graph, start: int) -> tuple[list, int]:
+    """Eager Prim: key[v] = lightest known edge from the tree to v, lowered in place."""
+    neighbours = graph.neighbours if isinstance(graph, CSRGraph) else graph.__getitem__
+    visited: set[int] = set()
+    parent = {start: -1}
+    mst_edges: list[tuple[int, int, int]] = []
+    total_weight = 0
+    pq = IndexedMinHeap()
+    pq.push(start, 0)
+
+    while pq:
+        weight, u = pq.pop()
+        visited.add(u)
+        if parent[u] != -1:
+            mst_edges.append((parent[u], u, weight))
+            total_weight += weight
+        for v, w in neighbours(u):
+            if v not in visited and pq.push_or_decrease(v, w):
+                parent[v] = u
+
+    return mst_edges, total_weight
+
+
 # ---------------------------------------------------------------------------
 # 3. Min Cost to Connect All Points
 # ---------------------------------------------------------------------------
@@ -252,7 +313,7 @@ def min_cost_to_supply_water(
         edges.append((cost, h1, h2))
 
     # Kruskal's on n+1 nodes (0 = virtual source, 1..n = houses)
-    uf = _UF(n + 1)
+    uf = UnionFind(n + 1)
     total = 0
     for cost, u, v in sorted(edges):
         if uf.union(u, v):
@@ -261,10 +322,671 @@ def min_cost_to_supply_water(
     return total
 
 
+# ---------------------------------------------------------------------------
+# 5. Manhattan MST — O(n log n) candidate edges + Kruskal
+# ---------------------------------------------------------------------------
+def _manhattan_candidate_edges(points: list[list[int]]) -> list[tuple[int, int, int]]:
+    """
+    At most 4n (weight, i, j) edges that are guaranteed to contain a
+    Manhattan MST.
+
+    For each point, split the plane around it into 8 octants. Within one
+    octant, only the nearest point (in Manhattan distance) can be an MST
+    neighbour — any farther point in the same octant is closer to that
+    nearest point than to us, so the cycle property discards it. Edges are
+    undirected, so 4 octants suffice.
+
+    One octant is handled by a sweep: visit points by decreasing x; the
+    octant of point p holds earlier points q with y_q - x_q >= y_p - x_p,
+    and the nearest of those has the smallest x_q + y_q. A Fenwick tree
+    indexed by compressed (y - x) answers that suffix-min in O(log n).
+    The other octants are the same sweep after swapping / negating axes.
+    """
+    n = len(points)
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    edges: list[tuple[int, int, int]] = []
+
+    for direction in range(4):
+        if direction in (1, 3):
+            xs, ys = ys, xs
+        elif direction == 2:
+            xs = [-x for x in xs]
+
+        order = sorted(range(n), key=lambda i: (xs[i], ys[i]))
+        keys = sorted(set(ys[i] - xs[i] for i in range(n)))
+        rank = {k: r + 1 for r, k in enumerate(keys)}  # 1-indexed for the BIT
+        m = len(keys)
+        bit_val = [INF] * (m + 1)  # suffix-min Fenwick: min (x + y) ...
+        bit_id = [-1] * (m + 1)    # ... and which point achieved it
+
+        for i in reversed(order):
+            pos = rank[ys[i] - xs[i]]
+            best, best_id = INF, -1
+            j = pos
+            while j <= m:          # query suffix [pos, m]
+                if bit_val[j] < best:
+                    best, best_id = bit_val[j], bit_id[j]
+                j += j & -j
+            if best_id != -1:
+                edges.append((abs(xs[i] - xs[best_id]) + abs(ys[i] - ys[best_id]), i, best_id))
+            s = xs[i] + ys[i]
+            j = pos
+            while j > 0:           # update covers every suffix containing pos
+                if s < bit_val[j]:
+                    bit_val[j], bit_id[j] = s, i
+                j -= j & -j
+
+    return edges
+
+
+def min_cost_connect_points_manhattan(points: list[list[int]]) -> int:
+    """
+    LeetCode 1584 in O(n log n): Manhattan-MST candidate edges, then Kruskal.
+
+    Approach: _manhattan_candidate_edges reduces the complete graph's
+    n(n-1)/2 edges to at most 4n without losing the MST; kruskal on that
+    sparse graph costs O(n log n).
+
+    T: O(n log n)
+    S: O(n)
+
+    Real-world analogy: wiring 50,000 street-grid sensors — only each
+    sensor's nearest neighbour per compass octant is ever worth considering.
+
+    Example:
+        >>> min_cost_connect_points_manhattan([[0,0],[2,2],[3,10],[5,2],[7,0]])
+        20
+    """
+    if len(points) <= 1:
+        return 0
+    _, total = kruskal(len(points), _manhattan_candidate_edges(points))
+    return total
+
+
+# ---------------------------------------------------------------------------
+# 6. Dense Prim — O(n²) arrays, no heap
+# ---------------------------------------------------------------------------
+def min_cost_connect_points_dense(points: list[list[int]]) -> int:
+    """
+    LeetCode 1584 with array-based Prim: O(n²) time, O(n) space.
+
+    Approach: keep best[j] = cheapest known edge from the tree to j. Each
+    step picks the argmin outside the tree, adds it, and lowers best[]
+    using distances from the new vertex. On a complete graph this beats
+    the heap version's O(n² log n) and never stores more than n numbers.
+    With NumPy, each step's distance update and argmin is one vectorized
+    pass; without it, the same loop runs in pure Python.
+
+    T: O(n²)
+    S: O(n)
+
+    Example:
+        >>> min_cost_connect_points_dense([[3,12],[-2,5],[-4,1]])
+        18
+    """
+    n = len(points)
+    if n <= 1:
+        return 0
+
+    if np is not None:
+        pts = np.asarray(points, dtype=np.int64)
+        xs, ys = pts[:, 0], pts[:, 1]
+        best = np.full(n, np.iinfo(np.int64).max)
+        outside = np.ones(n, dtype=bool)
+        total, u = 0, 0
+        for _ in range(n - 1):
+            outside[u] = False
+            d = np.abs(xs - xs[u]) + np.abs(ys - ys[u])
+            np.minimum(best, d, out=best, where=outside)
+            best[u] = np.iinfo(np.int64).max  # never pick u again
+            u = int(best.argmin())
+            total += int(best[u])
+        return total
+
+    best_py = [INF] * n
+    in_tree = [False] * n
+    total, u = 0, 0
+    for _ in range(n - 1):
+        in_tree[u] = True
+        xu, yu = points[u]
+        nxt, nxt_d = -1, INF
+        for j in range(n):
+            if not in_tree[j]:
+                d = abs(xu - points[j][0]) + abs(yu - points[j][1])
+                if d < best_py[j]:
+                    best_py[j] = d
+                if best_py[j] < nxt_d:
+                    nxt, nxt_d = j, best_py[j]
+        total += nxt_d
+        u = nxt
+    return total
+
+
+# ---------------------------------------------------------------------------
+# 7. External-Memory Kruskal (edges on disk)
+# ---------------------------------------------------------------------------
+EDGE_RECORD = struct.Struct("<qqq")  # (weight, u, v) — same order as kruskal's tuples
+_PY_BYTES_PER_EDGE = 176              # list slot + (w, u, v) tuple + 3 ints + sort scratch
+_READER_OVERHEAD = 2048               # file, generator, unpacker and heap entry per run
+_MIN_READ_BYTES = 4096                # smallest worthwhile read per run while merging
+_MAX_FAN_IN = 128                     # caps open file descriptors per merge
+
+
+def write_edge_file(path: str, edges, buffering: int = -1) -> int:
+    """Write (weight, u, v) tuples as fixed-size binary records. Returns the count."""
+    count = 0
+    with open(path, "wb", buffering=buffering) as f:
+        for w, u, v in edges:
+            f.write(EDGE_RECORD.pack(w, u, v))
+            count += 1
+    return count
+
+
+def read_edge_file(path: str, block_records: int = 65536):
+    """
+    Stream (weight, u, v) records from a binary edge file, one block at a time.
+
+    The file is opened unbuffered, so the block is the only buffer held —
+    block_records alone sets the reader's memory footprint.
+    """
+    size = EDGE_RECORD.size
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            block = f.read(block_records * size)
+            if not block:
+                return
+            while len(block) % size:  # a short read split a record
+                more = f.read(size - len(block) % size)
+                if not more:
+                    raise ValueError(f"{path}: truncated edge record")
+                block += more
+            yield from EDGE_RECORD.iter_unpack(block)
+
+
+def _sorted_runs(path: str, run_records: int, buf_records: int, tmp_dir: str) -> list[str]:
+    """Phase 1 of the external sort: sort budget-sized chunks into run files."""
+    runs = []
+    chunk: list[tuple[int, int, int]] = []
+    for rec in read_edge_file(path, buf_records):
+        chunk.append(rec)
+        if len(chunk) == run_records:
+            runs.append(_write_run(chunk, tmp_dir, len(runs), buf_records))
+            chunk = []
+    if chunk:
+        runs.append(_write_run(chunk, tmp_dir, len(runs), buf_records))
+    return runs
+
+
+def _write_run(chunk: list[tuple[int, int, int]], tmp_dir: str, i: int,
+               buf_records: int) -> str:
+    chunk.sort()
+    run_path = os.path.join(tmp_dir, f"run{i:05d}.bin")
+    write_edge_file(run_path, chunk, buffering=buf_records * EDGE_RECORD.size)
+    return run_path
+
+
+def _merge_runs(runs: list[str], fan_in: int, buf_records: int, tmp_dir: str) -> list[str]:
+    """
+    Phase 2 of the external sort: merge groups of fan_in runs into longer
+    runs, pass after pass, until at most fan_in remain for the final merge.
+    """
+    level = 0
+    while len(runs) > fan_in:
+        merged = []
+        for i in range(0, len(runs), fan_in):
+            group = runs[i:i + fan_in]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            out = os.path.join(tmp_dir, f"merge{level:02d}_{i // fan_in:05d}.bin")
+            write_edge_file(out, heapq.merge(*(read_edge_file(r, buf_records) for r in group)),
+                            buffering=buf_records * EDGE_RECORD.size)
+            for r in group:
+                os.remove(r)
+            merged.append(out)
+        runs = merged
+        level += 1
+    return runs
+
+
+def kruskal_external(
+    n: int, edge_path: str, out_path: str | None = None,
+    memory_budget: int = 64 << 20, tmp_dir: str | None = None,
+):
+    """
+    Kruskal over an edge file larger than RAM.
+
+    Approach:
+      1. External merge sort: read the binary edge file in chunks that fit
+         the memory budget, sort each in memory, write it as a sorted run.
+      2. Merge the runs with heapq.merge, at most k at a time: k (capped by
+         _MAX_FAN_IN, which also bounds open files) is chosen so k read
+         buffers plus a writer fit the budget. Extra passes merge groups of
+         k runs into longer runs until at most k remain; the final k-way
+         merge streams edges in global weight order without ever holding
+         them all in memory.
+      3. Feed them to the array-backed UnionFind (4-byte parent + 1-byte
+         rank per vertex, iterative find) exactly as kruskal does.
+    MST edges are yielded as they are found and, if out_path is given, also
+    appended to that file in the same (weight, u, v) record format.
+
+    T: O(E log E) comparisons, O(E) sequential disk I/O per pass,
+       1 + ceil(log_k(runs)) passes
+    S: O(memory_budget + V) — the edge set is never fully resident
+
+    Real-world analogy: sorting a warehouse of index cards a trolley-load at
+    a time, then dealing from the sorted stacks in parallel.
+
+    Args:
+        n:             number of vertices (0..n-1)
+        edge_path:     binary file of EDGE_RECORD (weight, u, v) records
+        out_path:      optional file to receive the MST edge records
+        memory_budget: bytes available for sorting/merging buffers
+        tmp_dir:       directory for sorted runs (default: system temp)
+
+    Yields:
+        (u, v, weight) MST edges in non-decreasing weight order
+
+    Example:
+        >>> write_edge_file("g.bin", [(1,0,1),(4,0,2),(2,1,2),(5,1,3),(3,2,3)])
+        5
+        >>> sum(w for _, _, w in kruskal_external(4, "g.bin"))
+        6
+    """
+    # Split the budget: fan_in readers + 1 writer during merges; a read and a
+    # write buffer plus the in-memory chunk while forming runs
+    fan_in = max(2, min(_MAX_FAN_IN,
+                        memory_budget // (_MIN_READ_BYTES + _READER_OVERHEAD) - 1))
+    buf_records = max(1, (memory_budget // (fan_in + 1) - _READER_OVERHEAD)
+                      // EDGE_RECORD.size)
+    run_records = max(1, (memory_budget - 2 * buf_records * EDGE_RECORD.size)
+                      // _PY_BYTES_PER_EDGE)
+    uf = UnionFind(n)
+
+    out = open(out_path, "wb") if out_path else None
+    try:
+        with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+            runs = _sorted_runs(edge_path, run_records, buf_records, tmp)
+            runs = _merge_runs(runs, fan_in, buf_records, tmp)
+            merged = heapq.merge(*(read_edge_file(r, buf_records) for r in runs))
+            taken = 0
+            for w, u, v in merged:
+                if not uf.union(u, v):
+                    continue
+                if out is not None:
+                    out.write(EDGE_RECORD.pack(w, u, v))
+                yield u, v, w
+                taken += 1
+                if taken == n - 1:
+                    break  # MST complete
+    finally:
+        if out is not None:
+            out.close()
+
+
+# ---------------------------------------------------------------------------
+# 8. Borůvka's Algorithm (parallel cheapest-edge search)
+# ---------------------------------------------------------------------------
+_boruvka_state: dict = {}  # per-worker: shared edge columns + component ids
+
+
+def _boruvka_init(weight, end_u, end_v, ids, comp) -> None:
+    """Pool initializer: every array is shared memory, mapped once per worker."""
+    _boruvka_state.update(weight=typed_view(weight), u=typed_view(end_u),
+                          v=typed_view(end_v), ids=typed_view(ids), comp=typed_view(comp))
+
+
+def _boruvka_cheapest(task: tuple[int, int, bool]) -> tuple[int, int, dict]:
+    """
+    Cheapest outgoing edge per component over edges[lo:hi].
+
+    Returns (new_hi, internal, {component: (weight, edge index)}). Edges
+    inside one component never cross again; with pack set they are
+    dropped and the rest packed to the front of the chunk (new_hi shrinks),
+    otherwise they are only counted so the parent can decide when a chunk
+    is worth packing.
+
+    Keys are (weight, edge index): the index breaks ties consistently, which
+    is what stops two components from picking different equal-weight edges
+    that together close a cycle.
+    """
+    lo, hi, pack = task
+    st = _boruvka_state
+    weight, end_u, end_v, ids, comp = st["weight"], st["u"], st["v"], st["ids"], st["comp"]
+    best: dict[int, tuple[int, int]] = {}
+    j = lo
+    internal = 0
+    for i in range(lo, hi):
+        u, v = end_u[i], end_v[i]
+        cu, cv = comp[u], comp[v]
+        if cu == cv:
+            internal += 1  # contracted away for good
+            continue
+        w, eid = weight[i], ids[i]
+        if pack:
+            weight[j], end_u[j], end_v[j], ids[j] = w, u, v, eid
+            j += 1
+        key = (w, eid)
+        if cu not in best or key < best[cu]:
+            best[cu] = key
+        if cv not in best or key < best[cv]:
+            best[cv] = key
+    return (j if pack else hi), internal, best
+
+
+def boruvka(n: int, edges: list[tuple[int, int, int]], workers: int = 1) -> tuple[list, int]:
+    """
+    Borůvka's MST algorithm with the edge scan fanned out over processes.
+
+    Approach: every round,
+      1. Label each vertex with its component root (Union-Find).
+      2. Find each component's cheapest outgoing edge. This is a pure scan
+         over the live edges, so it is split into chunks scanned by worker
+         processes; the parent merges the per-chunk minima.
+      3. Add all those edges at once, contracting components via union.
+    Edges inside one component are dead for the rest of the run: once at
+    least half of a chunk is dead, its next scan drops them and packs the
+    survivors, so later rounds walk only edges that can still cross. Packing
+    only half-dead chunks keeps the rewriting amortized O(E) overall.
+    Every component merges with at least one other per round, so the number
+    of components at least halves: O(log V) rounds in total.
+
+    The edge columns and component ids live in shared memory (RawArray), so
+    workers map one copy instead of each unpickling the edge list.
+
+    T: O(E log V) work worst case, less as dead edges are packed away; the
+       E part of each round divided across workers
+    S: O(V + E)
+
+    Real-world analogy: every town simultaneously builds the cheapest road
+    out of its district; districts merge, and the process repeats.
+
+    Args:
+        n:       number of vertices (0..n-1)
+        edges:   list of (weight, u, v) tuples, as for kruskal
+        workers: processes for step 2; 1 runs in-process
+
+    Returns:
+        (mst_edges, total_weight) — a spanning forest if the graph is
+        disconnected
+
+    Example:
+        >>> mst, cost = boruvka(4, [(1,0,1),(4,0,2),(2,1,2),(5,1,3),(3,2,3)])
+        >>> cost
+        6
+    """
+    def column(typecode: str, values):
+        return RawArray(typecode, values) if workers > 1 else array(typecode, values)
+
+    weights = [e[0] for e in edges]
+    try:
+        weight = column('q', weights)
+    except TypeError:  # float weights
+        weight = column('d', weights)
+    end_u = column('q', [e[1] for e in edges])
+    end_v = column('q', [e[2] for e in edges])
+    ids = column('q', range(len(edges)))
+    comp = column('q', range(n))
+    labels = typed_view(comp)  # the parent's writes skip ctypes too
+
+    uf = UnionFind(n)
+    mst_edges: list[tuple[int, int, int]] = []
+    total_weight = 0
+    chunk = max(1, -(-len(edges) // max(1, workers)))
+    tasks = [(lo, min(lo + chunk, len(edges)), False) for lo in range(0, len(edges), chunk)]
+
+    pool = None
+    try:
+        state = (weight, end_u, end_v, ids, comp)
+        _boruvka_init(*state)
+        if workers > 1:
+            pool = ProcessPoolExecutor(workers, initializer=_boruvka_init, initargs=state)
+        while len(mst_edges) < n - 1:
+            for v in range(n):
+                labels[v] = uf.find(v)
+            if pool is None:
+                parts = [_boruvka_cheapest(t) for t in tasks]
+            else:
+                parts = list(pool.map(_boruvka_cheapest, tasks))
+            # Pack a chunk on its next scan once half of it is dead
+            tasks = [(lo, hi, not packed and 2 * dead >= hi - lo)
+                     for (lo, _, packed), (hi, dead, _) in zip(tasks, parts) if hi > lo]
+            cheapest: dict[int, tuple[int, int]] = {}
+            for _, _, part in parts:
+                for c, key in part.items():
+                    if c not in cheapest or key < cheapest[c]:
+                        cheapest[c] = key
+            if not cheapest:
+                break  # no outgoing edges left — the graph is disconnected
+            for w, i in sorted(set(cheapest.values())):
+                _, u, v = edges[i]
+                if uf.union(u, v):
+                    mst_edges.append((u, v, w))
+                    total_weight += w
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        _boruvka_state.clear()  # don't keep the shared arrays alive after returning
+
+    return mst_edges, total_weight
+
+
+def benchmark_boruvka(
+    n: int = 200_000, m: int = 1_000_000,
+    worker_counts: tuple[int, ...] = (1, 2, 4, 8), seed: int = 0,
+) -> dict[str, float]:
+    """
+    Time kruskal, prim and boruvka (at several worker counts) on one random
+    connected graph; prints a table and returns {label: seconds}.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    edges = [(rng.randint(1, 10**6), i, rng.randrange(i)) for i in range(1, n)]  # spanning tree
+    edges += [(rng.randint(1, 10**6), rng.randrange(n), rng.randrange(n)) for _ in range(m - n + 1)]
+    graph: dict[int, list[tuple[int, int]]] = {u: [] for u in range(n)}
+    for w, u, v in edges:
+        graph[u].append((v, w))
+        graph[v].append((u, w))
+
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    _, expected = kruskal(n, edges)
+    timings["kruskal"] = time.perf_counter() - start
+    start = time.perf_counter()
+    assert prim(graph)[1] == expected
+    timings["prim"] = time.perf_counter() - start
+    for w in worker_counts:
+        start = time.perf_counter()
+        assert boruvka(n, edges, workers=w)[1] == expected
+        timings[f"boruvka x{w}"] = time.perf_counter() - start
+
+    print(colored(f"MST benchmark (V={n:,}, E={m:,}, cpus={os.cpu_count()})", "cyan"))
+    for label, secs in timings.items():
+        print(f"  {label:<12} {secs:8.3f}s")
+    return timings
+
+
+# ---------------------------------------------------------------------------
+# 9. Dynamic MST for Optimize Water Distribution (incremental updates)
+# ---------------------------------------------------------------------------
+class WaterSupplyPlanner:
+    """
+    Stateful min_cost_to_supply_water that keeps its MST across cost changes.
+
+    Same model as min_cost_to_supply_water: virtual node 0 is the water
+    source, a well at house i is edge (0, i). Edges are identified by id:
+    wells are ids 0..n-1 (house id + 1 = node), pipes get ids from n upward
+    in the order they are added (parallel pipes are allowed).
+
+    Updates use the cycle and cut properties on the current tree instead of
+    re-sorting every edge:
+      - New edge, or a cheaper edge: if it is a tree edge, just lower the
+        total. Otherwise walk the tree path between its ends; if the
+        heaviest edge on that cycle is dearer, swap it out.      O(V)
+      - Dearer non-tree edge: the MST cannot change.              O(1)
+      - Dearer tree edge: remove it, find the half of the tree with fewer
+        incident edges by searching both halves in lockstep, and bring back
+        the cheapest edge crossing the cut (possibly the same edge at its new
+        price) by scanning only that half's incident-edge lists.
+                        O(|S| + deg(S)), S = lighter half; O(V + E) worst case
+
+    incident[u] lists every edge id touching u and other[e] = u ^ v gives the
+    far end from either side, so a sparse cut is found without walking the
+    full edge list; when deg(S) is over half of all edges, one flat pass over
+    the edge list is cheaper and is used instead.
+
+    Real-world analogy: a utilities planner that re-quotes the network when
+    one supplier changes a price, instead of re-tendering everything.
+
+    Example:
+        >>> p = WaterSupplyPlanner(3, [1, 2, 2], [[1, 2, 1], [2, 3, 1]])
+        >>> p.total
+        3
+        >>> p.set_well_cost(0, 5); p.total   # house 1's well gets dearer
+        4
+    """
+
+    def __init__(self, n: int, wells: list[int], pipes: list[list[int]]):
+        self.n = n
+        self.ends: list[tuple[int, int]] = [(0, i + 1) for i in range(n)]
+        self.cost: list[int] = list(wells)
+        self.other: list[int] = [i + 1 for i in range(n)]  # u ^ v, the far end from either side
+        self.incident: list[list[int]] = [list(range(n))] + [[i] for i in range(n)]
+        for h1, h2, c in pipes:
+            self._store(h1, h2, c)
+        self.tree: list[dict[int, int]] = [{} for _ in range(n + 1)]  # tree[u][v] = edge id
+        self.in_tree: set[int] = set()
+        self.total = 0
+
+        uf = UnionFind(n + 1)
+        for eid in sorted(range(len(self.cost)), key=self.cost.__getitem__):
+            u, v = self.ends[eid]
+            if uf.union(u, v):
+                self._link(eid)
+
+    # -- public updates -------------------------------------------------------
+    def add_pipe(self, h1: int, h2: int, cost: int) -> int:
+        """Add a pipe and return its edge id. O(V)"""
+        eid = self._store(h1, h2, cost)
+        self._offer(eid)
+        return eid
+
+    def reprice_pipe(self, eid: int, cost: int) -> None:
+        """Change the cost of edge eid (a pipe id, or a well id 0..n-1)."""
+        old = self.cost[eid]
+        self.cost[eid] = cost
+        if eid in self.in_tree:
+            self.total += cost - old
+            if cost > old:
+                self._replace(eid)
+        elif cost < old:
+            self._offer(eid)
+
+    def set_well_cost(self, house: int, cost: int) -> None:
+        """Change the cost of digging a well at house (0-indexed, as in wells[])."""
+        self.reprice_pipe(house, cost)
+
+    # -- internals ----------------------------------------------------------
+    def _store(self, u: int, v: int, cost: int) -> int:
+        eid = len(self.cost)
+        self.ends.append((u, v))
+        self.other.append(u ^ v)
+        self.cost.append(cost)
+        self.incident[u].append(eid)
+        if v != u:
+            self.incident[v].append(eid)
+        return eid
+
+    def _link(self, eid: int) -> None:
+        u, v = self.ends[eid]
+        self.tree[u][v] = self.tree[v][u] = eid
+        self.in_tree.add(eid)
+        self.total += self.cost[eid]
+
+    def _cut(self, eid: int) -> None:
+        u, v = self.ends[eid]
+        del self.tree[u][v], self.tree[v][u]
+        self.in_tree.discard(eid)
+        self.total -= self.cost[eid]
+
+    def _offer(self, eid: int) -> None:
+        """Cycle property: eid replaces the heaviest edge on its tree path if cheaper."""
+        u, v = self.ends[eid]
+        if u == v:
+            return
+        if v in self.tree[u]:
+            # Parallel to a tree edge: the path is that single edge
+            heaviest = self.tree[u][v]
+        else:
+            heaviest = max(self._tree_path(u, v), key=self.cost.__getitem__)
+        if self.cost[heaviest] > self.cost[eid]:
+            self._cut(heaviest)
+            self._link(eid)
+
+    def _tree_path(self, u: int, v: int) -> list[int]:
+        """Edge ids on the tree path u → v (BFS with parent edges). O(V)"""
+        parent_edge = {u: -1}
+        queue = [u]
+        for x in queue:
+            if x == v:
+                break
+            for y, eid in self.tree[x].items():
+                if y not in parent_edge:
+                    parent_edge[y] = eid
+                    queue.append(y)
+        path = []
+        x = v
+        while parent_edge[x] != -1:
+            eid = parent_edge[x]
+            path.append(eid)
+            a, b = self.ends[eid]
+            x = a if b == x else b
+        return path
+
+    def _replace(self, eid: int) -> None:
+        """Cut property: after eid got dearer, pick the cheapest edge across its cut."""
+        self._cut(eid)
+        tree, incident, other = self.tree, self.incident, self.other
+        # Grow both halves one vertex at a time (side[x] = 1 or 2), always the
+        # one whose incident lists are shorter so far; the first to run out is
+        # the cheaper half to scan, at twice its cost at most
+        side = bytearray(self.n + 1)
+        a, b = self.ends[eid]
+        queues = ([a], [b])
+        side[a], side[b] = 1, 2
+        heads, work = [0, 0], [0, 0]
+        while True:
+            k = 0 if work[0] <= work[1] else 1
+            queue = queues[k]
+            if heads[k] == len(queue):
+                break
+            x = queue[heads[k]]
+            heads[k] += 1
+            work[k] += len(incident[x])
+            for y in tree[x]:
+                if not side[y]:
+                    side[y] = k + 1
+                    queue.append(y)
+        mark = k + 1
+        if 2 * work[k] < len(other):
+            crossing = [e for x in queues[k] for e in incident[x] if side[other[e] ^ x] != mark]
+        else:  # dense cut: one pass over the flat edge list is cheaper
+            crossing = [e for e, (a, b) in enumerate(self.ends)
+                        if (side[a] == mark) != (side[b] == mark)]
+        best = min(crossing, key=self.cost.__getitem__)
+        self._link(best)
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
+    import random
+    import tracemalloc
+
     # Kruskal's
     edges = [(1, 0, 1), (4, 0, 2), (2, 1, 2), (5, 1, 3), (3, 2, 3)]
     mst, cost = kruskal(4, edges)
@@ -282,6 +1004,14 @@ if __name__ == "__main__":
     mst, cost = prim(g)
     assert cost == 6
     assert len(mst) == 3
+    assert prim(CSRGraph.from_adjacency(g)) == prim(g)
+    assert prim(g, queue="indexed")[1] == 6
+    assert prim(CSRGraph.from_adjacency(g), queue="indexed")[1] == 6
+    try:
+        prim(CSRGraph.from_adjacency({0: [1], 1: [0]}))
+        assert False, "Should have raised"
+    except ValueError:
+        pass
     print(colored("✓ prim", "green"))
 
     # Min Cost Connect Points
@@ -290,9 +1020,95 @@ if __name__ == "__main__":
     assert min_cost_connect_points([[0,0]]) == 0
     print(colored("✓ min_cost_connect_points", "green"))
 
+    # Manhattan MST and dense Prim agree with the heap version
+    random.seed(11)
+    for _ in range(200):
+        pts = [[random.randint(-20, 20), random.randint(-20, 20)]
+               for _ in range(random.randint(1, 25))]
+        want = min_cost_connect_points(pts)
+        assert min_cost_connect_points_manhattan(pts) == want
+        assert min_cost_connect_points_dense(pts) == want
+    assert min_cost_connect_points_manhattan([[0, 0], [0, 0], [1, 1]]) == 2
+    pts = [[random.randint(0, 10**6), random.randint(0, 10**6)] for _ in range(20_000)]
+    assert len(_manhattan_candidate_edges(pts)) <= 4 * len(pts)
+    print(colored("✓ min_cost_connect_points_manhattan / _dense", "green"))
+
     # Optimize Water Distribution
     assert min_cost_to_supply_water(3, [1, 2, 2], [[1, 2, 1], [2, 3, 1]]) == 3
     assert min_cost_to_supply_water(2, [1, 1], [[1, 2, 2]]) == 2
     print(colored("✓ min_cost_to_supply_water", "green"))
 
+    # External Kruskal: tiny memory budget forces many runs; result matches kruskal
+    with tempfile.TemporaryDirectory() as tmp:
+        edge_file, mst_file = os.path.join(tmp, "edges.bin"), os.path.join(tmp, "mst.bin")
+        write_edge_file(edge_file, edges)
+        assert sum(w for _, _, w in kruskal_external(4, edge_file)) == 6
+        nv = 500
+        rand_edges = [(random.randint(1, 1000), random.randrange(nv), random.randrange(nv))
+                      for _ in range(5000)]
+        write_edge_file(edge_file, rand_edges)
+        streamed = list(kruskal_external(nv, edge_file, mst_file,
+                                         memory_budget=200 * _PY_BYTES_PER_EDGE))
+        ref_edges, ref_cost = kruskal(nv, rand_edges)
+        assert sum(w for _, _, w in streamed) == ref_cost and len(streamed) == len(ref_edges)
+        assert [(u, v, w) for w, u, v in read_edge_file(mst_file)] == streamed
+
+        # Peak traced memory stays within the budget (many runs, multi-pass merge)
+        nv, budget = 1000, 120_000
+        big_edges = [(random.randint(1, 10**6), random.randrange(nv), random.randrange(nv))
+                     for _ in range(50_000)]
+        write_edge_file(edge_file, big_edges)
+        _, ref_cost = kruskal(nv, big_edges)
+        del big_edges
+        tracemalloc.start()
+        cost = sum(w for _, _, w in kruskal_external(nv, edge_file, memory_budget=budget))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert cost == ref_cost and peak <= budget, peak
+    print(colored(f"✓ kruskal_external (peak {peak:,} B for a {budget:,} B budget)", "green"))
+
+    # Borůvka matches Kruskal's cost, in-process and with workers (ties included)
+    assert boruvka(4, edges)[1] == 6
+    assert boruvka(4, [(1, 0, 1), (1, 1, 2), (1, 2, 0), (1, 2, 3)])[1] == 3
+    for _ in range(50):
+        nv = random.randint(1, 30)
+        re_ = [(random.randint(1, 5), random.randrange(nv), random.randrange(nv))
+               for _ in range(random.randint(0, 80))]
+        ref_edges, ref_cost = kruskal(nv, re_)
+        got_edges, got_cost = boruvka(nv, re_)
+        assert got_cost == ref_cost and len(got_edges) == len(ref_edges)
+    assert boruvka(nv, re_, workers=2) == boruvka(nv, re_)
+    assert not _boruvka_state
+    print(colored("✓ boruvka", "green"))
+
+    # WaterSupplyPlanner tracks a full rebuild through random updates
+    planner = WaterSupplyPlanner(3, [1, 2, 2], [[1, 2, 1], [2, 3, 1]])
+    assert planner.total == 3
+    planner.set_well_cost(0, 5)
+    assert planner.total == 4
+    random.seed(14)
+    nh = 12
+    wells = [random.randint(1, 30) for _ in range(nh)]
+    pipes = [[random.randint(1, nh), random.randint(1, nh), random.randint(1, 30)]
+             for _ in range(15)]
+    planner = WaterSupplyPlanner(nh, wells, pipes)
+    for _ in range(400):
+        op = random.random()
+        if op < 0.3:
+            h1, h2, c = random.randint(1, nh), random.randint(1, nh), random.randint(1, 30)
+            pipes.append([h1, h2, c])
+            planner.add_pipe(h1, h2, c)
+        elif op < 0.6:
+            house, c = random.randrange(nh), random.randint(1, 30)
+            wells[house] = c
+            planner.set_well_cost(house, c)
+        else:
+            i, c = random.randrange(len(pipes)), random.randint(1, 30)
+            pipes[i][2] = c
+            planner.reprice_pipe(nh + i, c)
+        assert planner.total == min_cost_to_supply_water(nh, wells, pipes)
+        assert len(planner.in_tree) == nh
+    print(colored("✓ WaterSupplyPlanner", "green"))
+    benchmark_boruvka(n=5_000, m=30_000, worker_counts=(1, 2))
+
     print(colored("\nAll tests passed.", "cyan"))
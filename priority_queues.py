@@ -0,0 +1,276 @@
+"""
+Priority Queues for graph search — indexed binary heap and radix heap.
+
+Reference: dsa.md § Heaps / Priority Queues, § Dijkstra's Algorithm (Advanced)
+
+Key insight:
+  - heapq has no decrease-key, so Dijkstra/Prim push a fresh (key, item)
+    on every improvement and skip stale entries when popped. The heap can
+    grow to O(E) entries.
+  - An indexed heap remembers where each item sits in the heap array, so
+    an improvement moves the existing entry up instead of adding another.
+    The heap never holds more than V entries.
+  - A radix heap exploits two facts about Dijkstra with non-negative
+    integer weights: keys are ints, and popped keys never decrease
+    (monotone). Entries live in buckets by the highest bit in which they
+    differ from the last popped key, so each entry moves between buckets at
+    most O(log C) times (C = max key) and no comparisons against other
+    entries are needed on push.
+
+Patterns covered:
+  1. IndexedMinHeap  — binary heap with position map and decrease_key
+  2. RadixHeap       — monotone integer priority queue
+"""
+from termcolor import colored
+
+
+# ---------------------------------------------------------------------------
+# 1. Indexed Min-Heap
+# ---------------------------------------------------------------------------
+class IndexedMinHeap:
+    """
+    Binary min-heap over distinct items with O(log n) decrease_key.
+
+    T: O(log n) push / pop / decrease_key, O(1) peek / contains
+    S: O(n) — at most one entry per item
+
+    Real-world analogy: an airport departures board — when a flight is
+    brought forward its row moves up the board; no duplicate row is added.
+
+    Attributes:
+        heap: heap-ordered list of items
+        pos:  pos[item]  = index of item in heap
+        key:  key[item]  = current priority of item
+
+    Example:
+        >>> pq = IndexedMinHeap()
+        >>> pq.push("b", 5); pq.push("a", 7)
+        >>> pq.decrease_key("a", 1)
+        >>> pq.pop()
+        (1, 'a')
+    """
+
+    __slots__ = ("heap", "pos", "key")
+
+    def __init__(self):
+        self.heap: list = []
+        self.pos: dict = {}
+        self.key: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, item) -> bool:
+        return item in self.pos
+
+    def peek(self) -> tuple:
+        """Return (key, item) of the minimum without removing it. T: O(1)"""
+        item = self.heap[0]
+        return self.key[item], item
+
+    def push(self, item, key) -> None:
+        """Insert a new item. T: O(log n)"""
+        if item in self.pos:
+            raise KeyError(f"{item!r} is already in the heap")
+        self.key[item] = key
+        self.pos[item] = len(self.heap)
+        self.heap.append(item)
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, item, key) -> None:
+        """Lower item's key and restore heap order. T: O(log n)"""
+        if key > self.key[item]:
+            raise ValueError("decrease_key cannot increase a key")
+        self.key[item] = key
+        self._sift_up(self.pos[item])
+
+    def push_or_decrease(self, item, key) -> bool:
+        """
+        Insert item, or lower its key if that improves it.
+
+        Returns True if the heap changed — the Dijkstra/Prim relaxation step.
+        """
+        if item not in self.pos:
+            self.push(item, key)
+            return True
+        if key < self.key[item]:
+            self.decrease_key(item, key)
+            return True
+        return False
+
+    def pop(self) -> tuple:
+        """Remove and return (key, item) with the smallest key. T: O(log n)"""
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self.pos[last] = 0
+            self._sift_down(0)
+        del self.pos[top]
+        return self.key.pop(top), top
+
+    def _sift_up(self, i: int) -> None:
+        heap, pos, key = self.heap, self.pos, self.key
+        item = heap[i]
+        k = key[item]
+        while i > 0:
+            parent = (i - 1) >> 1
+            p_item = heap[parent]
+            if key[p_item] <= k:
+                break
+            heap[i] = p_item  # move parent down; item is placed once at the end
+            pos[p_item] = i
+            i = parent
+        heap[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap, pos, key = self.heap, self.pos, self.key
+        n = len(heap)
+        item = heap[i]
+        k = key[item]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and key[heap[child + 1]] < key[heap[child]]:
+                child += 1
+            c_item = heap[child]
+            if key[c_item] >= k:
+                break
+            heap[i] = c_item
+            pos[c_item] = i
+            i = child
+        heap[i] = item
+        pos[item] = i
+
+
+# ---------------------------------------------------------------------------
+# 2. Radix Heap
+# ---------------------------------------------------------------------------
+class RadixHeap:
+    """
+    Monotone priority queue for non-negative integer keys.
+
+    Bucket b holds entries whose key differs from `last` (the most recently
+    popped key) first in bit b-1; bucket 0 holds keys equal to `last`. When
+    bucket 0 is empty, the lowest non-empty bucket is redistributed around
+    its minimum key — every entry lands in a strictly lower bucket.
+
+    Keys pushed must be >= the last popped key (true for Dijkstra, whose
+    settled distances never decrease). Like heapq, there is no decrease-key:
+    callers push a new entry and skip stale ones.
+
+    T: O(1) push, O(log C) amortised pop (C = largest key)
+    S: O(n)
+
+    Example:
+        >>> rh = RadixHeap()
+        >>> rh.push(5, "x"); rh.push(2, "y")
+        >>> rh.pop()
+        (2, 'y')
+    """
+
+    __slots__ = ("buckets", "last", "size")
+
+    def __init__(self):
+        self.buckets: list[list[tuple]] = [[]]
+        self.last = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, key: int, item) -> None:
+        """Insert (key, item); key must be an int >= the last popped key. T: O(1)"""
+        if not isinstance(key, int) or key < 0:
+            raise ValueError(f"radix heap keys must be non-negative ints, got {key!r} "
+                             f"({type(key).__name__}); use heapq or IndexedMinHeap instead")
+        if key < self.last:
+            raise ValueError(f"radix heap is monotone: {key} < last popped {self.last}")
+        b = (key ^ self.last).bit_length()
+        buckets = self.buckets
+        while len(buckets) <= b:
+            buckets.append([])
+        buckets[b].append((key, item))
+        self.size += 1
+
+    def pop(self) -> tuple:
+        """Remove and return (key, item) with the smallest key."""
+        if not self.size:
+            raise IndexError("pop from an empty radix heap")
+        buckets = self.buckets
+        if not buckets[0]:
+            b = 1
+            while not buckets[b]:
+                b += 1
+            moved = buckets[b]
+            buckets[b] = []
+            last = min(entry[0] for entry in moved)
+            self.last = last
+            for entry in moved:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        self.size -= 1
+        return buckets[0].pop()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    import heapq
+    import random
+
+    # IndexedMinHeap vs heapq on random operations
+    random.seed(3)
+    pq = IndexedMinHeap()
+    ref: dict[int, int] = {}
+    for _ in range(2000):
+        op = random.random()
+        if op < 0.5:
+            item, key = random.randrange(200), random.randrange(1000)
+            changed = pq.push_or_decrease(item, key)
+            assert changed == (item not in ref or key < ref[item])
+            if changed:
+                ref[item] = key
+        elif ref:
+            key, item = pq.pop()
+            assert key == min(ref.values()) and ref.pop(item) == key
+        assert len(pq) == len(ref)
+    try:
+        pq.push_or_decrease(0, 0)
+        pq.decrease_key(0, 5)
+        assert False, "Should have raised"
+    except ValueError:
+        pass
+    print(colored("✓ IndexedMinHeap", "green"))
+
+    # RadixHeap: monotone pushes come back out sorted
+    rh = RadixHeap()
+    h: list[tuple[int, int]] = []
+    last = 0
+    for i in range(3000):
+        if h and random.random() < 0.4:
+            got = rh.pop()
+            want = heapq.heappop(h)
+            assert got[0] == want[0]
+            last = got[0]
+        else:
+            k = last + random.randrange(500)
+            rh.push(k, i)
+            heapq.heappush(h, (k, i))
+    try:
+        rh.push(last - 1, "x")
+        assert False, "Should have raised"
+    except ValueError:
+        pass
+    for bad in (2.5, -1, "7"):  # float, negative and non-numeric keys are rejected up front
+        try:
+            RadixHeap().push(bad, "x")
+            assert False, "Should have raised"
+        except ValueError:
+            pass
+    print(colored("✓ RadixHeap", "green"))
+
+    print(colored("\nAll tests passed.", "cyan"))
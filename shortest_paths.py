@@ -11,6 +11,8 @@ Key insight from dsa.md:
     Use when Dijkstra is not applicable.
   - Floyd-Warshall: O(V³). All-pairs shortest paths. Simple DP on a matrix.
     Only practical for small, dense graphs (V ≤ ~500).
+  - Large sparse graphs: pass a csr_graph.CSRGraph instead of a dict — the
+    flat offsets/targets/weights buffers avoid per-edge Python objects.
 
 Patterns covered:
   1. Dijkstra's Algorithm         — single-source, non-negative weights
@@ -18,20 +20,40 @@ Patterns covered:
   3. Bellman-Ford                 — single-source with negative weights
   4. Floyd-Warshall               — all-pairs shortest paths
   5. Cheapest Flights Within K Stops — LeetCode 787 (Bellman-Ford variant)
+  6. Point-to-Point Shortest Path — early exit, bidirectional Dijkstra, A*
+  7. Floyd-Warshall engines       — NumPy per-pivot and cache-blocked variants
+  8. Bellman-Ford variants        — SPFA work queue, NumPy scatter-min rounds
+  9. Johnson's Algorithm          — sparse all-pairs with negative edges, process pool
+  10. DelayTracker                — network_delay_time under edge updates
+  11. Cheapest Flights (Dijkstra) — (city, stops) states, dominance pruning, batches
+  12. Delta-Stepping              — bucketed SSSP with parallel relaxation chunks
 """
 
 import heapq
-from collections import defaultdict
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.sharedctypes import RawArray
 
 from termcolor import colored
 
+from csr_graph import CSRGraph
+from priority_queues import IndexedMinHeap, RadixHeap
+
+try:
+    import numpy as np
+except ImportError:  # optional — only the NumPy engines need it
+    np = None
+
 INF = float('inf')
 
 
 # ---------------------------------------------------------------------------
 # 1. Dijkstra's Algorithm
 # ---------------------------------------------------------------------------
-def dijkstra(graph: dict[int, list[tuple[int, int]]], src: int) -> dict[int, float]:
+def dijkstra(
+    graph: dict[int, list[tuple[int, int]]] | CSRGraph, src: int, queue: str = "heapq"
+) -> dict[int, float] | list[float]:
     """
     Single-source shortest paths using Dijkstra's algorithm.
 
@@ -48,18 +70,32 @@ def dijkstra(graph: dict[int, list[tuple[int, int]]], src: int) -> dict[int, flo
     extending the currently shortest known path.
 
     Args:
-        graph: adjacency list {node: [(neighbour, weight), ...]}
+        graph: adjacency list {node: [(neighbour, weight), ...]}, or a
+               CSRGraph (see csr_graph.py) for large graphs
         src:   source node
+        queue: "heapq"   — push duplicates, skip stale entries (default)
+               "indexed" — IndexedMinHeap with decrease_key; heap <= V entries
+               "radix"   — RadixHeap; non-negative integer weights only
+               (see priority_queues.py)
 
     Returns:
         dict mapping each node to its shortest distance from src
-        (INF if unreachable)
+        (INF if unreachable). For a CSRGraph, a list indexed by node id.
 
     Example:
         >>> g = {0:[(1,4),(2,1)], 1:[(3,1)], 2:[(1,2),(3,5)], 3:[]}
         >>> dijkstra(g, 0)
         {0: 0, 1: 3, 2: 1, 3: 4}
+        >>> dijkstra(CSRGraph.from_adjacency(g), 0)
+        [0, 3, 1, 4]
     """
+    if isinstance(graph, CSRGraph):
+        graph.require_weights("dijkstra")
+    if queue != "heapq":
+        return _dijkstra_pq(graph, src, queue)
+    if isinstance(graph, CSRGraph):
+        return _dijkstra_csr(graph, src)
+
     dist: dict[int, float] = {node: INF for node in graph}
     dist[src] = 0
     heap = [(0, src)]  # (distance, node)
@@ -76,10 +112,110 @@ def dijkstra(graph: dict[int, list[tuple[int, int]]], src: int) -> dict[int, flo
     return dist
 
 
+def _dijkstra_csr(graph: CSRGraph, src: int) -> list[float]:
+    """
+    Dijkstra over CSR buffers. Same algorithm as dijkstra(); the differences
+    are all constant-factor:
+      - dist is a flat list indexed by node id (no dict hashing)
+      - each node's edges are one contiguous slice of targets/weights,
+        iterated with zip() instead of unpacking per-edge tuples
+      - the popped distance d is reused rather than re-reading dist[u]
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    heappop, heappush = heapq.heappop, heapq.heappush
+    dist: list[float] = [INF] * graph.n
+    dist[src] = 0
+    heap = [(0, src)]
+
+    while heap:
+        d, u = heappop(heap)
+        if d > dist[u]:
+            continue  # stale entry
+        lo, hi = offsets[u], offsets[u + 1]
+        for v, w in zip(targets[lo:hi], weights[lo:hi]):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                heappush(heap, (nd, v))
+
+    return dist
+
+
+def _dijkstra_pq(graph, src: int, queue: str) -> dict[int, float] | list[float]:
+    """Dijkstra driven by one of the priority_queues.py structures."""
+    if isinstance(graph, CSRGraph):
+        dist: dict[int, float] | list[float] = [INF] * graph.n
+        neighbours = graph.neighbours
+    else:
+        dist = {node: INF for node in graph}
+        neighbours = graph.__getitem__
+    dist[src] = 0
+
+    if queue == "indexed":
+        # One entry per node: an improvement moves it up, nothing goes stale
+        pq = IndexedMinHeap()
+        pq.push(src, 0)
+        while pq:
+            d, u = pq.pop()
+            for v, w in neighbours(u):
+                nd = d + w
+                if nd < dist[v]:
+                    dist[v] = nd
+                    pq.push_or_decrease(v, nd)
+    elif queue == "radix":
+        # Popped distances are monotone, which is all a radix heap needs
+        rh = RadixHeap()
+        rh.push(0, src)
+        while rh:
+            d, u = rh.pop()
+            if d > dist[u]:
+                continue
+            for v, w in neighbours(u):
+                nd = d + w
+                if nd < dist[v]:
+                    dist[v] = nd
+                    rh.push(nd, v)
+    else:
+        raise ValueError(f"unknown queue {queue!r}")
+    return dist
+
+
+def benchmark_dijkstra_csr(n: int = 200_000, m: int = 1_000_000,
+                           seed: int = 0) -> dict[str, float]:
+    """
+    Time dijkstra on the same random graph as dict adjacency and as a
+    CSRGraph; prints a table (with the CSR speedup) and returns {label: seconds}.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    edges = [(rng.randrange(n), rng.randrange(n), rng.randint(1, 100)) for _ in range(m)]
+    adj: dict[int, list[tuple[int, int]]] = {u: [] for u in range(n)}
+    for u, v, w in edges:
+        adj[u].append((v, w))
+    csr = CSRGraph.from_edges(n, edges)
+
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    by_dict = dijkstra(adj, 0)
+    timings["dict"] = time.perf_counter() - start
+    start = time.perf_counter()
+    by_csr = dijkstra(csr, 0)
+    timings["csr"] = time.perf_counter() - start
+    assert by_csr == [by_dict[u] for u in range(n)]
+
+    print(colored(f"Dijkstra benchmark (V={n:,}, E={m:,})", "cyan"))
+    for label, secs in timings.items():
+        print(f"  {label:<6} {secs:8.3f}s")
+    print(f"  CSR speedup: {timings['dict'] / timings['csr']:.2f}x")
+    return timings
+
+
 # ---------------------------------------------------------------------------
 # 2. Network Delay Time (Dijkstra application)
 # ---------------------------------------------------------------------------
-def network_delay_time(times: list[list[int]], n: int, k: int) -> int:
+def network_delay_time(times: list[list[int]] | CSRGraph, n: int, k: int) -> int:
     """
     LeetCode 743 — Network Delay Time
     A signal is sent from node k. Find the time for ALL nodes to receive it.
@@ -95,7 +231,8 @@ def network_delay_time(times: list[list[int]], n: int, k: int) -> int:
     measuring how long until every server has received it.
 
     Args:
-        times: list of [u, v, w] directed edges (1-indexed nodes)
+        times: list of [u, v, w] directed edges (1-indexed nodes), or a
+               prebuilt CSRGraph with n + 1 node slots (slot 0 unused)
         n:     number of nodes
         k:     source node
 
@@ -106,17 +243,11 @@ def network_delay_time(times: list[list[int]], n: int, k: int) -> int:
         >>> network_delay_time([[2,1,1],[2,3,1],[3,4,1]], 4, 2)
         2
     """
-    graph: dict[int, list[tuple[int, int]]] = defaultdict(list)
-    for u, v, w in times:
-        graph[u].append((v, w))
-
-    # Ensure all nodes 1..n are in the graph (even if no outgoing edges)
-    for i in range(1, n + 1):
-        if i not in graph:
-            graph[i] = []
+    # CSR with n + 1 slots: nodes 1..n are present even with no out-edges
+    graph = times if isinstance(times, CSRGraph) else CSRGraph.from_edges(n + 1, times)
 
     dist = dijkstra(graph, k)
-    max_dist = max(dist.values())
+    max_dist = max(dist[1:n + 1])
     return max_dist if max_dist < INF else -1
 
 
@@ -276,19 +407,983 @@ def find_cheapest_price(
     return dist[dst] if dist[dst] != INF else -1
 
 
+# ---------------------------------------------------------------------------
+# 6. Point-to-Point Shortest Path (early exit, bidirectional, A*)
+# ---------------------------------------------------------------------------
+def _neighbours_fn(graph):
+    """Return an out-edge accessor u -> iterable of (v, w) for dict or CSR graphs."""
+    if isinstance(graph, CSRGraph):
+        graph.require_weights("shortest_path")
+        return graph.neighbours
+    return lambda u: graph.get(u, ())
+
+
+def _build_path(parent: dict[int, int], node: int) -> list[int]:
+    """Walk parent pointers back from node to the source (parent[src] = -1)."""
+    path = []
+    while node != -1:
+        path.append(node)
+        node = parent[node]
+    return path[::-1]
+
+
+def reverse_graph(graph: dict[int, list[tuple[int, int]]] | CSRGraph):
+    """
+    Transpose a weighted graph (u→v becomes v→u).
+
+    Build this once and pass it as `reverse=` to bidirectional queries —
+    otherwise every call pays O(V + E) to rebuild it.
+    """
+    if isinstance(graph, CSRGraph):
+        return graph.reversed()
+    rev: dict[int, list[tuple[int, int]]] = {u: [] for u in graph}
+    for u, adj in graph.items():
+        for v, w in adj:
+            rev.setdefault(v, []).append((u, w))
+    return rev
+
+
+def shortest_path(
+    graph: dict[int, list[tuple[int, int]]] | CSRGraph,
+    src: int,
+    dst: int,
+    method: str = "dijkstra",
+    heuristic=None,
+    reverse=None,
+) -> tuple[float, list[int]]:
+    """
+    Single-pair shortest path: distance AND the node path from src to dst.
+
+    Approach: pick one of three strategies, all of which stop as soon as dst
+    is proven optimal instead of settling every reachable node:
+      - "dijkstra":      plain Dijkstra that returns when dst is popped
+      - "bidirectional": Dijkstra from src and (on the reverse graph) from
+                         dst at once; stops when the two frontiers meet
+      - "astar":         Dijkstra ordered by g(v) + h(v), where h is an
+                         admissible lower bound on the remaining distance
+
+    T: O((V + E) log V) worst case; in practice only the ball around src
+       (or two half-radius balls, or the heuristic-guided corridor) is touched
+    S: O(V) for the nodes actually visited
+
+    Real-world analogy: a satnav only needs the route to your destination,
+    not the route to every address in the country.
+
+    Args:
+        graph:     adjacency list {node: [(neighbour, weight), ...]} or CSRGraph
+        src, dst:  endpoints
+        method:    "dijkstra", "bidirectional" or "astar"
+        heuristic: h(node) -> float, required for "astar"
+        reverse:   prebuilt reverse_graph(graph) for "bidirectional"
+
+    Returns:
+        (distance, path) — (INF, []) if dst is unreachable
+
+    Example:
+        >>> g = {0:[(1,4),(2,1)], 1:[(3,1)], 2:[(1,2),(3,5)], 3:[]}
+        >>> shortest_path(g, 0, 3)
+        (4, [0, 2, 1, 3])
+        >>> shortest_path(g, 0, 3, method="bidirectional")
+        (4, [0, 2, 1, 3])
+    """
+    if method == "dijkstra":
+        return _dijkstra_to_target(graph, src, dst)
+    if method == "bidirectional":
+        return bidirectional_dijkstra(graph, src, dst, reverse)
+    if method == "astar":
+        if heuristic is None:
+            raise ValueError("method='astar' requires a heuristic")
+        return astar(graph, src, dst, heuristic)
+    raise ValueError(f"unknown method {method!r}")
+
+
+def _dijkstra_to_target(graph, src: int, dst: int) -> tuple[float, list[int]]:
+    """Dijkstra with early termination the first time dst is popped."""
+    neighbours = _neighbours_fn(graph)
+    dist: dict[int, float] = {src: 0}
+    parent: dict[int, int] = {src: -1}
+    heap = [(0, src)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue  # stale entry
+        if u == dst:
+            return d, _build_path(parent, dst)  # settled — nothing can beat d
+        for v, w in neighbours(u):
+            nd = d + w
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                parent[v] = u
+                heapq.heappush(heap, (nd, v))
+
+    return INF, []
+
+
+def bidirectional_dijkstra(graph, src: int, dst: int, reverse=None) -> tuple[float, list[int]]:
+    """
+    Bidirectional Dijkstra: alternate a forward search from src and a
+    backward search from dst over the reverse graph.
+
+    Stopping rule: let mu be the best src→x→dst length seen where x has been
+    reached by both searches. Once top(forward heap) + top(backward heap)
+    >= mu, no unexplored path can be shorter than mu.
+
+    Each search explores a ball of roughly half the radius, which on road-like
+    graphs is far fewer nodes than one full-radius ball.
+
+    T: O((V + E) log V) worst case
+    S: O(V) visited nodes across both searches
+    """
+    if src == dst:
+        return 0, [src]
+    if reverse is None:
+        reverse = reverse_graph(graph)
+    nbrs = (_neighbours_fn(graph), _neighbours_fn(reverse))
+    dist: tuple[dict, dict] = ({src: 0}, {dst: 0})
+    parent: tuple[dict, dict] = ({src: -1}, {dst: -1})
+    heaps = ([(0, src)], [(0, dst)])
+    mu, meet = INF, -1
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= mu:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1  # grow the smaller frontier
+        d, u = heapq.heappop(heaps[side])
+        if d > dist[side][u]:
+            continue
+        this_dist, other_dist = dist[side], dist[1 - side]
+        for v, w in nbrs[side](u):
+            nd = d + w
+            if nd < this_dist.get(v, INF):
+                this_dist[v] = nd
+                parent[side][v] = u
+                heapq.heappush(heaps[side], (nd, v))
+            if v in other_dist and nd + other_dist[v] < mu:
+                mu, meet = nd + other_dist[v], v
+
+    if meet == -1:
+        return INF, []
+    forward = _build_path(parent[0], meet)
+    backward = _build_path(parent[1], meet)[::-1]  # meet → ... → dst
+    return mu, forward + backward[1:]
+
+
+def astar(graph, src: int, dst: int, heuristic) -> tuple[float, list[int]]:
+    """
+    A* search: Dijkstra ordered by f(v) = g(v) + h(v).
+
+    h must be admissible (never overestimate the true remaining distance),
+    e.g. straight-line distance / max speed on a road network. With h = 0
+    this is exactly _dijkstra_to_target. Stale entries are skipped by
+    comparing g, so an admissible-but-inconsistent h still gives the optimum
+    (nodes are simply re-expanded when a cheaper g is found).
+
+    T: O((V + E) log V) worst case; a tight h explores only a narrow corridor
+    S: O(V) visited nodes
+    """
+    neighbours = _neighbours_fn(graph)
+    g: dict[int, float] = {src: 0}
+    parent: dict[int, int] = {src: -1}
+    heap = [(heuristic(src), 0, src)]  # (f, g, node)
+
+    while heap:
+        _, d, u = heapq.heappop(heap)
+        if d > g[u]:
+            continue
+        if u == dst:
+            return d, _build_path(parent, dst)
+        for v, w in neighbours(u):
+            nd = d + w
+            if nd < g.get(v, INF):
+                g[v] = nd
+                parent[v] = u
+                heapq.heappush(heap, (nd + heuristic(v), nd, v))
+
+    return INF, []
+
+
+# ---------------------------------------------------------------------------
+# 7. Floyd-Warshall engines (NumPy: vectorized per pivot, cache-blocked tiles)
+# ---------------------------------------------------------------------------
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("this engine needs NumPy — pip install -e '.[fast]'")
+
+
+def _fw_init(matrix, return_successors: bool):
+    """Float distance matrix plus (optionally) the initial successor matrix."""
+    _require_numpy()
+    dist = np.array(matrix, dtype=np.float64)
+    n = dist.shape[0]
+    if not return_successors:
+        return dist, None
+    # succ[i][j] = next hop after i on the best known i→j path, -1 if none
+    succ = np.where(np.isfinite(dist), np.arange(n)[None, :], -1)
+    np.fill_diagonal(succ, np.arange(n))
+    return dist, succ
+
+
+def _fw_finish(dist, succ):
+    if (np.diagonal(dist) < 0).any():
+        raise ValueError("Graph contains a negative cycle")
+    return (dist, succ) if succ is not None else dist
+
+
+def _fw_sweep(dist, succ, ks, rows, cols) -> None:
+    """Per-pivot FW restricted to dist[rows, cols], pivots taken in order from ks."""
+    block = dist[rows, cols]
+    cand = np.empty_like(block)  # scratch reused across pivots
+    for k in ks:
+        np.add(dist[rows, k][:, None], dist[k, cols][None, :], out=cand)
+        if succ is None:
+            np.minimum(block, cand, out=block)
+        else:
+            better = cand < block
+            block[better] = cand[better]
+            sub = succ[rows, cols]
+            sub[better] = np.broadcast_to(succ[rows, k][:, None], sub.shape)[better]
+
+
+def floyd_warshall_numpy(matrix, return_successors: bool = False):
+    """
+    Floyd-Warshall with one vectorized min-plus update per pivot k.
+
+    Approach: same DP as floyd_warshall, but the two inner loops become a
+    single broadcast:
+        dist = minimum(dist, dist[:, k, None] + dist[None, k, :])
+    INF needs no special case: inf + x = inf never wins a minimum.
+
+    T: O(V³) arithmetic, but V iterations of C-speed O(V²) array work
+    S: O(V²)
+
+    Args:
+        matrix:            V×V matrix as for floyd_warshall (INF = no edge)
+        return_successors: also return succ where succ[i][j] is the next hop
+                           from i towards j (-1 if unreachable)
+
+    Returns:
+        dist ndarray, or (dist, succ) if return_successors
+
+    Raises:
+        ValueError if a negative cycle is detected
+        ImportError if NumPy is not installed
+
+    Example:
+        >>> m = [[0,3,INF,5],[2,0,INF,4],[INF,1,0,INF],[INF,INF,2,0]]
+        >>> floyd_warshall_numpy(m)[0].tolist()
+        [0.0, 3.0, 7.0, 5.0]
+    """
+    dist, succ = _fw_init(matrix, return_successors)
+    n = dist.shape[0]
+    everything = slice(0, n)
+    _fw_sweep(dist, succ, range(n), everything, everything)
+    return _fw_finish(dist, succ)
+
+
+def floyd_warshall_blocked(matrix, block: int = 64, return_successors: bool = False):
+    """
+    Cache-blocked (tiled) Floyd-Warshall.
+
+    Approach: split the matrix into block×block tiles. For each diagonal
+    tile kb (pivots kb.start..kb.stop-1):
+      1. Row panel     dist[kb, :]  — per-pivot sweep, pivots in kb
+      2. Column panel  dist[:, kb]  — per-pivot sweep (uses the final
+                                      diagonal tile from step 1)
+      3. Every other tile (I, J) at once, since both panels are now final:
+             dist[I, J] = min(dist[I, J], min_k dist[I, k] + dist[k, J])
+         as one b×b×b broadcast that stays inside the cache.
+    Step 3 is where almost all the work is, and it touches only three
+    tiles at a time instead of streaming the whole V×V matrix per pivot.
+
+    T: O(V³)  S: O(V² + b³) scratch
+    Same arguments, return values and errors as floyd_warshall_numpy.
+    """
+    dist, succ = _fw_init(matrix, return_successors)
+    n = dist.shape[0]
+    everything = slice(0, n)
+    tiles = [slice(s, min(s + block, n)) for s in range(0, n, block)]
+
+    for kb in tiles:
+        ks = range(kb.start, kb.stop)
+        _fw_sweep(dist, succ, ks, kb, everything)
+        _fw_sweep(dist, succ, ks, everything, kb)
+        for I in tiles:
+            if I == kb:
+                continue
+            left = dist[I, kb]                      # |I| × b, final
+            for J in tiles:
+                if J == kb:
+                    continue
+                cand = left[:, :, None] + dist[kb, J][None, :, :]  # |I| × b × |J|
+                tile = dist[I, J]
+                if succ is None:
+                    np.minimum(tile, cand.min(axis=1), out=tile)
+                    continue
+                best_k = cand.argmin(axis=1)
+                best = np.take_along_axis(cand, best_k[:, None, :], axis=1)[:, 0, :]
+                better = best < tile
+                tile[better] = best[better]
+                hop = np.take_along_axis(succ[I, kb], best_k, axis=1)
+                succ[I, J][better] = hop[better]
+
+    return _fw_finish(dist, succ)
+
+
+def reconstruct_path(succ, i: int, j: int) -> list[int]:
+    """Follow a successor matrix from i to j. Returns [] if j is unreachable."""
+    if succ[i][j] == -1:
+        return []
+    path = [i]
+    while i != j:
+        i = int(succ[i][j])
+        path.append(i)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# 8. Bellman-Ford variants: work-queue (SPFA) and NumPy scatter-min rounds
+# ---------------------------------------------------------------------------
+def _extract_cycle(parent, start, n: int) -> list:
+    """
+    Recover a negative cycle from parent pointers.
+
+    start was improved in round V, so walking n parent steps back from it
+    is guaranteed to land on the cycle; then walk until we return.
+    Returned in edge order: c0 → c1 → ... → ck → c0.
+    """
+    node = start
+    for _ in range(n):
+        node = parent[node]
+    cycle = [node]
+    cur = parent[node]
+    while cur != node:
+        cycle.append(cur)
+        cur = parent[cur]
+    cycle.reverse()
+    return [c.item() if hasattr(c, "item") else c for c in cycle]
+
+
+def spfa(vertices: list, edges: list[tuple], src, return_cycle: bool = False):
+    """
+    Queue-based Bellman-Ford (Shortest Path Faster Algorithm).
+
+    Approach: round r only relaxes the out-edges of vertices whose distance
+    changed in round r-1. An edge whose tail did not change would produce
+    the same candidate as last time, so skipping it loses nothing — each
+    round is equivalent to a full bellman_ford pass. If a vertex still
+    improves in round V, a negative cycle is reachable from src.
+
+    T: O(V * E) worst case, typically close to O(E) on real graphs
+    S: O(V + E) — adjacency list, distances, parents
+
+    Args:
+        vertices, edges, src: as for bellman_ford
+        return_cycle:         return (dist_or_None, cycle) instead, where
+                              cycle lists the vertices of the negative cycle
+                              found ([] if none)
+
+    Returns:
+        dict of shortest distances, or None if a negative cycle exists
+
+    Example:
+        >>> spfa([0,1,2,3], [(0,1,1),(0,2,4),(1,2,2),(1,3,5),(2,3,1)], 0)
+        {0: 0, 1: 1, 2: 3, 3: 4}
+        >>> spfa([0,1,2], [(0,1,1),(1,2,-1),(2,0,-1)], 0, return_cycle=True)
+        (None, [0, 1, 2])
+    """
+    adj: dict = {v: [] for v in vertices}
+    for u, v, w in edges:
+        adj[u].append((v, w))
+    dist = {v: INF for v in vertices}
+    parent = {src: src}
+    dist[src] = 0
+    frontier = [src]
+
+    for _ in range(len(vertices)):  # rounds 1..V; round V is the cycle check
+        changed: dict = {}           # insertion-ordered set of improved vertices
+        for u in frontier:
+            du = dist[u]
+            for v, w in adj[u]:
+                if du + w < dist[v]:
+                    dist[v] = du + w
+                    parent[v] = u
+                    changed[v] = None
+        frontier = list(changed)
+        if not frontier:
+            return (dist, []) if return_cycle else dist
+
+    # Still improving after V rounds → negative cycle
+    if return_cycle:
+        return None, _extract_cycle(parent, frontier[0], len(vertices))
+    return None
+
+
+def bellman_ford_numpy(n: int, edges, src: int, return_cycle: bool = False):
+    """
+    Bellman-Ford where every round is one vectorized scatter-min.
+
+    Approach: edges are sorted by head once, so each round is
+        cand = dist[u] + w                       (gather, E adds)
+        best = minimum.reduceat(cand, starts)    (per-head minimum)
+        dist[heads] = minimum(dist[heads], best) (scatter)
+    Rounds read the previous round's distances (Jacobi order), which still
+    converges within V-1 rounds. Improvement in round V means a negative cycle.
+
+    T: O(V * E) worst case, but each round runs in C
+    S: O(V + E)
+
+    Args:
+        n:            number of vertices (0..n-1)
+        edges:        (u, v, w) rows — list of tuples or an E×3 array
+        src:          source vertex
+        return_cycle: as for spfa
+
+    Returns:
+        float ndarray of distances (inf if unreachable), or None on a
+        negative cycle
+
+    Raises:
+        ImportError if NumPy is not installed
+    """
+    _require_numpy()
+    dist = np.full(n, np.inf)
+    dist[src] = 0.0
+    parent = np.full(n, -1, dtype=np.int64)
+    parent[src] = src
+    e = np.asarray(edges, dtype=np.float64).reshape(-1, 3)
+    if e.shape[0] == 0:
+        return (dist, []) if return_cycle else dist
+
+    order = np.argsort(e[:, 1], kind="stable")
+    tails = e[order, 0].astype(np.int64)
+    heads = e[order, 1].astype(np.int64)
+    weights = e[order, 2]
+    starts = np.flatnonzero(np.r_[True, heads[1:] != heads[:-1]])
+    seg_heads = heads[starts]
+    seg_of_edge = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(heads)]))
+
+    improved_heads = seg_heads[:0]
+    for _ in range(n):
+        cand = dist[tails] + weights
+        best = np.minimum.reduceat(cand, starts)
+        improved = best < dist[seg_heads]
+        if not improved.any():
+            return (dist, []) if return_cycle else dist
+        # Parent = first edge in each improved segment that achieves the minimum
+        winners = np.flatnonzero((cand == best[seg_of_edge]) & improved[seg_of_edge])
+        _, first = np.unique(seg_of_edge[winners], return_index=True)
+        winners = winners[first]
+        improved_heads = heads[winners]
+        dist[improved_heads] = cand[winners]
+        parent[improved_heads] = tails[winners]
+
+    if return_cycle:
+        return None, _extract_cycle(parent, improved_heads[0], n)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# 9. Johnson's All-Pairs Shortest Paths (process-pool fan-out)
+# ---------------------------------------------------------------------------
+_johnson_state: dict = {}  # per-worker view of the shared reweighted graph
+
+
+def _johnson_init(shared: tuple, h: list[float]) -> None:
+    """Pool initializer: map the shared CSR buffers once per worker, not once per task."""
+    _johnson_state["graph"] = CSRGraph.attach(*shared)
+    _johnson_state["h"] = h
+
+
+def _johnson_rows(sources: range) -> list[bytes]:
+    """Dijkstra from each source on the reweighted graph, then undo the reweighting."""
+    graph, h = _johnson_state["graph"], _johnson_state["h"]
+    rows = []
+    for s in sources:
+        d = _dijkstra_csr(graph, s)
+        hs = h[s]
+        rows.append(array('d', [dv - hs + hv for dv, hv in zip(d, h)]).tobytes())
+    return rows
+
+
+def johnson(n: int, edges: list[tuple[int, int, int]], workers: int | None = None):
+    """
+    Johnson's algorithm — all-pairs shortest paths on sparse graphs with
+    negative edges (but no negative cycles).
+
+    Approach:
+      1. Add a virtual vertex q with a 0-weight edge to every vertex and run
+         bellman_ford from q to get potentials h(v).
+      2. Reweight: w'(u,v) = w(u,v) + h(u) - h(v) >= 0, so Dijkstra applies
+         and shortest paths are unchanged (every s→t path shifts by h(s) - h(t)).
+      3. Run dijkstra from every source on the reweighted CSR graph and
+         shift back: d(s,t) = d'(s,t) - h(s) + h(t).
+    Step 3 is embarrassingly parallel. Sources are split into chunks across a
+    ProcessPoolExecutor. The reweighted CSR buffers go into shared memory
+    (CSRGraph.share), so every worker reads the same copy.
+
+    T: O(VE + V (V + E) log V) total, step 3 divided across workers
+    S: O(V²) for the result — one array('d') row per source (8 bytes per
+       entry) instead of V dicts
+
+    Real-world analogy: precomputing a full fare matrix where some legs
+    carry rebates (negative edges) — one pass to normalise the prices,
+    then independent route searches from every station in parallel.
+
+    Args:
+        n:       number of vertices (0..n-1)
+        edges:   list of (u, v, weight) directed edges
+        workers: process count; None = os.cpu_count(), 1 = run in-process
+
+    Returns:
+        list of n array('d') rows, dist[s][t] (inf if unreachable),
+        or None if a negative cycle exists
+
+    Example:
+        >>> dist = johnson(3, [(0,1,-2),(1,2,3),(0,2,4)], workers=1)
+        >>> [list(row) for row in dist]
+        [[0.0, -2.0, 1.0], [inf, 0.0, 3.0], [inf, inf, 0.0]]
+    """
+    q = n  # virtual source
+    h_dict = bellman_ford(list(range(n + 1)), list(edges) + [(q, v, 0) for v in range(n)], q)
+    if h_dict is None:
+        return None
+    h = [h_dict[v] for v in range(n)]
+    graph = CSRGraph.from_edges(n, [(u, v, w + h[u] - h[v]) for u, v, w in edges])
+
+    workers = workers or os.cpu_count() or 1
+    try:
+        if workers == 1 or n < 2:
+            _johnson_state.update(graph=graph, h=h)
+            rows = _johnson_rows(range(n))
+        else:
+            chunk = max(1, -(-n // (workers * 4)))  # a few chunks per worker for balance
+            chunks = [range(i, min(i + chunk, n)) for i in range(0, n, chunk)]
+            with ProcessPoolExecutor(workers, initializer=_johnson_init,
+                                     initargs=(graph.share(), h)) as pool:
+                rows = [row for part in pool.map(_johnson_rows, chunks) for row in part]
+    finally:
+        _johnson_state.clear()  # don't keep the reweighted graph alive after returning
+    return [array('d', row) for row in rows]
+
+
+# ---------------------------------------------------------------------------
+# 10. Incremental Network Delay Time (dynamic SSSP under edge updates)
+# ---------------------------------------------------------------------------
+class DelayTracker:
+    """
+    Stateful network_delay_time that absorbs edge updates incrementally.
+
+    Reference: Ramalingam & Reps, "An incremental algorithm for a
+               generalization of the shortest-path problem" (1996)
+
+    Keeps the shortest-path tree from k (dist + parent + children) and
+    repairs only what an update can change:
+      - Insert / cheaper edge u→v: if it improves dist[v], run Dijkstra
+        seeded with v alone — only nodes that actually improve are pushed.
+      - Delete / dearer tree edge u→v: only v's subtree in the shortest-path
+        tree can get worse. Reset that subtree, seed each of its nodes from
+        in-edges that come from outside the subtree, and run Dijkstra over it.
+      - Delete / dearer non-tree edge: no distance changes at all.
+
+    T: O(A log A + edges touching A) per update, A = nodes whose distance
+       changes (insert) or the affected subtree (delete); O(V) for max_delay
+    S: O(V + E)
+
+    Real-world analogy: a routing daemon that patches its table when one
+    link flaps instead of re-running SPF over the whole network.
+
+    Args:
+        times: list of [u, v, w] directed edges (1-indexed nodes)
+        n:     number of nodes
+        k:     source node
+
+    Example:
+        >>> t = DelayTracker([[2,1,1],[2,3,1],[3,4,1]], 4, 2)
+        >>> t.max_delay()
+        2
+        >>> t.add_edge(2, 4, 1); t.max_delay()
+        1
+        >>> t.remove_edge(2, 1); t.max_delay()
+        -1
+    """
+
+    def __init__(self, times: list[list[int]], n: int, k: int):
+        self.n, self.k = n, k
+        self.out: list[dict[int, int]] = [{} for _ in range(n + 1)]
+        self.inn: list[dict[int, int]] = [{} for _ in range(n + 1)]
+        for u, v, w in times:
+            if v not in self.out[u] or w < self.out[u][v]:
+                self.out[u][v] = w
+                self.inn[v][u] = w
+        self.dist: list[float] = [INF] * (n + 1)
+        self.parent = [-1] * (n + 1)
+        self.children: list[set[int]] = [set() for _ in range(n + 1)]
+        self.dist[k] = 0
+        self._propagate([(0, k)])
+
+    def max_delay(self) -> int:
+        """Same answer network_delay_time would give for the current edges."""
+        worst = max(self.dist[1:])
+        return worst if worst < INF else -1
+
+    def add_edge(self, u: int, v: int, w: int) -> None:
+        """Insert edge u→v, or change its weight if it already exists."""
+        old = self.out[u].get(v)
+        self.out[u][v] = w
+        self.inn[v][u] = w
+        if old is None or w < old:
+            if self.dist[u] + w < self.dist[v]:
+                self.dist[v] = self.dist[u] + w
+                self._set_parent(v, u)
+                self._propagate([(self.dist[v], v)])
+        elif w > old and self.parent[v] == u:
+            self._rebuild_subtree(v)
+
+    def remove_edge(self, u: int, v: int) -> None:
+        """Delete edge u→v (KeyError if absent)."""
+        del self.out[u][v]
+        del self.inn[v][u]
+        if self.parent[v] == u:
+            self._rebuild_subtree(v)
+
+    def _set_parent(self, v: int, p: int) -> None:
+        old = self.parent[v]
+        if old != -1:
+            self.children[old].discard(v)
+        self.parent[v] = p
+        if p != -1:
+            self.children[p].add(v)
+
+    def _propagate(self, heap: list[tuple[float, int]]) -> None:
+        """Dijkstra from the seeded heap; only improved nodes are ever pushed."""
+        heapq.heapify(heap)
+        dist, out = self.dist, self.out
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            for v, w in out[u].items():
+                if d + w < dist[v]:
+                    dist[v] = d + w
+                    self._set_parent(v, u)
+                    heapq.heappush(heap, (dist[v], v))
+
+    def _rebuild_subtree(self, root: int) -> None:
+        """Recompute distances for root's shortest-path subtree only."""
+        affected = [root]
+        for x in affected:  # BFS over the tree; the list grows as we iterate
+            affected.extend(self.children[x])
+        in_subtree = set(affected)
+        for x in affected:
+            self.dist[x] = INF
+            self._set_parent(x, -1)
+
+        heap = []
+        dist = self.dist
+        for x in affected:
+            for p, w in self.inn[x].items():
+                if p not in in_subtree and dist[p] + w < dist[x]:
+                    dist[x] = dist[p] + w
+                    self._set_parent(x, p)
+            if dist[x] < INF:
+                heap.append((dist[x], x))
+        self._propagate(heap)
+
+
+# ---------------------------------------------------------------------------
+# 11. Cheapest Flights: Dijkstra over (city, stops) + batch flight index
+# ---------------------------------------------------------------------------
+class FlightIndex:
+    """
+    Prebuilt flight table answering many LeetCode 787 queries.
+
+    Approach: Dijkstra over states (city, legs flown), ordered by price.
+    Because prices pop in increasing order, the first time a city is popped
+    with L legs, any later state for that city with >= L legs is dominated
+    (costlier AND no fewer stops) and is dropped — at pop time and before
+    it is even pushed. A query stops as soon as dst is popped.
+
+    Batches group queries by (src, k): a group of one uses the early-exit
+    search; a larger group runs one full search from src and answers every
+    dst in it.
+
+    T: O(S log S) per query where S = states surviving dominance pruning
+       (at most V * (k+1), usually close to V); index build O(V + E)
+    S: O(V + E) index, O(S) per search
+
+    Real-world analogy: a fare engine that loads the timetable once and
+    serves thousands of itinerary searches against it.
+
+    Example:
+        >>> idx = FlightIndex(4, [[0,1,100],[1,2,100],[2,0,100],[1,3,600],[2,3,200]])
+        >>> idx.query(0, 3, 1)
+        700
+        >>> idx.query_many([(0, 3, 1), (0, 3, 2), (0, 2, 0)])
+        [700, 400, -1]
+    """
+
+    def __init__(self, n: int, flights: list[list[int]]):
+        self.n = n
+        self.graph = CSRGraph.from_edges(n, flights)
+
+    def _search(self, src: int, k: int, dst: int = -1) -> dict[int, float]:
+        """Cheapest price to each popped city with <= k+1 legs; stops early at dst."""
+        max_legs = k + 1
+        offsets, targets, prices = self.graph.offsets, self.graph.targets, self.graph.weights
+        best_legs = [max_legs + 1] * self.n  # fewest legs at which each city was settled
+        cheapest: dict[int, float] = {}
+        heap = [(0, 0, src)]  # (price, legs, city)
+
+        while heap:
+            cost, legs, u = heapq.heappop(heap)
+            if legs >= best_legs[u]:
+                continue  # dominated: reached cheaper with no more legs
+            best_legs[u] = legs
+            cheapest.setdefault(u, cost)
+            if u == dst:
+                break
+            if legs == max_legs:
+                continue
+            nl = legs + 1
+            lo, hi = offsets[u], offsets[u + 1]
+            for v, p in zip(targets[lo:hi], prices[lo:hi]):
+                if nl < best_legs[v]:
+                    heapq.heappush(heap, (cost + p, nl, v))
+        return cheapest
+
+    def query(self, src: int, dst: int, k: int) -> int:
+        """Cheapest src→dst price with at most k stops, or -1."""
+        return self._search(src, k, dst).get(dst, -1)
+
+    def query_many(self, queries: list[tuple[int, int, int]]) -> list[int]:
+        """Answer (src, dst, k) queries in input order, sharing searches per (src, k)."""
+        groups: dict[tuple[int, int], list[int]] = {}
+        for i, (src, _, k) in enumerate(queries):
+            groups.setdefault((src, k), []).append(i)
+
+        answers = [-1] * len(queries)
+        for (src, k), idxs in groups.items():
+            if len(idxs) == 1:
+                answers[idxs[0]] = self.query(src, queries[idxs[0]][1], k)
+                continue
+            cheapest = self._search(src, k)
+            for i in idxs:
+                answers[i] = cheapest.get(queries[i][1], -1)
+        return answers
+
+
+def find_cheapest_price_dijkstra(
+    n: int, flights: list[list[int]], src: int, dst: int, k: int
+) -> int:
+    """
+    LeetCode 787 via Dijkstra over (city, stops) with dominance pruning.
+    Same contract as find_cheapest_price; see FlightIndex for the approach.
+
+    Example:
+        >>> fl = [[0,1,100],[1,2,100],[2,0,100],[1,3,600],[2,3,200]]
+        >>> find_cheapest_price_dijkstra(4, fl, 0, 3, 1)
+        700
+    """
+    return FlightIndex(n, flights).query(src, dst, k)
+
+
+# ---------------------------------------------------------------------------
+# 12. Delta-Stepping (parallel single-source shortest paths)
+# ---------------------------------------------------------------------------
+_delta_state: dict = {}  # per-worker: graph, shared dist, delta
+
+
+def _delta_init(graph: CSRGraph, dist, delta: float) -> None:
+    """Pool initializer: the graph and the shared dist array arrive once per worker."""
+    _delta_state["graph"] = graph
+    _delta_state["dist"] = dist
+    _delta_state["delta"] = delta
+
+
+def _delta_relax(nodes: list[int], light: bool) -> list[tuple[int, float]]:
+    """
+    Relaxation requests (v, new_dist) for the light (w <= delta) or heavy
+    out-edges of nodes. Reads the shared dist array but never writes it —
+    the parent applies requests, so no two processes race on one slot.
+    """
+    graph, dist, delta = _delta_state["graph"], _delta_state["dist"], _delta_state["delta"]
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    requests = []
+    for u in nodes:
+        du = dist[u]
+        lo, hi = offsets[u], offsets[u + 1]
+        for v, w in zip(targets[lo:hi], weights[lo:hi]):
+            if (w <= delta) is light and du + w < dist[v]:
+                requests.append((v, du + w))
+    return requests
+
+
+def delta_stepping(
+    graph: CSRGraph, src: int, delta: float | None = None,
+    workers: int = 1, min_chunk: int = 2048,
+) -> list[float]:
+    """
+    Delta-stepping SSSP (Meyer & Sanders, 2003).
+
+    Approach: instead of one global priority queue, nodes sit in buckets of
+    width delta by tentative distance. The lowest non-empty bucket is
+    processed as a batch:
+      1. Relax the light edges (w <= delta) of every node in the bucket;
+         these can re-insert nodes into the same bucket, so repeat until
+         the bucket stays empty.
+      2. Relax the heavy edges (w > delta) of every node settled in that
+         bucket once — they can only land in later buckets.
+    Every node in a bucket is independent, so each batch is split into
+    chunks relaxed in worker processes. Workers read dist from a shared
+    RawArray and return (v, new_dist) requests; the parent keeps the
+    minimum per node and rebuckets.
+
+    delta trades work for parallelism: delta → 0 degenerates to Dijkstra
+    (tiny buckets, no redundant work), delta → ∞ to Bellman-Ford (one huge
+    bucket, lots of re-relaxation). The default is the mean edge weight.
+
+    T: O(V + E + (L / delta) * phases) sequential work, L = max distance
+    S: O(V + E)
+
+    Args:
+        graph:     CSRGraph with non-negative weights
+        src:       source node
+        delta:     bucket width (default: mean edge weight)
+        workers:   processes for relaxation; 1 runs everything in-process
+        min_chunk: batches smaller than this are relaxed in-process, since
+                   shipping them to a worker costs more than relaxing them
+
+    Returns:
+        list of distances indexed by node id (INF if unreachable) —
+        identical to dijkstra(graph, src)
+
+    Example:
+        >>> g = CSRGraph.from_adjacency({0:[(1,4),(2,1)], 1:[(3,1)], 2:[(1,2),(3,5)], 3:[]})
+        >>> delta_stepping(g, 0, delta=2)
+        [0.0, 3.0, 1.0, 4.0]
+    """
+    graph.require_weights("delta_stepping")
+    n = graph.n
+    if delta is None:
+        delta = (sum(graph.weights) / graph.num_edges) if graph.num_edges else 1
+        delta = max(delta, 1e-9)
+    dist = RawArray('d', n) if workers > 1 else array('d', bytes(8 * n))
+    for i in range(n):
+        dist[i] = INF
+    dist[src] = 0.0
+    pool = None
+
+    def relax(nodes: list[int], light: bool) -> None:
+        if pool is None or len(nodes) < min_chunk:
+            requests = [_delta_relax(nodes, light)]
+        else:
+            size = -(-len(nodes) // workers)
+            chunks = [nodes[i:i + size] for i in range(0, len(nodes), size)]
+            requests = pool.map(_delta_relax, chunks, [light] * len(chunks))
+        for part in requests:
+            for v, nd in part:
+                old = dist[v]
+                if nd < old:
+                    if old < INF:
+                        bucket = buckets.get(int(old // delta))
+                        if bucket is not None:
+                            bucket.discard(v)
+                    dist[v] = nd
+                    buckets.setdefault(int(nd // delta), set()).add(v)
+
+    buckets: dict[int, set[int]] = {0: {src}}
+    try:
+        _delta_init(graph, dist, delta)
+        if workers > 1:
+            pool = ProcessPoolExecutor(workers, initializer=_delta_init,
+                                       initargs=(graph, dist, delta))
+        while buckets:
+            i = min(buckets)
+            settled: list[int] = []
+            while buckets.get(i):
+                frontier = list(buckets.pop(i))
+                settled.extend(frontier)
+                relax(frontier, light=True)
+            buckets.pop(i, None)
+            relax(settled, light=False)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        _delta_state.clear()  # don't keep the graph and dist alive after returning
+
+    return list(dist)
+
+
+def benchmark_delta_stepping(
+    n: int = 200_000, m: int = 2_000_000, delta: float | None = None,
+    worker_counts: tuple[int, ...] = (1, 2, 4, 8), seed: int = 0,
+) -> dict[str, float]:
+    """
+    Time sequential dijkstra against delta_stepping at several worker counts
+    on a random graph; prints a table and returns {label: seconds}.
+
+    Speed-up depends on core count and on how many nodes share a bucket —
+    wide, shallow graphs (large frontiers) parallelise best.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    graph = CSRGraph.from_edges(
+        n, [(rng.randrange(n), rng.randrange(n), rng.randint(1, 100)) for _ in range(m)])
+    timings: dict[str, float] = {}
+
+    start = time.perf_counter()
+    expected = dijkstra(graph, 0)
+    timings["dijkstra"] = time.perf_counter() - start
+    for w in worker_counts:
+        start = time.perf_counter()
+        got = delta_stepping(graph, 0, delta, workers=w)
+        timings[f"delta_stepping x{w}"] = time.perf_counter() - start
+        assert got == expected
+
+    print(colored(f"delta-stepping benchmark (V={n:,}, E={m:,}, cpus={os.cpu_count()})", "cyan"))
+    for label, secs in timings.items():
+        print(f"  {label:<20} {secs:8.3f}s  ({timings['dijkstra'] / secs:4.2f}x)")
+    return timings
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
+    import random
+
     # Dijkstra
     g = {0: [(1, 4), (2, 1)], 1: [(3, 1)], 2: [(1, 2), (3, 5)], 3: []}
     d = dijkstra(g, 0)
     assert d == {0: 0, 1: 3, 2: 1, 3: 4}
+    assert dijkstra(CSRGraph.from_adjacency(g), 0) == [0, 3, 1, 4]
+    for pq_kind in ("indexed", "radix"):
+        assert dijkstra(g, 0, queue=pq_kind) == d
+        assert dijkstra(CSRGraph.from_adjacency(g), 0, queue=pq_kind) == [0, 3, 1, 4]
+    try:
+        dijkstra({0: [(1, 0.5)], 1: []}, 0, queue="radix")
+        assert False, "Should have raised"
+    except ValueError:
+        pass
+    unweighted = CSRGraph.from_adjacency({0: [1], 1: []})
+    for call in (lambda: dijkstra(unweighted, 0), lambda: delta_stepping(unweighted, 0),
+                 lambda: shortest_path(unweighted, 0, 1)):
+        try:
+            call()
+            assert False, "Should have raised"
+        except ValueError:
+            pass
     print(colored("✓ dijkstra", "green"))
+    benchmark_dijkstra_csr(n=50_000, m=250_000)
 
     # Network Delay Time
     assert network_delay_time([[2,1,1],[2,3,1],[3,4,1]], 4, 2) == 2
     assert network_delay_time([[1,2,1]], 2, 2) == -1  # node 1 unreachable from 2
+    csr_times = CSRGraph.from_edges(5, [[2,1,1],[2,3,1],[3,4,1]])
+    assert network_delay_time(csr_times, 4, 2) == 2
     print(colored("✓ network_delay_time", "green"))
 
     # Bellman-Ford
@@ -317,4 +1412,173 @@ if __name__ == "__main__":
     assert find_cheapest_price(3, [[0,1,100],[1,2,100],[0,2,500]], 0, 2, 1) == 200
     print(colored("✓ find_cheapest_price", "green"))
 
+    # Point-to-point: every method agrees with full Dijkstra
+    assert shortest_path(g, 0, 3) == (4, [0, 2, 1, 3])
+    assert shortest_path(g, 0, 3, method="bidirectional") == (4, [0, 2, 1, 3])
+    assert shortest_path(g, 0, 3, method="astar", heuristic=lambda v: 0) == (4, [0, 2, 1, 3])
+    assert shortest_path(g, 3, 0) == (INF, [])
+    assert shortest_path(g, 3, 0, method="bidirectional") == (INF, [])
+    assert shortest_path(g, 2, 2, method="bidirectional") == (0, [2])
+    assert shortest_path(CSRGraph.from_adjacency(g), 0, 3, method="bidirectional") == \
+           (4, [0, 2, 1, 3])
+    # Grid with Manhattan heuristic: A* touches far fewer nodes than it could
+    side = 30
+    grid = {r * side + c: [((r + dr) * side + c + dc, 1)
+                           for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0))
+                           if 0 <= r + dr < side and 0 <= c + dc < side]
+            for r in range(side) for c in range(side)}
+    goal = side * side - 1
+    manhattan = lambda v: (side - 1 - v // side) + (side - 1 - v % side)  # noqa: E731
+    rev = reverse_graph(grid)
+    for method in ("dijkstra", "bidirectional", "astar"):
+        d_, path_ = shortest_path(grid, 0, goal, method, heuristic=manhattan, reverse=rev)
+        assert d_ == 2 * (side - 1) and len(path_) == d_ + 1
+        assert all(any(v == b for v, _ in grid[a]) for a, b in zip(path_, path_[1:]))
+    print(colored("✓ shortest_path (dijkstra / bidirectional / astar)", "green"))
+
+    # Floyd-Warshall engines agree with the reference triple loop
+    if np is not None:
+        assert floyd_warshall_numpy(m)[0].tolist() == [0, 3, 7, 5]
+        random.seed(4)
+        for size, blk in ((1, 4), (7, 3), (40, 16), (65, 64)):
+            rm = [[0 if i == j else (random.randint(-1, 30) if random.random() < 0.15 else INF)
+                   for j in range(size)] for i in range(size)]
+            try:
+                ref = floyd_warshall(rm)
+            except ValueError:
+                ref = None
+            for engine in (floyd_warshall_numpy,
+                           lambda mat, **kw: floyd_warshall_blocked(mat, blk, **kw)):
+                try:
+                    dist_np, succ = engine(rm, return_successors=True)
+                except ValueError:
+                    assert ref is None
+                    continue
+                assert dist_np.tolist() == ref
+                for i in range(size):
+                    for j in range(size):
+                        p = reconstruct_path(succ, i, j)
+                        assert (p == []) == (ref[i][j] == INF)
+                        if p:
+                            assert sum(rm[a][b] for a, b in zip(p, p[1:])) == ref[i][j]
+        try:
+            floyd_warshall_blocked([[0, 1], [-2, 0]], block=1)
+            assert False, "Should have raised"
+        except ValueError:
+            pass
+        print(colored("✓ floyd_warshall_numpy / floyd_warshall_blocked", "green"))
+
+    # SPFA and vectorized Bellman-Ford keep the None-on-negative-cycle contract
+    assert spfa(verts, edges, 0) == {0: 0, 1: 1, 2: 3, 3: 4}
+    assert spfa([0, 1, 2], neg_edges, 0) is None
+    dist_, cycle = spfa([0, 1, 2, 3], [(3, 0, 1)] + neg_edges, 3, return_cycle=True)
+    assert dist_ is None and sorted(cycle) == [0, 1, 2]
+    assert spfa([0, 1, 2], [(1, 2, -5), (2, 1, -5)], 0) == {0: 0, 1: INF, 2: INF}
+    if np is not None:
+        assert bellman_ford_numpy(4, edges, 0).tolist() == [0, 1, 3, 4]
+        assert bellman_ford_numpy(3, neg_edges, 0) is None
+        dist_, cycle = bellman_ford_numpy(4, [(3, 0, 1)] + neg_edges, 3, return_cycle=True)
+        assert dist_ is None and sorted(cycle) == [0, 1, 2]
+    random.seed(5)
+    for _ in range(200):
+        nv = random.randint(1, 12)
+        re_ = [(random.randrange(nv), random.randrange(nv), random.randint(-3, 10))
+               for _ in range(random.randint(0, 25))]
+        ref = bellman_ford(list(range(nv)), re_, 0)
+        got, cyc = spfa(list(range(nv)), re_, 0, return_cycle=True)
+        results = [(got, cyc)]
+        if np is not None:
+            arr, cyc_np = bellman_ford_numpy(nv, re_, 0, return_cycle=True)
+            results.append((None if arr is None else dict(enumerate(arr.tolist())), cyc_np))
+        for got, cyc in results:
+            assert got == ref
+            if got is None:  # the reported cycle must exist and be negative
+                w = {(u, v): min(x for a, b, x in re_ if (a, b) == (u, v)) for u, v, _ in re_}
+                assert sum(w[a, b] for a, b in zip(cyc, cyc[1:] + cyc[:1])) < 0
+    print(colored("✓ spfa / bellman_ford_numpy", "green"))
+
+    # Johnson's agrees with Floyd-Warshall, sequentially and across processes
+    assert [list(r) for r in johnson(3, [(0, 1, -2), (1, 2, 3), (0, 2, 4)], workers=1)] == \
+           [[0, -2, 1], [INF, 0, 3], [INF, INF, 0]]
+    assert johnson(3, neg_edges) is None
+    random.seed(6)
+    nv = 30
+    re_ = [(random.randrange(nv), random.randrange(nv), random.randint(0, 20))
+           for _ in range(90)]
+    re_ += [(u, v, -3) for u, v in ((0, 1), (5, 9), (12, 3))]
+    mat = [[0 if i == j else INF for j in range(nv)] for i in range(nv)]
+    for u, v, w in re_:
+        mat[u][v] = min(mat[u][v], w)
+    try:
+        ref = floyd_warshall(mat)
+    except ValueError:
+        ref = None
+    for procs in (1, 4):
+        got = johnson(nv, re_, workers=procs)
+        assert (got is None) == (ref is None)
+        if got is not None:
+            assert [list(r) for r in got] == ref
+    assert not _johnson_state
+    print(colored("✓ johnson (workers=1, 4)", "green"))
+
+    # DelayTracker matches a from-scratch network_delay_time after every update
+    tracker = DelayTracker([[2, 1, 1], [2, 3, 1], [3, 4, 1]], 4, 2)
+    assert tracker.max_delay() == 2
+    tracker.add_edge(2, 4, 1)
+    assert tracker.max_delay() == 1
+    tracker.remove_edge(2, 1)
+    assert tracker.max_delay() == -1
+    random.seed(8)
+    nv = 25
+    live: dict[tuple[int, int], int] = {}
+    for _ in range(60):
+        live[random.randint(1, nv), random.randint(1, nv)] = random.randint(1, 20)
+    tracker = DelayTracker([[u, v, w] for (u, v), w in live.items()], nv, 1)
+    for _ in range(500):
+        if live and random.random() < 0.4:
+            u, v = random.choice(list(live))
+            del live[u, v]
+            tracker.remove_edge(u, v)
+        else:
+            u, v, w = random.randint(1, nv), random.randint(1, nv), random.randint(1, 20)
+            live[u, v] = w
+            tracker.add_edge(u, v, w)
+        times_now = [[u, v, w] for (u, v), w in live.items()]
+        assert tracker.max_delay() == network_delay_time(times_now, nv, 1)
+        assert tracker.dist[1:] == dijkstra(CSRGraph.from_edges(nv + 1, times_now), 1)[1:]
+    print(colored("✓ DelayTracker incremental updates", "green"))
+
+    # Cheapest flights: state-space Dijkstra and batches agree with Bellman-Ford rounds
+    assert find_cheapest_price_dijkstra(4, flights, 0, 3, 1) == 700
+    assert find_cheapest_price_dijkstra(3, [[0,1,100],[1,2,100],[0,2,500]], 0, 2, 1) == 200
+    assert find_cheapest_price_dijkstra(3, [[0,1,100],[1,2,100],[0,2,500]], 0, 2, 0) == 500
+    random.seed(9)
+    for _ in range(30):
+        nv = random.randint(2, 12)
+        fl = [[random.randrange(nv), random.randrange(nv), random.randint(1, 50)]
+              for _ in range(random.randint(0, 40))]
+        fl = [f for f in fl if f[0] != f[1]]
+        idx = FlightIndex(nv, fl)
+        qs = [(random.randrange(nv), random.randrange(nv), random.randint(0, 4))
+              for _ in range(40)]
+        want = [find_cheapest_price(nv, fl, s, t, kk) for s, t, kk in qs]
+        assert idx.query_many(qs) == want
+        assert [idx.query(s, t, kk) for s, t, kk in qs] == want
+    print(colored("✓ find_cheapest_price_dijkstra / FlightIndex.query_many", "green"))
+
+    # Delta-stepping matches dijkstra for any delta, in-process and with workers
+    csr_g = CSRGraph.from_adjacency(g)
+    for dlt in (0.5, 1, 2, 3, 100, None):
+        assert delta_stepping(csr_g, 0, dlt) == [0, 3, 1, 4]
+    random.seed(10)
+    nv = 3000
+    rand_g = CSRGraph.from_edges(nv, [(random.randrange(nv), random.randrange(nv),
+                                       random.randint(0, 30)) for _ in range(15000)])
+    want = dijkstra(rand_g, 0)
+    assert delta_stepping(rand_g, 0, 7) == want
+    assert delta_stepping(rand_g, 0, 7, workers=2, min_chunk=16) == want
+    assert not _delta_state
+    print(colored("✓ delta_stepping", "green"))
+    benchmark_delta_stepping(n=20_000, m=100_000, worker_counts=(1, 2))
+
     print(colored("\nAll tests passed.", "cyan"))
@@ -22,11 +22,13 @@ from collections import deque
 
 from termcolor import colored
 
+from csr_graph import CSRGraph
+
 
 # ---------------------------------------------------------------------------
 # 1. Kahn's Algorithm — Core Topological Sort
 # ---------------------------------------------------------------------------
-def topological_sort_kahn(graph: dict[int, list[int]]) -> list[int]:
+def topological_sort_kahn(graph: dict[int, list[int]] | CSRGraph) -> list[int]:
     """
     Topological sort using Kahn's BFS algorithm.
 
@@ -44,7 +46,8 @@ def topological_sort_kahn(graph: dict[int, list[int]]) -> list[int]:
     order to compile files based on their import dependencies.
 
     Args:
-        graph: adjacency list {node: [neighbours]}
+        graph: adjacency list {node: [neighbours]}, or an unweighted
+               CSRGraph over nodes 0..n-1
 
     Returns:
         nodes in topological order
@@ -56,6 +59,9 @@ def topological_sort_kahn(graph: dict[int, list[int]]) -> list[int]:
         >>> topological_sort_kahn({0:[1,2], 1:[3], 2:[3], 3:[]})
         [0, 1, 2, 3]  # or [0, 2, 1, 3] — both valid
     """
+    if isinstance(graph, CSRGraph):
+        return _topological_sort_kahn_csr(graph)
+
     in_degree = {u: 0 for u in graph}
     for u in graph:
         for v in graph[u]:
@@ -77,6 +83,28 @@ def topological_sort_kahn(graph: dict[int, list[int]]) -> list[int]:
     return order
 
 
+def _topological_sort_kahn_csr(graph: CSRGraph) -> list[int]:
+    """Kahn's algorithm over CSR buffers with a flat in-degree array."""
+    offsets, targets = graph.offsets, graph.targets
+    in_degree = [0] * graph.n
+    for v in targets:
+        in_degree[v] += 1
+
+    order = [u for u in range(graph.n) if in_degree[u] == 0]
+    i = 0  # order doubles as the BFS queue: order[i:] is still pending
+    while i < len(order):
+        u = order[i]
+        i += 1
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                order.append(v)
+
+    if len(order) != graph.n:
+        raise ValueError("Graph contains a cycle — topological sort impossible")
+    return order
+
+
 # ---------------------------------------------------------------------------
 # 2. Course Schedule (Can Finish?)
 # ---------------------------------------------------------------------------
@@ -258,6 +286,7 @@ if __name__ == "__main__":
     # Validate: for every edge u→v, u appears before v
     pos = {node: i for i, node in enumerate(order)}
     assert all(pos[u] < pos[v] for u in g for v in g[u])
+    assert topological_sort_kahn(CSRGraph.from_adjacency(g)) == order
     print(colored("✓ topological_sort_kahn", "green"))
 
     # Cycle detection
@@ -266,6 +295,11 @@ if __name__ == "__main__":
         assert False, "Should have raised"
     except ValueError:
         pass
+    try:
+        topological_sort_kahn(CSRGraph.from_adjacency({0: [1], 1: [0]}))
+        assert False, "Should have raised"
+    except ValueError:
+        pass
     print(colored("✓ topological_sort_kahn cycle detection", "green"))
 
     # Can Finish
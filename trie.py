@@ -14,10 +14,22 @@ Key insight from dsa.md:
 
 Patterns covered:
   1. Trie (insert / search / startsWith)  — LeetCode 208, core structure
-  2. Word Search II                        — Trie + DFS backtracking on grid
+  2. Word Search II                        — Trie + iterative DFS on grid, parallel starts
   3. Replace Words                         — find shortest root prefix
   4. Design Add and Search Words           — Trie with '.' wildcard
+  5. RadixTrie (Patricia trie)             — path-compressed, same API as Trie
+  6. Aho-Corasick                          — all dictionary matches in one pass
+  7. MappedTrie                            — flat binary file, queried through mmap
+  8. IndexedWordDictionary                 — length buckets + bitsets, query planner
+  9. AutocompleteTrie                      — top-k completions from per-node caches
+ 10. Dawg (minimal acyclic automaton)      — shares suffixes too; sorted-input build
 """
+import bisect
+import heapq
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
 from termcolor import colored
 
 
@@ -99,30 +111,112 @@ class Trie:
 # ---------------------------------------------------------------------------
 # 2. Word Search II (Trie + DFS backtracking)
 # ---------------------------------------------------------------------------
-def find_words(board: list[list[str]], words: list[str]) -> list[str]:
+_boggle_state: dict = {}  # per-worker: flattened board and trie arrays
+
+
+def _boggle_init(cells: str, rows: int, cols: int, goto: list, word_at: array,
+                 parent: array, remaining: array) -> None:
+    """Pool initializer: board and trie arrive once per worker."""
+    _boggle_state.update(cells=cells, rows=rows, cols=cols, goto=goto,
+                         word_at=word_at, parent=parent, remaining=remaining)
+
+
+def _boggle_scan(bounds: tuple[int, int]) -> list[int]:
+    """
+    Worker: indices of words found from start cells lo..hi-1.
+
+    Iterative DFS with an explicit stack of (cell, trie node, next
+    direction); the visited bitmap is set on push and cleared on pop.
+    remaining[node] counts words below node not yet found by this worker,
+    so a subtree is skipped once all its words are found — the array
+    version of deleting exhausted trie branches.
+    """
+    s = _boggle_state
+    cells, rows, cols, goto = s["cells"], s["rows"], s["cols"], s["goto"]
+    word_at, parent, remaining = s["word_at"], s["parent"], s["remaining"]
+    size = rows * cols
+    visited = bytearray(size)
+    found: list[int] = []
+
+    def record(node: int) -> None:
+        found.append(word_at[node])
+        word_at[node] = -1  # report once per worker
+        while node >= 0:
+            remaining[node] -= 1
+            node = parent[node]
+
+    lo, hi = bounds
+    for start in range(lo, hi):
+        first = goto[0].get(cells[start])
+        if first is None or not remaining[first]:
+            continue
+        if word_at[first] >= 0:
+            record(first)
+        stack_cell, stack_node, stack_dir = [start], [first], [0]
+        visited[start] = 1
+        while stack_cell:
+            c, d = stack_cell[-1], stack_dir[-1]
+            node = stack_node[-1]
+            if d == 4 or not remaining[node]:
+                visited[c] = 0
+                stack_cell.pop(); stack_node.pop(); stack_dir.pop()
+                continue
+            stack_dir[-1] = d + 1
+            if d == 0:
+                nc = c - cols if c >= cols else -1               # up
+            elif d == 1:
+                nc = c + cols if c + cols < size else -1         # down
+            elif d == 2:
+                nc = c - 1 if c % cols else -1                   # left
+            else:
+                nc = c + 1 if (c + 1) % cols else -1             # right
+            if nc < 0 or visited[nc]:
+                continue
+            nxt = goto[node].get(cells[nc])
+            if nxt is None or not remaining[nxt]:
+                continue
+            if word_at[nxt] >= 0:
+                record(nxt)
+            visited[nc] = 1
+            stack_cell.append(nc); stack_node.append(nxt); stack_dir.append(0)
+    return found
+
+
+def find_words(board: list[list[str]], words: list[str], workers: int = 1,
+               chunk_rows: int = 64) -> list[str]:
     """
     LeetCode 212 — Word Search II
     Find all words from the list that exist in the board (connected cells,
     no cell reused in a single word).
 
-    Approach: Build a Trie from all words. DFS from every cell; at each
-    step, follow the trie path. When end_of_word is reached, record the
-    word. Prune trie nodes after finding a word to avoid duplicates and
-    speed up future searches.
+    Approach: Build a Trie from all words, then flatten it to integer node
+    ids (goto dicts, word index per node, parent links). DFS from every
+    cell, following the trie; when a node ends a word, record it. The DFS
+    is iterative — an explicit stack of cells, node ids and directions
+    instead of recursion and path strings — so long paths on huge boards
+    cannot hit the recursion limit, and it marks cells in a visited bitmap
+    rather than writing '#' into the caller's board. Exhausted trie
+    branches are skipped via per-node counts of words still unfound.
+
+    With workers > 1, start cells are split into bands of chunk_rows rows
+    and scanned in separate processes; their word indices are merged into
+    one set, so each word is reported once.
 
     T: O(M * 4 * 3^(L-1))  — M cells, each DFS explores 4 directions
                               then 3 (can't go back), L = max word length
-    S: O(N * L)             — trie storage, N = number of words
+    S: O(N * L + M)        — trie arrays, N = number of words; bitmap
 
     Real-world analogy: a word-find puzzle solver that uses a dictionary
     index (trie) to prune dead-end paths early.
 
     Args:
-        board: 2D grid of characters
-        words: list of words to find
+        board:      2D grid of characters (not modified)
+        words:      list of words to find
+        workers:    processes to scan start cells with (1 = in-process)
+        chunk_rows: rows of start cells per task when workers > 1
 
     Returns:
-        list of words found in the board
+        words found in the board, once each, in input order
 
     Example:
         >>> board = [["o","a","a","n"],["e","t","a","e"],
@@ -130,46 +224,47 @@ def find_words(board: list[list[str]], words: list[str]) -> list[str]:
         >>> sorted(find_words(board, ["oath","pea","eat","rain"]))
         ['eat', 'oath']
     """
-    # Build trie from word list
-    root = TrieNode()
-    for word in words:
-        node = root
+    if not board or not board[0] or not words:
+        return []
+
+    # Build trie and flatten it: goto[node][ch] = child, word_at[node] = index or -1
+    goto: list[dict[str, int]] = [{}]
+    word_at = array('i', [-1])
+    parent = array('i', [-1])
+    for i, word in enumerate(words):
+        node = 0
         for ch in word:
-            if ch not in node.children:
-                node.children[ch] = TrieNode()
-            node = node.children[ch]
-        node.end_of_word = True  # store word at terminal node
+            nxt = goto[node].get(ch)
+            if nxt is None:
+                nxt = goto[node][ch] = len(goto)
+                goto.append({})
+                word_at.append(-1)
+                parent.append(node)
+            node = nxt
+        if word and word_at[node] < 0:  # duplicates keep their first index
+            word_at[node] = i
+    remaining = array('i', bytes(4 * len(goto)))  # unfound words in each subtree
+    for node, w in enumerate(word_at):
+        while w >= 0 and node >= 0:
+            remaining[node] += 1
+            node = parent[node]
 
     rows, cols = len(board), len(board[0])
-    found: list[str] = []
-
-    def dfs(r: int, c: int, node: TrieNode, path: str) -> None:
-        ch = board[r][c]
-        if ch not in node.children:
-            return
-        next_node = node.children[ch]
-        path += ch
-
-        if next_node.end_of_word:
-            found.append(path)
-            next_node.end_of_word = False  # prune: don't add duplicate
-
-        board[r][c] = '#'  # mark visited
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < rows and 0 <= nc < cols and board[nr][nc] != '#':
-                dfs(nr, nc, next_node, path)
-        board[r][c] = ch  # restore
-
-        # Prune empty trie nodes to speed up future searches
-        if not next_node.children:
-            del node.children[ch]
-
-    for r in range(rows):
-        for c in range(cols):
-            dfs(r, c, root, "")
+    cells = "".join("".join(row) for row in board)
+    state = (cells, rows, cols, goto, word_at, parent, remaining)
+    step = chunk_rows * cols
+    bands = [(lo, min(lo + step, rows * cols)) for lo in range(0, rows * cols, step)]
 
-    return found
+    try:
+        if workers <= 1 or len(bands) == 1:
+            _boggle_init(*state)
+            found = _boggle_scan((0, rows * cols))
+        else:
+            with ProcessPoolExecutor(workers, initializer=_boggle_init, initargs=state) as pool:
+                found = [i for part in pool.map(_boggle_scan, bands) for i in part]
+    finally:
+        _boggle_state.clear()  # don't keep the board and trie alive, even on error
+    return [words[i] for i in sorted(set(found))]
 
 
 # ---------------------------------------------------------------------------
@@ -278,6 +373,911 @@ class WordDictionary:
         return self._search(word, idx + 1, node.children[ch])
 
 
+# ---------------------------------------------------------------------------
+# 5. Radix (Patricia) Trie — compact drop-in for Trie
+# ---------------------------------------------------------------------------
+class RadixNode:
+    """
+    A node of the RadixTrie; the edge into it carries a whole substring.
+
+    Attributes:
+        label:       substring on the edge from the parent (root: "")
+        children:    dict mapping first char of a child's label → RadixNode,
+                     or None for a leaf (most nodes — no empty dict per leaf)
+        end_of_word: True if a complete word ends at this node
+    """
+    __slots__ = ("label", "children", "end_of_word")
+
+    def __init__(self, label: str = "", end_of_word: bool = False):
+        self.label = label
+        self.children: dict[str, "RadixNode"] | None = None
+        self.end_of_word = end_of_word
+
+
+class RadixTrie:
+    """
+    Path-compressed trie with the same insert / search / starts_with API as Trie.
+
+    A plain Trie spends one TrieNode plus one dict per character, so a word
+    list costs roughly one node per distinct prefix. Here every chain of
+    single-child nodes collapses into one edge labelled with the substring,
+    so there are at most 2 * words nodes, and leaves carry no dict at all.
+    Edge labels are compared with str.startswith, i.e. in C.
+
+    T: O(m) per operation, m = length of word/prefix
+    S: O(n) nodes for n words (plus the label characters)
+
+    Real-world analogy: a phone book's thumb index that jumps straight to
+    "Mac" instead of flipping to "M", then "Ma", then "Mac".
+
+    Example:
+        >>> t = RadixTrie()
+        >>> t.insert("romane"); t.insert("romanus"); t.insert("rubens")
+        >>> t.search("romanus"), t.search("roman"), t.starts_with("roma")
+        (True, False, True)
+        >>> sorted(t.root.children["r"].children)
+        ['o', 'u']
+    """
+
+    def __init__(self):
+        self.root = RadixNode()
+
+    def insert(self, word: str) -> None:
+        """Insert word, splitting an edge where word diverges from it. T: O(m)"""
+        node, i, m = self.root, 0, len(word)
+        while i < m:
+            if node.children is None:
+                node.children = {}
+            child = node.children.get(word[i])
+            if child is None:
+                node.children[word[i]] = RadixNode(word[i:], True)
+                return
+            label = child.label
+            if word.startswith(label, i):  # whole edge matches — descend
+                node, i = child, i + len(label)
+                continue
+            k = 1  # first char already matches (it keyed the dict)
+            while i + k < m and word[i + k] == label[k]:
+                k += 1
+            mid = RadixNode(label[:k], i + k == m)
+            child.label = label[k:]
+            mid.children = {child.label[0]: child}
+            node.children[word[i]] = mid
+            if i + k < m:
+                mid.children[word[i + k]] = RadixNode(word[i + k:], True)
+            return
+        node.end_of_word = True
+
+    def _walk(self, word: str) -> tuple["RadixNode | None", int]:
+        """Follow word; return (last node reached, chars matched into the next edge)."""
+        node, i, m = self.root, 0, len(word)
+        while i < m:
+            child = node.children.get(word[i]) if node.children else None
+            if child is None:
+                return None, 0
+            label = child.label
+            if not word.startswith(label, i):
+                # word may end part-way along this edge
+                return (child, m - i) if label.startswith(word[i:]) else (None, 0)
+            node, i = child, i + len(label)
+        return node, 0
+
+    def search(self, word: str) -> bool:
+        """Return True if word is in the trie (exact match). T: O(m)"""
+        node, partial = self._walk(word)
+        return node is not None and not partial and node.end_of_word
+
+    def starts_with(self, prefix: str) -> bool:
+        """Return True if any word in the trie starts with prefix. T: O(m)"""
+        return self._walk(prefix)[0] is not None
+
+    def node_count(self) -> int:
+        """Number of nodes, root included. T: O(n)"""
+        count, stack = 0, [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node.children:
+                stack.extend(node.children.values())
+        return count
+
+
+def benchmark_tries(words: list[str], lookups: list[str]) -> dict[str, dict[str, float]]:
+    """
+    Build a Trie and a RadixTrie from words and compare them.
+
+    Memory is what tracemalloc sees allocated during each build; latency is
+    the mean search() + starts_with() time over lookups. Prints a table and
+    returns {"Trie": {...}, "RadixTrie": {...}} with keys mb, search_us,
+    prefix_us.
+    """
+    import time
+    import tracemalloc
+
+    results: dict[str, dict[str, float]] = {}
+    for cls in (Trie, RadixTrie):
+        tracemalloc.start()
+        trie = cls()
+        for w in words:
+            trie.insert(w)
+        mb = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for w in lookups:
+            trie.search(w)
+        search_us = (time.perf_counter() - start) / len(lookups) * 1e6
+        start = time.perf_counter()
+        for w in lookups:
+            trie.starts_with(w[:len(w) // 2 + 1])
+        prefix_us = (time.perf_counter() - start) / len(lookups) * 1e6
+        results[cls.__name__] = {"mb": mb, "search_us": search_us, "prefix_us": prefix_us}
+
+    print(colored(f"Trie benchmark ({len(words):,} words, {len(lookups):,} lookups)", "cyan"))
+    for name, r in results.items():
+        print(f"  {name:<10} {r['mb']:8.1f} MB  search {r['search_us']:6.2f} µs"
+              f"  starts_with {r['prefix_us']:6.2f} µs")
+    return results
+
+
+# ---------------------------------------------------------------------------
+# 6. Aho-Corasick (multi-pattern search over a Trie)
+# ---------------------------------------------------------------------------
+class AhoCorasick:
+    """
+    Aho-Corasick automaton: every dictionary match in one pass over a text.
+
+    Built from a Trie. The trie edges are the goto function; a BFS then adds
+    two links per node:
+      - fail[s]: the node for the longest proper suffix of s's string that
+        is also a trie path — where to continue when s has no edge for the
+        next char (like KMP's failure function, over many patterns).
+      - out[s]:  the nearest node on s's fail chain where a word ends, so
+        reporting all matches at a position skips non-word suffixes.
+    Nodes are flattened to integer ids (goto dicts + array('i') links), so a
+    scan touches no TrieNode objects.
+
+    T: O(total pattern length) build, O(text length + matches) scan
+    S: O(total pattern length)
+
+    Real-world analogy: a log scanner watching for 100k keywords at once —
+    one read of the stream instead of 100k separate searches.
+
+    Example:
+        >>> ac = AhoCorasick.from_words(["he", "she", "his", "hers"])
+        >>> ac.find_all("ushers")
+        [(1, 'she'), (2, 'he'), (2, 'hers')]
+    """
+
+    __slots__ = ("goto", "fail", "out", "words")
+
+    def __init__(self, trie: "Trie"):
+        from collections import deque
+
+        goto: list[dict[str, int]] = [{}]
+        words: list[str | None] = [None]
+        fail = array('i', [0])
+        out = array('i', [0])
+        # BFS over the trie assigns ids level by level, so a node's fail
+        # target (a shorter string) always has its links set first.
+        queue = deque([(trie.root, 0, "")])
+        while queue:
+            node, s, path = queue.popleft()
+            for ch, child in node.children.items():
+                c = len(goto)
+                goto[s][ch] = c
+                goto.append({})
+                words.append(path + ch if child.end_of_word else None)
+                if s == 0:
+                    f = 0
+                else:
+                    f = fail[s]
+                    while f and ch not in goto[f]:
+                        f = fail[f]
+                    f = goto[f].get(ch, 0)
+                fail.append(f)
+                out.append(f if words[f] is not None else out[f])
+                queue.append((child, c, path + ch))
+        self.goto, self.fail, self.out, self.words = goto, fail, out, words
+
+    @classmethod
+    def from_words(cls, words) -> "AhoCorasick":
+        trie = Trie()
+        for w in words:
+            trie.insert(w)
+        return cls(trie)
+
+    def scan(self, chunks):
+        """
+        Yield (start, word) for every match in a stream of text chunks.
+
+        The automaton state carries over between chunks, so matches that
+        straddle a chunk boundary are found; start is the offset in the
+        whole stream. Matches come out in order of their end position.
+        """
+        goto, fail, out, words = self.goto, self.fail, self.out, self.words
+        s, pos = 0, 0
+        for chunk in chunks:
+            for ch in chunk:
+                pos += 1
+                while s and ch not in goto[s]:
+                    s = fail[s]
+                s = goto[s].get(ch, 0)
+                hit = s if words[s] is not None else out[s]
+                while hit:
+                    word = words[hit]
+                    yield pos - len(word), word
+                    hit = out[hit]
+
+    def find_all(self, text: str) -> list[tuple[int, str]]:
+        """All (start, word) matches in text. T: O(len(text) + matches)"""
+        return list(self.scan((text,)))
+
+
+# ---------------------------------------------------------------------------
+# 7. Memory-mapped Trie (flat binary format, zero deserialization)
+# ---------------------------------------------------------------------------
+MAPPED_TRIE_HEADER = struct.Struct("<4sIII")  # magic, nodes, edges, reserved
+MAPPED_TRIE_MAGIC = b"TRI1"
+_BYTE = [bytes((b,)) for b in range(256)]  # prebuilt 1-byte needles for mmap.find
+
+
+def write_trie_file(words, path: str) -> int:
+    """
+    Serialize a word list as a flat byte-level trie for MappedTrie.
+
+    Layout (little-endian; the uint32 sections come first so they stay aligned):
+        header                 MAPPED_TRIE_HEADER
+        offsets[nodes + 1]     uint32 — node u's edges are offsets[u]..offsets[u+1]-1
+        targets[edges]         uint32 — child node of each edge
+        terminal[nodes]        uint8  — 1 if a word ends at the node
+        labels[edges]          uint8  — UTF-8 byte on each edge, sorted per node
+
+    Nodes are numbered in BFS order straight from the sorted, encoded word
+    list: each node is a range of words sharing a prefix, split by the next
+    byte — no TrieNode objects are built.
+
+    T: O(W log W + total bytes)   S: O(total bytes)
+    Returns the number of nodes written.
+    """
+    from collections import deque
+
+    keys = sorted({w.encode() for w in words})
+    offsets, targets = array('I', [0]), array('I')
+    terminal, labels = bytearray(), bytearray()
+    queue = deque([(0, len(keys), 0)])  # (lo, hi, depth) — node id = dequeue order
+    nodes = 1
+    while queue:
+        lo, hi, d = queue.popleft()
+        is_word = lo < hi and len(keys[lo]) == d  # sorted: the prefix itself comes first
+        terminal.append(is_word)
+        i = lo + is_word
+        while i < hi:
+            b = keys[i][d]
+            j = i + 1
+            while j < hi and keys[j][d] == b:
+                j += 1
+            labels.append(b)
+            targets.append(nodes)
+            queue.append((i, j, d + 1))
+            nodes += 1
+            i = j
+        offsets.append(len(targets))
+
+    with open(path, "wb") as f:
+        f.write(MAPPED_TRIE_HEADER.pack(MAPPED_TRIE_MAGIC, nodes, len(targets), 0))
+        f.write(offsets.tobytes())
+        f.write(targets.tobytes())
+        f.write(terminal)
+        f.write(labels)
+    return nodes
+
+
+class MappedTrie:
+    """
+    Read-only Trie answering search / starts_with straight from an mmap.
+
+    Opening a file written by write_trie_file only maps it and reads the
+    16-byte header — nothing is parsed or allocated per node — so startup
+    is constant time. Pages are faulted in as queries touch them and come
+    from the OS page cache, so every process that opens the same file (or
+    receives a pickled MappedTrie, which reopens by path) shares one copy.
+
+    Per byte of the query: the node's label run is scanned with mmap.find
+    (in C), and the child id is read through a uint32 memoryview.
+
+    T: O(1) open, O(m * fan-out) per query in the worst case
+    S: O(1) Python heap; the file stays on disk / in the page cache
+
+    Real-world analogy: a printed index in the back of a book — you open it
+    and look things up; nobody re-types it into a card catalogue first.
+
+    Example:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "words.trie")
+        >>> write_trie_file(["car", "cart", "dog"], path)
+        8
+        >>> with MappedTrie(path) as t:
+        ...     t.search("car"), t.search("ca"), t.starts_with("ca")
+        (True, False, True)
+    """
+
+    __slots__ = ("path", "_file", "_mm", "_offsets", "_targets", "_terminal", "_labels")
+
+    def __init__(self, path: str):
+        import mmap
+
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, nodes, edges, _ = MAPPED_TRIE_HEADER.unpack_from(self._mm)
+        if magic != MAPPED_TRIE_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a mapped trie file")
+        view = memoryview(self._mm)
+        off = MAPPED_TRIE_HEADER.size
+        self._offsets = view[off:off + 4 * (nodes + 1)].cast('I')
+        off += 4 * (nodes + 1)
+        self._targets = view[off:off + 4 * edges].cast('I')
+        off += 4 * edges
+        self._terminal = off
+        self._labels = off + nodes
+        view.release()
+
+    def _walk(self, key: bytes) -> int:
+        """Node reached by following key from the root, or -1."""
+        mm, offsets, targets, labels = self._mm, self._offsets, self._targets, self._labels
+        u = 0
+        for b in key:
+            i = mm.find(_BYTE[b], labels + offsets[u], labels + offsets[u + 1])
+            if i < 0:
+                return -1
+            u = targets[i - labels]
+        return u
+
+    def search(self, word: str) -> bool:
+        """Return True if word is in the trie (exact match). T: O(m)"""
+        u = self._walk(word.encode())
+        return u >= 0 and self._mm[self._terminal + u] == 1
+
+    def starts_with(self, prefix: str) -> bool:
+        """Return True if any word in the trie starts with prefix. T: O(m)"""
+        return self._walk(prefix.encode()) >= 0
+
+    def close(self) -> None:
+        if getattr(self, "_offsets", None) is not None:
+            self._offsets.release()
+            self._targets.release()
+            self._offsets = self._targets = None
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedTrie":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __reduce__(self):
+        return MappedTrie, (self.path,)  # workers remap the file — shared pages, no copy
+
+
+# ---------------------------------------------------------------------------
+# 8. Wildcard Index — bitset intersections for WordDictionary
+# ---------------------------------------------------------------------------
+class IndexedWordDictionary(WordDictionary):
+    """
+    WordDictionary whose wildcard queries can run as bitset intersections.
+
+    Words are bucketed by length. Within the bucket for length L, word i
+    sets bit i in bitset[pos][ch] for each of its characters. A pattern of
+    length L matches some word iff the AND of bitset[pos][ch] over its fixed
+    (non-'.') positions is non-zero — no branching on '.' at all.
+
+    Bitsets are kept as bytearrays (O(1) to set a bit on add_word) and
+    converted to Python ints — whose AND runs in C, a machine word at a
+    time — the first time a query needs them after a change.
+
+    The trie path is still best for patterns with few wildcards, so search()
+    asks plan() for the cheaper one:
+      - trie cost:   estimated nodes visited. The frontier is multiplied by
+                     the mean fan-out at that depth on '.', and by
+                     fan-out / distinct chars at that depth on a fixed char.
+      - bitset cost: fixed positions x bucket size / 64 machine words,
+                     scaled by _WORDS_PER_VISIT (a C word-AND is far cheaper
+                     than a Python-level node visit).
+
+    T: O(m) add_word; search min(trie DFS, F * N_L / 64 word ops)
+    S: O(total chars) bits on top of the trie
+
+    Example:
+        >>> wd = IndexedWordDictionary()
+        >>> wd.add_word("bad"); wd.add_word("dad"); wd.add_word("mad")
+        >>> wd.search("..d"), wd.search("b.."), wd.search("...."), wd.plan("bad")
+        (True, True, False, 'trie')
+    """
+
+    _WORDS_PER_VISIT = 64  # rough cost of one Python node visit, in 64-bit ANDs
+
+    def __init__(self):
+        super().__init__()
+        self.lengths: dict[int, list] = {}      # L → [count, [ {ch: bytearray} per pos ]]
+        self._ints: dict[tuple[int, int, str], int] = {}  # (L, pos, ch) → bitset int cache
+        self.level_nodes: list[int] = [1]       # trie nodes per depth
+        self.level_chars: list[set[str]] = []   # distinct edge chars per depth
+
+    def add_word(self, word: str) -> None:
+        """Insert word into the trie and its length bucket. T: O(m)"""
+        node = self.root
+        level_nodes, level_chars = self.level_nodes, self.level_chars
+        for d, ch in enumerate(word):
+            if ch not in node.children:
+                node.children[ch] = TrieNode()
+                if d + 1 == len(level_nodes):
+                    level_nodes.append(0)
+                    level_chars.append(set())
+                level_nodes[d + 1] += 1
+                level_chars[d].add(ch)
+            node = node.children[ch]
+        if node.end_of_word:
+            return  # already indexed
+        node.end_of_word = True
+
+        bucket = self.lengths.get(len(word))
+        if bucket is None:
+            bucket = self.lengths[len(word)] = [0, [{} for _ in word]]
+        i = bucket[0]
+        bucket[0] += 1
+        byte, bit = i >> 3, 1 << (i & 7)
+        for pos, ch in enumerate(word):
+            bits = bucket[1][pos].get(ch)
+            if bits is None:
+                bits = bucket[1][pos][ch] = bytearray()
+            if len(bits) <= byte:
+                bits.extend(bytes(byte + 1 - len(bits)))
+            bits[byte] |= bit
+            self._ints.pop((len(word), pos, ch), None)  # invalidate cached int
+
+    def plan(self, pattern: str) -> str:
+        """Return "trie" or "bitset" — whichever search is estimated cheaper."""
+        bucket = self.lengths.get(len(pattern))
+        if bucket is None or '.' not in pattern:
+            return "trie"  # exact lookups (and impossible lengths) are O(m) in the trie
+        level_nodes, level_chars = self.level_nodes, self.level_chars
+        frontier = trie_cost = 1.0
+        for d, ch in enumerate(pattern):
+            if d + 1 >= len(level_nodes):
+                break
+            fanout = level_nodes[d + 1] / level_nodes[d]
+            frontier *= fanout if ch == '.' else fanout / len(level_chars[d])
+            frontier = min(frontier, level_nodes[d + 1])
+            trie_cost += frontier
+        fixed = len(pattern) - pattern.count('.')
+        bitset_cost = 1 + fixed * (bucket[0] / 64) / self._WORDS_PER_VISIT
+        return "bitset" if bitset_cost < trie_cost else "trie"
+
+    def search(self, word: str) -> bool:
+        """Search with '.' wildcard, via the path plan() picks."""
+        if self.plan(word) == "bitset":
+            return self._search_bitset(word)
+        return self._search(word, 0, self.root)
+
+    def _search_bitset(self, pattern: str) -> bool:
+        bucket = self.lengths.get(len(pattern))
+        if bucket is None:
+            return False
+        count, maps = bucket
+        ints = self._ints
+        acc = -1  # all ones
+        # Rarest bitsets first would be ideal; fixed positions in order is close enough
+        for pos, ch in enumerate(pattern):
+            if ch == '.':
+                continue
+            key = (len(pattern), pos, ch)
+            bits = ints.get(key)
+            if bits is None:
+                raw = maps[pos].get(ch)
+                if raw is None:
+                    return False
+                bits = ints[key] = int.from_bytes(raw, "little")
+            acc &= bits
+            if not acc:
+                return False
+        return count > 0
+
+
+def benchmark_wildcard(n_words: int = 1_000_000, n_queries: int = 2000,
+                       seed: int = 0) -> dict[str, float]:
+    """
+    Time WordDictionary (trie DFS) against IndexedWordDictionary (planned)
+    on random words of length 6-12 over a 26-letter alphabet, for
+    dot-heavy and dot-light patterns. Prints µs/query; returns {label: µs}.
+    """
+    import random
+    import string
+    import time
+
+    rng = random.Random(seed)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(6, 12)))
+             for _ in range(n_words)]
+    plain, indexed = WordDictionary(), IndexedWordDictionary()
+    for w in words:
+        plain.add_word(w)
+        indexed.add_word(w)
+
+    def mask(w: str, keep: float) -> str:
+        return "".join(c if rng.random() < keep else "." for c in w)
+
+    timings: dict[str, float] = {}
+    for label, keep in (("few dots", 0.8), ("many dots", 0.25)):
+        patterns = [mask(rng.choice(words), keep) for _ in range(n_queries)]
+        for name, wd in (("trie", plain), ("planned", indexed)):
+            start = time.perf_counter()
+            answers = [wd.search(p) for p in patterns]
+            timings[f"{label} / {name}"] = (time.perf_counter() - start) / n_queries * 1e6
+            assert all(answers)  # every pattern is masked from a real word
+
+    print(colored(f"Wildcard benchmark ({n_words:,} words, {n_queries:,} queries each)", "cyan"))
+    for label, us in timings.items():
+        print(f"  {label:<20} {us:10.1f} µs/query")
+    return timings
+
+
+# ---------------------------------------------------------------------------
+# 9. Top-k Autocomplete (cached, frequency-ranked completions)
+# ---------------------------------------------------------------------------
+class AutocompleteNode:
+    """
+    A node of the AutocompleteTrie.
+
+    Attributes:
+        children: dict mapping char → AutocompleteNode
+        word:     the word ending here, or None
+        score:    accumulated weight of word
+        top:      cached best completions as sorted (-score, word) entries,
+                  or None when stale / not cached at this depth
+    """
+    __slots__ = ("children", "word", "score", "top")
+
+    def __init__(self):
+        self.children: dict[str, "AutocompleteNode"] = {}
+        self.word: str | None = None
+        self.score = 0
+        self.top: list[tuple[float, str]] | None = []
+
+
+class AutocompleteTrie:
+    """
+    Trie answering complete(prefix, k) — the k highest-weighted completions.
+
+    Every node within cache_depth of the root keeps its best cache_size
+    completions, so a query is one walk down the prefix plus a slice.
+    Caches are bounded both ways: cache_size entries per node, and nodes
+    deeper than cache_depth (whose subtrees are small) keep none and are
+    answered by a subtree scan instead.
+
+    Maintenance:
+      - insert(word, w) with w >= 0 only raises word's score, so each cache
+        on the path just repositions or admits that one word — O(depth *
+        cache_size). A word left out of a cache can only get back in by
+        being inserted, which is exactly when it is offered.
+      - Negative weights, and load(..., lazy) bulk inserts, instead mark the
+        caches on the path stale (top = None). Staleness is path-closed — an
+        ancestor of a stale node is stale — and the next query recomputes
+        a stale cache by merging its children's caches.
+
+    T: O(p + k) complete for k <= cache_size, O(p * cache_size) insert
+    S: O(nodes within cache_depth * cache_size) cache entries
+
+    Real-world analogy: a search box showing ten suggestions per keystroke
+    from a precomputed "most popular under this prefix" list.
+
+    Example:
+        >>> ac = AutocompleteTrie(cache_size=3)
+        >>> for w, f in [("car", 5), ("cart", 9), ("care", 2), ("cat", 7), ("dog", 8)]:
+        ...     ac.insert(w, f)
+        >>> ac.complete("ca", 2)
+        ['cart', 'cat']
+        >>> ac.insert("care", 10); ac.complete("car", 5)
+        ['care', 'cart', 'car']
+    """
+
+    def __init__(self, cache_size: int = 10, cache_depth: int = 8):
+        self.root = AutocompleteNode()
+        self.cache_size = cache_size
+        self.cache_depth = cache_depth
+
+    def insert(self, word: str, weight: float = 1, lazy: bool = False) -> None:
+        """Add weight to word's score (inserting it if new). T: O(m * cache_size)"""
+        path = [self.root]
+        node = self.root
+        for ch in word:
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = AutocompleteNode()
+                if len(path) >= self.cache_depth:
+                    child.top = None  # below cache_depth — never cached
+            node = child
+            path.append(node)
+        node.word = word
+        node.score += weight
+
+        cached = path[:self.cache_depth]
+        if lazy or weight < 0:
+            for n in cached:
+                n.top = None
+            return
+        entry = (-node.score, word)
+        size = self.cache_size
+        for n in cached:
+            top = n.top
+            if top is None:
+                continue  # stale — recomputed on the next query
+            for i, e in enumerate(top):
+                if e[1] == word:
+                    del top[i]
+                    break
+            if len(top) < size or entry < top[-1]:
+                bisect.insort(top, entry)
+                if len(top) > size:
+                    top.pop()
+
+    def load(self, pairs, lazy: bool = True) -> None:
+        """Bulk insert (word, weight) pairs; caches are rebuilt on demand."""
+        for word, weight in pairs:
+            self.insert(word, weight, lazy=lazy)
+
+    def _top(self, node: AutocompleteNode, depth: int) -> list[tuple[float, str]]:
+        """Fresh cache for node, recomputing stale caches below it first."""
+        if depth >= self.cache_depth:
+            return self._scan(node, self.cache_size)
+        if node.top is None:
+            candidates = [(-node.score, node.word)] if node.word is not None else []
+            for child in node.children.values():
+                candidates.extend(self._top(child, depth + 1))  # recursion <= cache_depth
+            node.top = heapq.nsmallest(self.cache_size, candidates)
+        return node.top
+
+    @staticmethod
+    def _scan(node: AutocompleteNode, k: int) -> list[tuple[float, str]]:
+        """Best k entries of node's subtree by full traversal."""
+        entries = []
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if n.word is not None:
+                entries.append((-n.score, n.word))
+            stack.extend(n.children.values())
+        return heapq.nsmallest(k, entries)
+
+    def complete(self, prefix: str, k: int = 10) -> list[str]:
+        """
+        The k highest-scored words starting with prefix (ties alphabetical).
+
+        Served from the cache when k <= cache_size and the prefix is within
+        cache_depth; otherwise the prefix's subtree is scanned.
+        """
+        node = self.root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        if k <= self.cache_size:
+            top = self._top(node, len(prefix))
+        else:
+            top = self._scan(node, k)
+        return [word for _, word in top[:k]]
+
+
+def benchmark_autocomplete(n_terms: int = 1_000_000, n_queries: int = 20_000,
+                           k: int = 10, seed: int = 0) -> dict[str, float]:
+    """
+    Insert n_terms Zipf-weighted random terms, then time complete(prefix, k)
+    for prefixes of length 1-4 taken from the terms. Prints and returns
+    p50 / p99 / max latency in µs.
+    """
+    import random
+    import string
+    import time
+
+    rng = random.Random(seed)
+    ac = AutocompleteTrie(cache_size=k)
+    terms = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 12)))
+             for _ in range(n_terms)]
+    for rank, term in enumerate(terms, 1):
+        ac.insert(term, n_terms // rank)  # Zipf-like weights
+    prefixes = [t[:rng.randint(1, 4)] for t in rng.choices(terms, k=n_queries)]
+
+    latencies = []
+    for p in prefixes:
+        start = time.perf_counter()
+        ac.complete(p, k)
+        latencies.append((time.perf_counter() - start) * 1e6)
+    latencies.sort()
+    stats = {"p50": latencies[len(latencies) // 2],
+             "p99": latencies[int(len(latencies) * 0.99)],
+             "max": latencies[-1]}
+    print(colored(f"Autocomplete benchmark ({n_terms:,} terms, k={k})", "cyan"))
+    print("  " + "  ".join(f"{name} {us:7.1f} µs" for name, us in stats.items()))
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# 10. DAWG — minimal acyclic automaton from sorted words
+# ---------------------------------------------------------------------------
+class DawgNode:
+    """
+    A state of the Dawg. Unlike a TrieNode it may have several parents.
+
+    Attributes:
+        children:    dict mapping char → DawgNode
+        end_of_word: True if a word ends here (an accepting state)
+        id:          creation number — used in signatures instead of the node
+    """
+    __slots__ = ("children", "end_of_word", "id")
+
+    def __init__(self, id: int):
+        self.children: dict[str, "DawgNode"] = {}
+        self.end_of_word = False
+        self.id = id
+
+    def signature(self) -> tuple:
+        """Two nodes with equal signatures accept the same suffixes (children minimal)."""
+        return (self.end_of_word,
+                tuple(sorted((ch, child.id) for ch, child in self.children.items())))
+
+
+class Dawg:
+    """
+    Directed Acyclic Word Graph: a trie that also shares common suffixes.
+
+    Built incrementally from words in sorted order (Daciuk, Mihov, Watson
+    & Watson, 2000). Sorted input means that once a word diverges from the
+    previous one, the previous word's tail below the divergence point can
+    never change again. Those "unchecked" nodes are minimized bottom-up:
+    each is looked up in a register keyed by signature (end flag + child
+    edges) and replaced by an existing equivalent node, or registered. The
+    result is the minimal automaton for the word set, built in one pass
+    without ever materializing the full trie.
+
+    T: O(total chars * log alphabet) build, O(m) search / starts_with
+    S: O(minimal states) — often far fewer than trie nodes for natural
+       languages, where "-ing", "-ation", "-ness" etc. repeat
+
+    Real-world analogy: a spell-checker dictionary that stores the ending
+    "-ization" once, shared by every word that uses it.
+
+    Example:
+        >>> d = Dawg.from_words(["tap", "taps", "top", "tops"])
+        >>> d.search("tops"), d.search("to"), d.starts_with("to")
+        (True, False, True)
+        >>> d.node_count()  # a trie needs 7
+        5
+    """
+
+    def __init__(self):
+        self.root = DawgNode(0)
+        self._next_id = 1
+        self._previous = ""
+        self._unchecked: list[tuple[DawgNode, str, DawgNode]] = []  # (parent, ch, child)
+        self._register: dict[tuple, DawgNode] = {}
+        self._finished = False
+
+    @classmethod
+    def from_words(cls, words) -> "Dawg":
+        """Build from an iterable of words in sorted order (duplicates allowed)."""
+        dawg = cls()
+        for w in words:
+            dawg.insert(w)
+        dawg.finish()
+        return dawg
+
+    def insert(self, word: str) -> None:
+        """Add word, which must sort >= every word inserted so far. T: O(m)"""
+        if self._finished:
+            raise RuntimeError("Dawg is finished; no more inserts")
+        if word < self._previous:
+            raise ValueError(f"words must be inserted in sorted order: {word!r} < "
+                             f"{self._previous!r}")
+        common = 0
+        for a, b in zip(word, self._previous):
+            if a != b:
+                break
+            common += 1
+        self._minimize(common)
+
+        node = self._unchecked[-1][2] if self._unchecked else self.root
+        for ch in word[common:]:
+            child = DawgNode(self._next_id)
+            self._next_id += 1
+            node.children[ch] = child
+            self._unchecked.append((node, ch, child))
+            node = child
+        node.end_of_word = True
+        self._previous = word
+
+    def finish(self) -> None:
+        """Minimize the last word's tail. Called by from_words; inserts then stop."""
+        self._minimize(0)
+        self._finished = True
+
+    def _minimize(self, down_to: int) -> None:
+        unchecked, register = self._unchecked, self._register
+        while len(unchecked) > down_to:
+            parent, ch, child = unchecked.pop()
+            key = child.signature()
+            existing = register.get(key)
+            if existing is not None:
+                parent.children[ch] = existing  # child is dropped — an equal state exists
+            else:
+                register[key] = child
+
+    def _walk(self, word: str) -> "DawgNode | None":
+        node = self.root
+        for ch in word:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def search(self, word: str) -> bool:
+        """Return True if word was inserted (exact match). T: O(m)"""
+        node = self._walk(word)
+        return node is not None and node.end_of_word
+
+    def starts_with(self, prefix: str) -> bool:
+        """Return True if any word starts with prefix. T: O(m)"""
+        return self._walk(prefix) is not None
+
+    def node_count(self) -> int:
+        """Distinct states reachable from the root, root included."""
+        seen = {self.root.id}
+        stack = [self.root]
+        while stack:
+            for child in stack.pop().children.values():
+                if child.id not in seen:
+                    seen.add(child.id)
+                    stack.append(child)
+        return len(seen)
+
+
+def compare_dawg_trie(words: list[str]) -> dict[str, dict[str, float]]:
+    """
+    Build a Trie and a Dawg over the same words; print and return node
+    counts and traced memory (MB) for each.
+    """
+    import tracemalloc
+
+    words = sorted(words)
+    results: dict[str, dict[str, float]] = {}
+
+    tracemalloc.start()
+    trie = Trie()
+    for w in words:
+        trie.insert(w)
+    trie_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    nodes, stack = 0, [trie.root]
+    while stack:
+        nodes += 1
+        stack.extend(stack.pop().children.values())
+    results["Trie"] = {"nodes": nodes, "mb": trie_mb}
+
+    tracemalloc.start()
+    dawg = Dawg.from_words(words)
+    dawg._register.clear()  # only needed while building
+    dawg_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    results["Dawg"] = {"nodes": dawg.node_count(), "mb": dawg_mb}
+
+    print(colored(f"DAWG vs Trie ({len(words):,} words)", "cyan"))
+    for name, r in results.items():
+        print(f"  {name:<5} {r['nodes']:10,} nodes  {r['mb']:8.1f} MB")
+    print(f"  saving {1 - results['Dawg']['nodes'] / results['Trie']['nodes']:.0%} nodes, "
+          f"{1 - results['Dawg']['mb'] / results['Trie']['mb']:.0%} memory")
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -300,6 +1300,8 @@ if __name__ == "__main__":
              ["i","f","l","v"]]
     result = find_words(board, ["oath","pea","eat","rain"])
     assert sorted(result) == ["eat", "oath"]
+    assert board[0] == ["o","a","a","n"]  # board left untouched
+    assert find_words(board, ["oath", "oath", "eat", "", "oathe"]) == ["oath", "eat"]
     print(colored("✓ find_words (Word Search II)", "green"))
 
     # Replace Words
@@ -321,4 +1323,199 @@ if __name__ == "__main__":
     assert wd.search("....") is False
     print(colored("✓ WordDictionary", "green"))
 
+    # RadixTrie agrees with Trie, including edge splits and mid-edge prefixes
+    import random
+    random.seed(19)
+    rt = RadixTrie()
+    for w in ["test", "toaster", "toasting", "slow", "slowly", "to", "t"]:
+        rt.insert(w)
+    assert rt.search("to") and rt.search("t") and not rt.search("toast")
+    assert rt.starts_with("toast") and rt.starts_with("slowl") and not rt.starts_with("tz")
+    assert rt.search("") is False and rt.starts_with("") is True
+    vocab = ["".join(random.choice("abcd") for _ in range(random.randint(1, 8)))
+             for _ in range(3000)]
+    plain, radix = Trie(), RadixTrie()
+    for w in vocab[:1500]:
+        plain.insert(w)
+        radix.insert(w)
+    for w in vocab:
+        assert radix.search(w) == plain.search(w)
+        assert radix.starts_with(w[:3]) == plain.starts_with(w[:3])
+    assert radix.node_count() <= 2 * len(set(vocab[:1500])) + 1
+    print(colored("✓ RadixTrie", "green"))
+
+    # Memory / latency on a dictionary-like word list (long shared prefixes)
+    stems = ["".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(6))
+             for _ in range(2000)]
+    dictionary = list({s + "".join(random.choice("aeiourstnl") for _ in range(random.randint(2, 6)))
+                       for s in stems for _ in range(10)})
+    stats = benchmark_tries(dictionary, random.sample(dictionary, 5000))
+    assert stats["RadixTrie"]["mb"] * 2 < stats["Trie"]["mb"]
+
+    # Aho-Corasick vs brute force, whole text and chunked stream
+    ac = AhoCorasick.from_words(["he", "she", "his", "hers"])
+    assert ac.find_all("ushers") == [(1, "she"), (2, "he"), (2, "hers")]
+    assert ac.find_all("") == [] and AhoCorasick(Trie()).find_all("abc") == []
+    for _ in range(50):
+        pats = {"".join(random.choice("ab") for _ in range(random.randint(1, 5)))
+                for _ in range(random.randint(1, 12))}
+        text = "".join(random.choice("abc") for _ in range(200))
+        ac = AhoCorasick.from_words(pats)
+        want = sorted((i, p) for p in pats for i in range(len(text))
+                      if text.startswith(p, i))
+        assert sorted(ac.find_all(text)) == want
+        cuts = sorted(random.sample(range(1, len(text)), 7))
+        chunks = [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+        assert sorted(ac.scan(iter(chunks))) == want
+    print(colored("✓ AhoCorasick", "green"))
+
+    # MappedTrie: same answers as Trie, instant open, shareable with workers
+    import os
+    import pickle
+    import tempfile
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    vocab = dictionary + ["", "naïve", "naïveté", "日本", "日本語"]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dict.trie")
+        start = time.perf_counter()
+        built = Trie()
+        for w in vocab:
+            built.insert(w)
+        build_s = time.perf_counter() - start
+        write_trie_file(vocab, path)
+        start = time.perf_counter()
+        mt = MappedTrie(path)
+        open_s = time.perf_counter() - start
+        probes = vocab + [w[:-1] for w in vocab[:3000]] + ["日", "naïv", "zzz", "nai"]
+        for w in probes:
+            assert mt.search(w) == built.search(w), w
+            assert mt.starts_with(w[:4]) == built.starts_with(w[:4]), w
+        assert pickle.loads(pickle.dumps(mt)).search("日本語")
+        with ProcessPoolExecutor(2) as pool:
+            assert all(pool.map(MappedTrie.search, [mt] * 4, vocab[:4]))
+        mt.close()
+        with open(path, "r+b") as f:
+            f.write(b"XXXX")
+        try:
+            MappedTrie(path)
+            assert False, "Should have raised"
+        except ValueError:
+            pass
+    print(colored(f"✓ MappedTrie (open {open_s * 1e3:.2f} ms vs Trie build "
+                  f"{build_s * 1e3:.0f} ms)", "green"))
+
+    # IndexedWordDictionary: both paths agree with WordDictionary
+    plain, indexed = WordDictionary(), IndexedWordDictionary()
+    for _ in range(3000):
+        w = "".join(random.choice("abcde") for _ in range(random.randint(1, 7)))
+        plain.add_word(w)
+        indexed.add_word(w)
+    plans = set()
+    for _ in range(3000):
+        p = "".join(random.choice("abcde..") for _ in range(random.randint(1, 8)))
+        want = plain.search(p)
+        assert indexed._search_bitset(p) == want
+        assert indexed._search(p, 0, indexed.root) == want
+        assert indexed.search(p) == want
+        plans.add(indexed.plan(p))
+    assert plans == {"trie", "bitset"}
+    assert indexed.plan("abc") == "trie" and indexed.plan("." * 7) == "bitset"
+    print(colored("✓ IndexedWordDictionary", "green"))
+
+    benchmark_wildcard(n_words=100_000, n_queries=500)  # timings are reported, not asserted
+
+    # AutocompleteTrie vs brute force — eager inserts, lazy loads, decrements
+    ac = AutocompleteTrie(cache_size=4, cache_depth=3)
+    scores: dict[str, int] = {}
+    for step in range(4000):
+        w = "".join(random.choice("abc") for _ in range(random.randint(1, 6)))
+        weight = random.choice([1, 2, 5, -1]) if step % 7 else random.randint(1, 3)
+        if weight < 0 and scores.get(w, 0) < 1:
+            weight = 1
+        ac.insert(w, weight, lazy=step % 11 == 0)
+        scores[w] = scores.get(w, 0) + weight
+        if step % 20 == 0:
+            p = "".join(random.choice("abc") for _ in range(random.randint(0, 4)))
+            for k in (1, 4, 6):
+                want = sorted((w for w in scores if w.startswith(p)),
+                              key=lambda w: (-scores[w], w))[:k]
+                assert ac.complete(p, k) == want, (p, k)
+    ac.load([("zeta", 3), ("zebra", 9), ("zero", 5)])
+    assert ac.root.top is None  # lazy load leaves the path stale ...
+    assert ac.complete("ze", 2) == ["zebra", "zero"] and ac.complete("q") == []
+    z = ac.root.children["z"]
+    assert z.children["e"].top is not None  # ... a query refreshes only what it needs
+    assert z.top is None and ac.complete("z", 1) == ["zebra"] and z.top is not None
+    print(colored("✓ AutocompleteTrie", "green"))
+
+    benchmark_autocomplete(n_terms=200_000, n_queries=5000)  # latencies reported, not asserted
+
+    # Dawg: same answers as Trie, minimal (no two states equivalent), fewer nodes
+    vocab = sorted({"".join(random.choice("abc") for _ in range(random.randint(1, 7)))
+                    for _ in range(800)})
+    dawg, plain = Dawg.from_words(vocab[::2]), Trie()
+    for w in vocab[::2]:
+        plain.insert(w)
+    for w in vocab:
+        assert dawg.search(w) == plain.search(w)
+        assert dawg.starts_with(w[:3]) == plain.starts_with(w[:3])
+    sigs, stack, seen = set(), [dawg.root], set()
+    while stack:
+        node = stack.pop()
+        if node.id in seen:
+            continue
+        seen.add(node.id)
+        assert node.signature() not in sigs
+        sigs.add(node.signature())
+        stack.extend(node.children.values())
+    try:
+        dawg.insert("zzz")
+        assert False, "Should have raised"
+    except RuntimeError:
+        pass
+    try:
+        Dawg.from_words(["b", "a"])
+        assert False, "Should have raised"
+    except ValueError:
+        pass
+    print(colored("✓ Dawg", "green"))
+
+    suffixes = ["", "s", "ed", "ing", "er", "ers", "ation", "ations", "ness"]
+    inflected = list({s + x for s in stems for x in suffixes})
+    saving = compare_dawg_trie(inflected)
+    assert saving["Dawg"]["nodes"] * 2 < saving["Trie"]["nodes"]
+
+    # find_words at scale: brute-force check, parallel bands, deep paths
+    def on_board(grid: list[list[str]], word: str) -> bool:
+        R, C = len(grid), len(grid[0])
+
+        def go(r: int, c: int, i: int, used: frozenset) -> bool:
+            if grid[r][c] != word[i]:
+                return False
+            if i == len(word) - 1:
+                return True
+            used = used | {(r, c)}
+            return any(go(r + dr, c + dc, i + 1, used)
+                       for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                       if 0 <= r + dr < R and 0 <= c + dc < C and (r + dr, c + dc) not in used)
+        return any(go(r, c, 0, frozenset()) for r in range(R) for c in range(C))
+
+    grid = [[random.choice("abcd") for _ in range(9)] for _ in range(9)]
+    targets = ["".join(random.choice("abcd") for _ in range(random.randint(1, 6)))
+               for _ in range(400)]
+    want = list(dict.fromkeys(w for w in targets if on_board(grid, w)))
+    assert find_words(grid, targets) == want
+    assert find_words(grid, targets, workers=2, chunk_rows=2) == want
+    snake = [[chr(97 + (i % 26)) for i in range(3000)]]  # one 3000-cell row
+    long_word = "".join(snake[0][500:2800])
+    assert find_words(snake, [long_word, "zz"]) == [long_word]
+    try:
+        find_words([["a", "b"], ["c"]], ["ab", "cz"])  # ragged board: the scan fails
+    except IndexError:
+        pass
+    assert not _boggle_state  # cleared on the error path too
+    print(colored("✓ find_words (iterative, parallel, 2300-deep path)", "green"))
+
     print(colored("\nAll tests passed.", "cyan"))
@@ -11,13 +11,32 @@ Key insight from dsa.md:
   - The combined complexity is O(α(n)) — inverse Ackermann, effectively constant.
 
 Patterns covered:
-  1. UnionFind class              — core data structure with both optimisations
+  1. UnionFind class              — array-backed, iterative, bulk union_many/find_many
   2. Number of Connected Components — LeetCode 323
   3. Redundant Connection           — LeetCode 684 (cycle detection)
   4. Accounts Merge                 — LeetCode 721 (grouping by shared element)
+  5. Streaming Accounts Merge       — hash-sharded, on-disk, generator output
+  6. RollbackUnionFind              — snapshot/rollback; offline dynamic connectivity
+  7. ConcurrentUnionFind            — shared-memory parent, striped CAS-style linking
 """
+import os
+import re
+import tempfile
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.sharedctypes import RawArray
+
 from termcolor import colored
 
+try:
+    import numpy as np
+except ImportError:  # optional — union_many / find_many fall back to Python loops
+    np = None
+
+_BULK_MIN = 4096  # below this many pairs the scalar loop beats NumPy's setup cost
+
 
 class UnionFind:
     """
@@ -25,8 +44,13 @@ class UnionFind:
 
     Reference: dsa.md § Disjoint Set (Union-Find) (Advanced)
 
+    Storage is two flat buffers — parent as array('i') (4 bytes per element)
+    and rank as a bytearray (ranks never exceed log2 n) — and find() is
+    iterative, so degenerate chains cannot hit the recursion limit. This is
+    the one Union-Find shared by union_find.py and mst.py.
+
     T: O(α(n)) amortised per find/union — effectively O(1)
-    S: O(n)
+    S: O(n) — 5 bytes per element
 
     Real-world analogy: tracking which users belong to the same social
     network cluster as friend connections are added one by one.
@@ -37,17 +61,23 @@ class UnionFind:
         count:  number of disjoint sets currently
     """
 
+    __slots__ = ("parent", "rank", "count")
+
     def __init__(self, n: int):
         """Initialise n singleton sets {0}, {1}, ..., {n-1}."""
-        self.parent = list(range(n))  # each node is its own root
-        self.rank = [0] * n           # all trees start at height 0
-        self.count = n                # n separate components
+        self.parent = array('i', range(n))  # each node is its own root
+        self.rank = bytearray(n)             # all trees start at height 0
+        self.count = n                       # n separate components
 
     def find(self, x: int) -> int:
         """Return the root representative of x's set. Path-compresses on the way."""
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])  # path compression
-        return self.parent[x]
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:  # second pass: point every node on the path at root
+            parent[x], x = root, parent[x]
+        return root
 
     def union(self, x: int, y: int) -> bool:
         """
@@ -61,11 +91,12 @@ class UnionFind:
         if rx == ry:
             return False  # already in the same set
         # Union by rank: attach smaller tree under larger
-        if self.rank[rx] < self.rank[ry]:
+        rank = self.rank
+        if rank[rx] < rank[ry]:
             rx, ry = ry, rx
         self.parent[ry] = rx
-        if self.rank[rx] == self.rank[ry]:
-            self.rank[rx] += 1
+        if rank[rx] == rank[ry]:
+            rank[rx] += 1
         self.count -= 1
         return True
 
@@ -73,6 +104,131 @@ class UnionFind:
         """Return True if x and y are in the same set."""
         return self.find(x) == self.find(y)
 
+    def union_many(self, edges) -> int:
+        """
+        Union every (x, y) pair in edges. Returns the number of merges.
+
+        With NumPy (and an ndarray, or a batch of at least _BULK_MIN pairs)
+        the whole batch is processed as array operations — no Python-level
+        work per edge, and only the elements the batch touches are read:
+          1. Find: pointer-jump the touched elements to their roots.
+          2. Hook: for every pair whose roots differ, point the larger root
+             at the smaller (np.minimum.at, so conflicting hooks resolve to
+             the smallest label and no cycle can form).
+          3. Jump: pointer-jump just the involved roots until each points
+             straight at its new root; repeat until no pair spans two roots.
+          4. Rank: raise each surviving root's rank above every root it
+             absorbed, so later union() calls still link by height.
+        Without NumPy the pairs go through one tight loop with the
+        find/union logic inlined against local buffers. Generators and
+        other unsized iterables are consumed in _BULK_MIN-pair chunks.
+
+        T: O(E α(n)) scalar, O(E log E) vectorized — independent of n
+        """
+        if np is not None and isinstance(edges, np.ndarray):
+            return self._union_many_numpy(np.asarray(edges, dtype=np.int64).reshape(-1, 2))
+        if not hasattr(edges, "__len__"):
+            it = iter(edges)
+            merged = 0
+            while True:
+                chunk = list(islice(it, _BULK_MIN))
+                if not chunk:
+                    return merged
+                merged += self.union_many(chunk)
+        if np is not None and len(edges) >= _BULK_MIN:
+            return self._union_many_numpy(np.asarray(edges, dtype=np.int64).reshape(-1, 2))
+
+        parent, rank = self.parent, self.rank
+        merged = 0
+        for x, y in edges:
+            rx = x
+            while parent[rx] != rx:
+                rx = parent[rx]
+            while parent[x] != rx:
+                parent[x], x = rx, parent[x]
+            ry = y
+            while parent[ry] != ry:
+                ry = parent[ry]
+            while parent[y] != ry:
+                parent[y], y = ry, parent[y]
+            if rx == ry:
+                continue
+            if rank[rx] < rank[ry]:
+                rx, ry = ry, rx
+            parent[ry] = rx
+            if rank[rx] == rank[ry]:
+                rank[rx] += 1
+            merged += 1
+        self.count -= merged
+        return merged
+
+    def _union_many_numpy(self, pairs) -> int:
+        if not len(pairs):
+            return 0
+        p = np.frombuffer(self.parent, dtype=np.int32)  # zero-copy view of parent
+        nodes, inverse = np.unique(pairs, return_inverse=True)
+        roots = _jump(p, nodes)
+        p[nodes] = roots                     # path-compress the touched elements
+        involved = np.unique(roots)          # every hook below stays inside this set
+        ends = roots[inverse.reshape(-1, 2)]
+        u, v = ends[:, 0], ends[:, 1]
+        while True:
+            pu, pv = p[u], p[v]
+            spans = pu != pv
+            if not spans.any():
+                break
+            np.minimum.at(p, np.maximum(pu, pv)[spans], np.minimum(pu, pv)[spans])
+            _flatten(p, involved)
+            u, v = u[spans], v[spans]  # pairs already joined stay joined
+        # Keep rank an upper bound on height: every absorbed root now hangs
+        # directly under its new root, one level deeper than before
+        absorbed = involved[p[involved] != involved]
+        rank = np.frombuffer(self.rank, dtype=np.uint8)
+        below = rank[absorbed]
+        np.maximum.at(rank, p[absorbed], below + (below < 255))  # saturate, don't wrap
+        self.count -= len(absorbed)
+        return len(absorbed)
+
+    def find_many(self, ids) -> list[int]:
+        """
+        Roots of many elements at once.
+
+        With NumPy this is pointer jumping on just the queried slots,
+        followed by writing the roots back (path compression for them).
+        """
+        if np is None:
+            return [self.find(x) for x in ids]
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(ids):
+            return []
+        p = np.frombuffer(self.parent, dtype=np.int32)
+        r = _jump(p, ids)
+        p[ids] = r
+        return r.tolist()
+
+
+def _jump(p, ids):
+    """Roots of ids in NumPy parent array p, chasing parents of just those slots."""
+    r = p[ids]
+    while True:
+        nxt = p[r]
+        if (nxt == r).all():
+            return r
+        r = nxt
+
+
+def _flatten(p, ids) -> None:
+    """
+    Pointer-double p over ids (a set closed under parent) until each points
+    at its root — O(log depth) rounds, touching only those slots.
+    """
+    while True:
+        up = p[ids]
+        grand = p[up]
+        if (grand == up).all():
+            return
+        p[ids] = grand
+
 
 # ---------------------------------------------------------------------------
 # 2. Number of Connected Components in an Undirected Graph
@@ -84,7 +240,9 @@ def count_components(n: int, edges: list[list[int]]) -> int:
     number of connected components.
 
     Approach: Start with n components. Each successful union reduces the
-    count by 1. Final count = number of components.
+    count by 1. Final count = number of components. Edges go through
+    UnionFind.union_many, so large edge lists (or an E×2 ndarray) are
+    processed in bulk rather than one Python call per edge.
 
     T: O(n + E * α(n))  — initialise n nodes, process E edges
     S: O(n)
@@ -106,8 +264,7 @@ def count_components(n: int, edges: list[list[int]]) -> int:
         1
     """
     uf = UnionFind(n)
-    for u, v in edges:
-        uf.union(u, v)
+    uf.union_many(edges)  # one bulk call: vectorized with NumPy, tight loop without
     return uf.count
 
 
@@ -221,6 +378,511 @@ def accounts_merge(accounts: list[list[str]]) -> list[list[str]]:
     ]
 
 
+# ---------------------------------------------------------------------------
+# 5. Streaming, Sharded Accounts Merge
+# ---------------------------------------------------------------------------
+def read_accounts(path: str, sep: str = ","):
+    """Yield accounts from a text file with one 'name<sep>email<sep>email...' per line."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line:
+                yield line.split(sep)
+
+
+# Shard and bucket records are "id<TAB>email<LF>"; emails are escaped so a
+# tab, newline or carriage return inside one cannot split or cut a record
+_RECORD_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_RECORD_UNESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+
+
+def _unescape_field(field: str) -> str:
+    """Inverse of field.translate(_RECORD_ESCAPES)."""
+    if "\\" not in field:
+        return field
+    return re.sub(r"\\(.)", lambda m: _RECORD_UNESCAPES[m.group(1)], field)
+
+
+def _shard_links(path: str) -> bytes:
+    """
+    Worker: account-to-account links implied by one email shard.
+
+    Every email lives in exactly one shard, so each shared email is seen by
+    exactly one worker. The first account seen with an email becomes its
+    anchor; every later account with that email is linked to the anchor.
+    Returns the links as a flat array('q') of (a, b) pairs, in bytes.
+    """
+    anchor: dict[str, int] = {}
+    links = array('q')
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            acc, email = line.rstrip("\n").split("\t", 1)
+            a = int(acc)
+            first = anchor.setdefault(email, a)
+            if first != a:
+                links.append(first)
+                links.append(a)
+    return links.tobytes()
+
+
+def accounts_merge_streaming(
+    accounts, shards: int = 16, workers: int | None = 1,
+    batch_size: int = 100_000, tmp_dir: str | None = None,
+):
+    """
+    LeetCode 721 for inputs that do not fit in memory.
+
+    Approach (all intermediate data lives in temp files):
+      1. Stream accounts, giving each an integer id. Each (account id, email)
+         pair is appended to shard file crc32(email) % shards as a
+         tab-separated line, with backslash, tab, newline and carriage
+         return in the email escaped; per-shard buffers are flushed every
+         batch_size accounts.
+      2. Shards are independent, so each is reduced in a worker process to
+         integer account-account links (_shard_links). Only the emails of
+         one shard are ever interned in one process.
+      3. The parent unions those links into an array-backed UnionFind over
+         account ids — 5 bytes per account, no strings. Each shard's links
+         go to union_many as one int64 ndarray (no per-link tuples), then
+         parent is flattened in place to serve as the root table.
+      4. A second pass rewrites every pair to bucket file root % shards, so
+         each merged account's emails land in one bucket. Buckets are loaded
+         one at a time, deduplicated, sorted and yielded.
+
+    T: O(N K α(N)) union work plus O(N K log K) sorting, N accounts, K emails each
+    S: O(accounts + largest shard + largest bucket) in memory; O(N K) on disk
+
+    Args:
+        accounts:   iterable of [name, email, ...] lists, or a path for read_accounts
+        shards:     number of hash shards (and output buckets)
+        workers:    processes for step 2; 1 runs in-process, None = cpu count
+        batch_size: accounts buffered before spilling to the shard files
+        tmp_dir:    directory for shard/bucket files (default: system temp)
+
+    Yields:
+        [name, sorted_email, ...] merged accounts, one bucket at a time
+
+    Example:
+        >>> sorted(accounts_merge_streaming([["John","a@x","b@x"],["John","b@x","c@x"],
+        ...                                   ["Mary","m@x"]]))
+        [['John', 'a@x', 'b@x', 'c@x'], ['Mary', 'm@x']]
+    """
+    if isinstance(accounts, str):
+        accounts = read_accounts(accounts)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        shard_paths = [os.path.join(tmp, f"shard{i:04d}.tsv") for i in range(shards)]
+        names: list[str] = []           # names[account id]
+        interned: dict[str, str] = {}   # one str object per distinct name
+
+        # 1. Spill (account id, email) pairs to hash shards
+        buffers: list[list[str]] = [[] for _ in range(shards)]
+
+        def flush() -> None:
+            for path, buf in zip(shard_paths, buffers):
+                if buf:
+                    with open(path, "a", encoding="utf-8") as f:
+                        f.writelines(buf)
+                    buf.clear()
+
+        for acc_id, account in enumerate(accounts):
+            names.append(interned.setdefault(account[0], account[0]))
+            for email in account[1:]:
+                record = f"{acc_id}\t{email.translate(_RECORD_ESCAPES)}\n"
+                buffers[zlib.crc32(email.encode()) % shards].append(record)
+            if (acc_id + 1) % batch_size == 0:
+                flush()
+        flush()
+        present = [p for p in shard_paths if os.path.exists(p)]
+
+        # 2. Shards → integer links, in parallel
+        if workers == 1:
+            parts = map(_shard_links, present)
+        else:
+            pool = ProcessPoolExecutor(workers)
+            parts = pool.map(_shard_links, present)
+
+        # 3. Union links over account ids
+        uf = UnionFind(len(names))
+        try:
+            for raw in parts:
+                if np is not None:
+                    uf.union_many(np.frombuffer(raw, dtype=np.int64).reshape(-1, 2))
+                else:
+                    links = array('q')
+                    links.frombytes(raw)
+                    uf.union_many(zip(links[0::2], links[1::2]))  # unsized: chunked
+        finally:
+            if workers != 1:
+                pool.shutdown()
+
+        # 4. Regroup emails by root account, one bucket file per shard index
+        # Flatten parent in place so parent[acc] is acc's root — no N-sized list
+        if np is not None:
+            _flatten(np.frombuffer(uf.parent, dtype=np.int32), slice(None))
+        else:
+            for acc in range(len(names)):
+                uf.find(acc)
+        roots = uf.parent
+        bucket_paths = [os.path.join(tmp, f"bucket{i:04d}.tsv") for i in range(shards)]
+        for path in present:
+            out: list[list[str]] = [[] for _ in range(shards)]
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    acc, email = line.rstrip("\n").split("\t", 1)
+                    root = roots[int(acc)]
+                    out[root % shards].append(f"{root}\t{email}\n")
+            for bpath, buf in zip(bucket_paths, out):
+                if buf:
+                    with open(bpath, "a", encoding="utf-8") as f:
+                        f.writelines(buf)
+            os.remove(path)  # shard no longer needed — keep disk use to one copy
+
+        for bpath in bucket_paths:
+            if not os.path.exists(bpath):
+                continue
+            groups: dict[int, set[str]] = {}
+            with open(bpath, encoding="utf-8") as f:
+                for line in f:
+                    root, email = line.rstrip("\n").split("\t", 1)
+                    groups.setdefault(int(root), set()).add(email)
+            os.remove(bpath)
+            for root, emails in groups.items():
+                yield [names[root]] + sorted(map(_unescape_field, emails))
+
+
+# ---------------------------------------------------------------------------
+# 6. Rollback Union-Find and Offline Dynamic Connectivity
+# ---------------------------------------------------------------------------
+class RollbackUnionFind:
+    """
+    Union-Find whose unions can be undone in LIFO order.
+
+    Path compression rewrites many parent pointers per find, which cannot
+    be undone cheaply — so this variant uses union by rank alone. Trees stay
+    O(log n) deep, and each union changes exactly one parent pointer (and
+    maybe one rank), which is pushed onto a history stack.
+
+    T: O(log n) find/union, O(1) per undone union
+    S: O(n + unions since the oldest live snapshot)
+
+    Real-world analogy: a whiteboard of who-can-reach-whom where every new
+    line is drawn in a numbered layer, so you can peel back to any layer.
+
+    Attributes:
+        parent:  parent[i] = parent of i (itself if root)
+        rank:    upper bound on tree height
+        count:   number of disjoint sets currently
+        history: stack of (child_root, bumped_rank) per successful union
+
+    Example:
+        >>> uf = RollbackUnionFind(3)
+        >>> snap = uf.snapshot(); uf.union(0, 1)
+        True
+        >>> uf.rollback(snap); uf.connected(0, 1)
+        False
+    """
+
+    __slots__ = ("parent", "rank", "count", "history")
+
+    def __init__(self, n: int):
+        self.parent = array('i', range(n))
+        self.rank = bytearray(n)
+        self.count = n
+        self.history: list[tuple[int, bool]] = []
+
+    def find(self, x: int) -> int:
+        """Return the root of x's set — no path compression. T: O(log n)"""
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge the sets of x and y; returns True if a merge happened."""
+        rx, ry = self.find(x), self.find(y)
+        if rx == ry:
+            return False
+        rank = self.rank
+        if rank[rx] < rank[ry]:
+            rx, ry = ry, rx
+        self.parent[ry] = rx
+        bumped = rank[rx] == rank[ry]
+        if bumped:
+            rank[rx] += 1
+        self.history.append((ry, bumped))
+        self.count -= 1
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        return self.find(x) == self.find(y)
+
+    def snapshot(self) -> int:
+        """Return a token for the current state, to pass to rollback()."""
+        return len(self.history)
+
+    def rollback(self, snap: int) -> None:
+        """Undo every union made since snapshot() returned snap."""
+        parent, rank, history = self.parent, self.rank, self.history
+        while len(history) > snap:
+            child, bumped = history.pop()
+            root = parent[child]
+            parent[child] = child
+            if bumped:
+                rank[root] -= 1
+            self.count += 1
+
+
+def dynamic_connectivity(n: int, events: list, queries: list) -> list[bool]:
+    """
+    Offline dynamic connectivity — connectivity queries over a log of edge
+    additions and removals, answered without rebuilding per timestamp.
+
+    Time t means "after the first t events". An edge added by event i and
+    removed by event j is present exactly during times [i+1, j].
+
+    Approach (segment tree over time):
+      1. Pair each add with its remove to get a lifetime interval per edge.
+      2. Compress the time axis to the distinct query times and store each
+         edge in the O(log Q) segment-tree nodes that exactly cover its
+         interval.
+      3. DFS the tree: on entry union the node's edges, at a leaf answer that
+         time's queries, on exit roll the unions back. Each edge is unioned
+         O(log Q) times, each union costs O(log n).
+
+    T: O((E log Q + Q) log n)   S: O(n + E log Q)
+
+    Args:
+        n:       number of nodes 0..n-1
+        events:  list of ("add" | "remove", u, v); edges are undirected and
+                 may be added more than once (each remove closes one add)
+        queries: list of (t, u, v), 0 <= t <= len(events)
+
+    Returns:
+        answers[i] = whether queries[i]'s u and v are connected at its time
+
+    Example:
+        >>> dynamic_connectivity(3, [("add", 0, 1), ("add", 1, 2), ("remove", 0, 1)],
+        ...                      [(2, 0, 2), (3, 0, 2), (3, 1, 2)])
+        [True, False, True]
+    """
+    from bisect import bisect_left, bisect_right
+
+    if not queries:
+        return []
+    times = sorted({t for t, _, _ in queries})
+    q = len(times)
+
+    # 1. Lifetimes, mapped straight into compressed query-time indices
+    intervals: list[tuple[int, int, int, int]] = []
+    open_edges: dict[tuple[int, int], list[int]] = {}
+
+    def close(edge: tuple[int, int], start: int, end: int) -> None:
+        lo, hi = bisect_left(times, start), bisect_right(times, end) - 1
+        if lo <= hi:
+            intervals.append((lo, hi, edge[0], edge[1]))
+
+    for i, (op, u, v) in enumerate(events):
+        edge = (u, v) if u < v else (v, u)
+        if op == "add":
+            open_edges.setdefault(edge, []).append(i + 1)
+        elif op == "remove":
+            starts = open_edges.get(edge)
+            if not starts:
+                raise ValueError(f"event {i}: remove of absent edge {edge}")
+            close(edge, starts.pop(), i)
+        else:
+            raise ValueError(f"event {i}: unknown op {op!r}")
+    for edge, starts in open_edges.items():
+        for start in starts:
+            close(edge, start, len(events))
+
+    # 2. Segment tree over compressed time: node k covers [lo, hi]
+    size = 1
+    while size < q:
+        size <<= 1
+    node_edges: list[list[tuple[int, int]]] = [[] for _ in range(2 * size)]
+    for lo, hi, u, v in intervals:
+        lo += size
+        hi += size + 1
+        while lo < hi:  # bottom-up cover of [lo, hi)
+            if lo & 1:
+                node_edges[lo].append((u, v))
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                node_edges[hi].append((u, v))
+            lo >>= 1
+            hi >>= 1
+
+    by_time: list[list[int]] = [[] for _ in range(q)]
+    for qi, (t, _, _) in enumerate(queries):
+        by_time[bisect_left(times, t)].append(qi)
+
+    # 3. Iterative DFS: (node, snapshot) — a negative node means "roll back"
+    uf = RollbackUnionFind(n)
+    answers = [False] * len(queries)
+    stack = [(1, 0)]
+    while stack:
+        k, snap = stack.pop()
+        if k < 0:
+            uf.rollback(snap)
+            continue
+        stack.append((-k, uf.snapshot()))
+        for u, v in node_edges[k]:
+            uf.union(u, v)
+        if k >= size:
+            if k - size < q:
+                for qi in by_time[k - size]:
+                    _, u, v = queries[qi]
+                    answers[qi] = uf.connected(u, v)
+        else:
+            stack.append((2 * k + 1, 0))
+            stack.append((2 * k, 0))
+    return answers
+
+
+# ---------------------------------------------------------------------------
+# 7. Concurrent Union-Find over Shared Memory
+# ---------------------------------------------------------------------------
+class ConcurrentUnionFind:
+    """
+    Union-Find that many threads or processes can update at once.
+
+    parent lives in a multiprocessing RawArray, so worker processes share it
+    without copying. Correctness rests on one rule — links always point from
+    the larger root id to the smaller one — which gives:
+      - No cycles: parent[i] <= i always holds, for links and for the path
+        halving writes in find() (which only ever store an ancestor).
+      - Lock-free find(): a non-root never becomes a root again, so racing
+        halving writes can only store different ancestors — all valid.
+      - Compare-and-swap linking: a root changes only when it is linked, so
+        union() takes the lock stripe of the larger root, checks it is still
+        a root and links it (the CAS); if another worker got there first, it
+        re-finds and retries. Only one stripe lock is ever held — no deadlock.
+      - Deterministic result: whatever the interleaving, every component ends
+        rooted at its smallest element.
+
+    T: O(log n) amortised find/union (path halving, no ranks)
+    S: O(n) shared ints + `stripes` locks
+
+    Real-world analogy: several clerks filing merge slips into one ledger;
+    a clerk locks only the drawer of the record being re-pointed.
+
+    Attributes:
+        parent: RawArray('i'); parent[i] = parent of i (itself if root)
+        locks:  lock stripes; root r is guarded by locks[r % len(locks)]
+
+    Example:
+        >>> cuf = ConcurrentUnionFind(4)
+        >>> cuf.union(3, 1), cuf.union(1, 2), cuf.find(3)
+        (True, True, 1)
+    """
+
+    __slots__ = ("parent", "locks")
+
+    def __init__(self, n: int, stripes: int = 64):
+        import multiprocessing
+
+        self.parent = RawArray('i', n)
+        for i in range(n):
+            self.parent[i] = i
+        self.locks = [multiprocessing.Lock() for _ in range(stripes)]
+
+    def find(self, x: int) -> int:
+        """Return the root of x (the smallest id in its set once quiescent)."""
+        parent = self.parent
+        p = parent[x]
+        while p != x:
+            g = parent[p]
+            if g != p:
+                parent[x] = g  # path halving — g is an ancestor of x whatever races occur
+            x, p = g, parent[g]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge the sets of x and y; returns True iff this call performed the link."""
+        parent, locks = self.parent, self.locks
+        while True:
+            rx, ry = self.find(x), self.find(y)
+            if rx == ry:
+                return False
+            if rx < ry:
+                rx, ry = ry, rx  # tie-break: the larger root is linked under the smaller
+            with locks[rx % len(locks)]:
+                if parent[rx] == rx:  # still a root — the compare in compare-and-swap
+                    parent[rx] = ry
+                    return True
+            x, y = rx, ry  # lost the race: rx was linked meanwhile, retry from there
+
+    def connected(self, x: int, y: int) -> bool:
+        return self.find(x) == self.find(y)
+
+    @property
+    def count(self) -> int:
+        """Number of disjoint sets. O(n) — a scan, since no shared counter is kept."""
+        parent = self.parent
+        return sum(1 for i in range(len(parent)) if parent[i] == i)
+
+    def union_many(self, edges, workers: int = 1, chunk: int = 50_000) -> int:
+        """
+        Union every (x, y) pair, splitting the batch across worker processes
+        that all link into this shared parent array. Returns the merge count.
+        """
+        if workers <= 1 or len(edges) <= chunk:
+            return sum(self.union(x, y) for x, y in edges)
+        edges = edges if isinstance(edges, list) else list(edges)
+        parts = [edges[i:i + chunk] for i in range(0, len(edges), chunk)]
+        with ProcessPoolExecutor(workers, initializer=_cuf_init, initargs=(self,)) as pool:
+            return sum(pool.map(_cuf_union_chunk, parts))
+
+
+_cuf_state: dict = {}  # per-worker: the shared ConcurrentUnionFind
+
+
+def _cuf_init(uf: ConcurrentUnionFind) -> None:
+    """Pool initializer: the RawArray and locks are inherited once per worker."""
+    _cuf_state["uf"] = uf
+
+
+def _cuf_union_chunk(edges: list) -> int:
+    union = _cuf_state["uf"].union
+    return sum(union(x, y) for x, y in edges)
+
+
+def benchmark_concurrent_union_find(
+    n: int = 1_000_000, m: int = 2_000_000,
+    worker_counts: tuple[int, ...] = (1, 2, 4, 8), seed: int = 0,
+) -> dict[str, float]:
+    """
+    Time sequential UnionFind.union_many against ConcurrentUnionFind at
+    several worker counts on one random edge list; prints edges/second and
+    returns {label: seconds}.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(m)]
+    timings: dict[str, float] = {}
+
+    start = time.perf_counter()
+    seq = UnionFind(n)
+    seq.union_many(edges)
+    timings["UnionFind"] = time.perf_counter() - start
+    for w in worker_counts:
+        start = time.perf_counter()
+        cuf = ConcurrentUnionFind(n)
+        cuf.union_many(edges, workers=w)
+        timings[f"concurrent x{w}"] = time.perf_counter() - start
+        assert cuf.count == seq.count
+
+    print(colored(f"Union-Find benchmark (V={n:,}, E={m:,}, cpus={os.cpu_count()})", "cyan"))
+    for label, secs in timings.items():
+        print(f"  {label:<16} {secs:8.3f}s  {m / secs:12,.0f} edges/s")
+    return timings
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -236,6 +898,55 @@ if __name__ == "__main__":
     assert uf.count == 2
     print(colored("✓ UnionFind core", "green"))
 
+    # Degenerate chain: iterative find handles depth far beyond the recursion limit
+    chain = UnionFind(100_000)
+    for i in range(1, 100_000):
+        chain.parent[i] = i - 1
+    assert chain.find(99_999) == 0 and chain.parent[99_999] == 0
+    print(colored("✓ UnionFind iterative find", "green"))
+
+    # Bulk operations agree with one-at-a-time unions (scalar and NumPy paths)
+    import random
+    random.seed(15)
+    for nv, ne in ((50, 30), (3000, 2500), (10_000, 20_000)):
+        pairs = [(random.randrange(nv), random.randrange(nv)) for _ in range(ne)]
+        one, bulk = UnionFind(nv), UnionFind(nv)
+        for a, b in pairs:
+            one.union(a, b)
+        merges = bulk.union_many(pairs)
+        assert bulk.count == one.count and merges == nv - one.count
+        assert bulk.find_many(range(nv)) == [bulk.find(x) for x in range(nv)]
+        groups: list[dict[int, set[int]]] = [{}, {}]
+        for g, uf_ in zip(groups, (one, bulk)):
+            for x, root in enumerate(uf_.find_many(range(nv))):
+                g.setdefault(root, set()).add(x)
+        assert sorted(map(sorted, groups[0].values())) == sorted(map(sorted, groups[1].values()))
+    if np is not None:
+        assert count_components(6, np.array([[0, 1], [1, 2], [4, 5]])) == 3
+    # Unsized iterables are consumed in chunks (generators have no len())
+    assert count_components(3, iter([[0, 1]])) == 2
+    assert count_components(9000, ((i, i + 1) for i in range(8000))) == 1000
+    # Small ndarray batches only touch their own elements; count stays exact
+    if np is not None:
+        huge = UnionFind(1_000_000)
+        for i in range(0, 1000, 2):
+            assert huge.union_many(np.array([[i, i + 1]])) == 1
+        assert huge.union_many(np.array([[0, 2], [2, 0]])) == 1
+        assert huge.count == 1_000_000 - 501 and huge.connected(3, 1)
+        assert huge.rank[0] == 2  # absorbed root 2 (rank 1), so 0 is now height 2
+        # Bulk links keep rank an upper bound on every tree's height
+        tall = UnionFind(4096)
+        tall.union_many(np.array([(i, i + 1) for i in range(0, 4096, 2)]))
+        for step in (2, 4, 8, 16):
+            tall.union_many(np.array([(i, i + step) for i in range(0, 4096, 2 * step)]))
+        for x in range(4096):
+            depth, y = 0, x
+            while tall.parent[y] != y:
+                depth, y = depth + 1, tall.parent[y]
+            assert depth <= tall.rank[y]
+        assert tall.rank[0] == 5
+    print(colored("✓ UnionFind union_many / find_many", "green"))
+
     # Count Components
     assert count_components(5, [[0, 1], [1, 2], [3, 4]]) == 2
     assert count_components(5, [[0, 1], [1, 2], [2, 3], [3, 4]]) == 1
@@ -264,4 +975,98 @@ if __name__ == "__main__":
     assert any(a == ["Mary", "mary@mail.com"] for a in merged)
     print(colored("✓ accounts_merge", "green"))
 
+    # Streaming merge gives the same groups, from an iterator or a file, with workers
+    assert sorted(accounts_merge_streaming(accs, shards=3)) == sorted(merged)
+    accs = [[f"user{i % 50}"] + [f"e{random.randrange(400)}@mail.com"
+                                 for _ in range(random.randint(1, 4))] for i in range(300)]
+    want = sorted(accounts_merge(accs))
+    with tempfile.TemporaryDirectory() as tmp:
+        acc_file = os.path.join(tmp, "accounts.csv")
+        with open(acc_file, "w", encoding="utf-8") as f:
+            f.writelines(",".join(a) + "\n" for a in accs)
+        got = sorted(accounts_merge_streaming(acc_file, shards=7, workers=2, batch_size=32))
+    # Names in random data may collide across groups; compare the email partitions
+    assert sorted(g[1:] for g in got) == sorted(g[1:] for g in want)
+    # Separators inside an email must not split or corrupt shard records
+    odd = [["Ann", "a\tb@x", "c\nd@x"], ["Ann", "c\nd@x", "e\\t@x", "f\r@x"],
+           ["Bob", "a\\tb@x", "g@x\n"], ["Cy", "g@x\n", "\\"]]
+    want = sorted(accounts_merge([list(a) for a in odd]))
+    assert sorted(accounts_merge_streaming(odd, shards=3)) == want
+    assert sorted(accounts_merge_streaming(odd, shards=2, workers=2)) == want
+    print(colored("✓ accounts_merge_streaming", "green"))
+
+    # RollbackUnionFind restores earlier states exactly
+    rb = RollbackUnionFind(6)
+    rb.union(0, 1)
+    s1 = rb.snapshot()
+    rb.union(1, 2); rb.union(3, 4); rb.union(2, 4)
+    assert rb.count == 2 and rb.connected(0, 3)
+    rb.rollback(s1)
+    assert rb.count == 5 and rb.connected(0, 1) and not rb.connected(1, 2)
+    assert list(rb.parent)[2:] == [2, 3, 4, 5]
+    print(colored("✓ RollbackUnionFind", "green"))
+
+    # Offline dynamic connectivity vs rebuilding UnionFind at every query time
+    for trial in range(30):
+        nv = random.randint(2, 12)
+        events, live = [], []
+        for _ in range(random.randint(0, 60)):
+            if live and random.random() < 0.4:
+                events.append(("remove",) + live.pop(random.randrange(len(live))))
+            else:
+                e = (random.randrange(nv), random.randrange(nv))
+                live.append(e)
+                events.append(("add",) + e)
+        qs = [(random.randint(0, len(events)), random.randrange(nv), random.randrange(nv))
+              for _ in range(40)]
+        got = dynamic_connectivity(nv, events, qs)
+        for (t, a, b), ans in zip(qs, got):
+            ref_uf, present = UnionFind(nv), []
+            for op, x, y in events[:t]:
+                if op == "add":
+                    present.append((min(x, y), max(x, y)))
+                else:
+                    present.remove((min(x, y), max(x, y)))
+            ref_uf.union_many(present)
+            assert ans == ref_uf.connected(a, b)
+    try:
+        dynamic_connectivity(3, [("remove", 0, 1)], [(1, 0, 1)])
+        assert False, "Should have raised"
+    except ValueError:
+        pass
+    print(colored("✓ dynamic_connectivity", "green"))
+
+    # ConcurrentUnionFind stress: threads and processes racing on one parent array
+    import threading
+    nv = 5000
+    stress = [[random.randrange(nv), random.randrange(nv)] for _ in range(8000)]
+    expected = count_components(nv, stress)
+    ref_uf = UnionFind(nv)
+    ref_uf.union_many(stress)
+    smallest: dict[int, int] = {}
+    for x in range(nv):
+        smallest.setdefault(ref_uf.find(x), x)  # first x seen per root = its minimum
+    for use_processes in (False, True):
+        cuf = ConcurrentUnionFind(nv, stripes=8)
+        if use_processes:
+            merges = cuf.union_many(stress, workers=3, chunk=1000)
+        else:
+            results = [0] * 4
+
+            def ingest(k: int) -> None:
+                for a, b in stress[k::4]:
+                    results[k] += cuf.union(a, b)
+                    cuf.find(random.randrange(nv))
+            threads = [threading.Thread(target=ingest, args=(k,)) for k in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            merges = sum(results)
+        assert cuf.count == expected and merges == nv - expected
+        assert all(cuf.find(x) == smallest[ref_uf.find(x)] for x in range(nv))
+    print(colored("✓ ConcurrentUnionFind (threads + processes)", "green"))
+
+    benchmark_concurrent_union_find(n=50_000, m=100_000, worker_counts=(1, 2))
+
     print(colored("\nAll tests passed.", "cyan"))